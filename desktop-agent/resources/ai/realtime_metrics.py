@@ -16,8 +16,9 @@ import time
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 import threading
+from collections import deque
 
 
 class RealtimeMetricsDisplay:
@@ -52,8 +53,12 @@ class RealtimeMetricsDisplay:
             'mode': 'hybrid'
         }
         
-        # Historical data for averages
-        self.hashrate_history: List[tuple] = []  # (timestamp, hashrate)
+        # Historical data for averages: sliding windows with running sums,
+        # so each update is O(1) amortized instead of rescanning history
+        self.hashrate_history: deque = deque()  # (timestamp, hashrate), last 5 min
+        self._recent_1min: deque = deque()  # (timestamp, hashrate), last 1 min
+        self._sum_5min = 0.0
+        self._sum_1min = 0.0
         self.max_history = 300  # 5 minutes at 1Hz
         
         self.display_thread = None
@@ -80,35 +85,39 @@ class RealtimeMetricsDisplay:
         # Update hashrate history
         if 'hashrate_current' in kwargs:
             now = time.time()
-            self.hashrate_history.append((now, kwargs['hashrate_current']))
+            sample = (now, kwargs['hashrate_current'])
+            self.hashrate_history.append(sample)
+            self._recent_1min.append(sample)
+            self._sum_5min += sample[1]
+            self._sum_1min += sample[1]
             
             # Trim old data
+            history = self.hashrate_history
             cutoff = now - 300  # 5 minutes
-            self.hashrate_history = [(t, h) for t, h in self.hashrate_history if t > cutoff]
+            while history[0][0] <= cutoff:
+                self._sum_5min -= history.popleft()[1]
+            recent = self._recent_1min
+            while now - recent[0][0] > 60:
+                self._sum_1min -= recent.popleft()[1]
             
             # Calculate averages
             self._calculate_averages()
     
     def _calculate_averages(self):
-        """Calculate hashrate averages"""
+        """Calculate hashrate averages from the running window sums"""
         if not self.hashrate_history:
             return
         
-        now = time.time()
-        
         # 1 minute average
-        recent_1min = [(t, h) for t, h in self.hashrate_history if now - t <= 60]
-        if recent_1min:
-            self.metrics['hashrate_1min'] = sum(h for _, h in recent_1min) / len(recent_1min)
+        if self._recent_1min:
+            self.metrics['hashrate_1min'] = self._sum_1min / len(self._recent_1min)
         
-        # 5 minute average
-        recent_5min = [(t, h) for t, h in self.hashrate_history if now - t <= 300]
-        if recent_5min:
-            self.metrics['hashrate_5min'] = sum(h for _, h in recent_5min) / len(recent_5min)
+        # 5 minute average (the whole retained history)
+        avg_5min = self._sum_5min / len(self.hashrate_history)
+        self.metrics['hashrate_5min'] = avg_5min
         
         # Overall average
-        if self.hashrate_history:
-            self.metrics['hashrate_avg'] = sum(h for _, h in self.hashrate_history) / len(self.hashrate_history)
+        self.metrics['hashrate_avg'] = avg_5min
     
     def _display_loop(self):
         """Display loop - updates terminal"""
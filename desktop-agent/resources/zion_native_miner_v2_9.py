@@ -20,6 +20,7 @@ import os
 import sys
 import time
 import socket
+import struct
 import json
 import threading
 import logging
@@ -27,11 +28,11 @@ import multiprocessing as mp
 import platform
 from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue, Empty
+from queue import Queue, Empty, Full
 
 # Windows-only hotkeys (XMRig-like). Optional.
 try:
@@ -87,6 +88,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ZionNativeMiner")
 
+# Precompiled packers for the pool-mining hot loops (avoid format-string lookup per hash).
+_H_I_LE = struct.Struct("<I")  # nonce in blob / Cosmic Harmony state0
+_H_Q_LE = struct.Struct("<Q")  # RandomX low 64 bits
+_H_Q_BE = struct.Struct(">Q")  # YesCrypt top 64 bits (big-endian compare)
+
+# 32-byte hash output buffer type.
+HashBuffer = ctypes.c_uint8 * 32
+HASH_BUFFER_ALIGN = 64  # one cache line: native SIMD stores never split
+
+
+def aligned_hash_buffer() -> "ctypes.Array[ctypes.c_uint8]":
+    """Return a HashBuffer whose address is HASH_BUFFER_ALIGN-aligned.
+
+    ctypes gives no alignment guarantee beyond the allocator's, so the buffer
+    is carved out of a slightly larger block (kept alive by the view).
+    """
+    raw = (ctypes.c_uint8 * (32 + HASH_BUFFER_ALIGN - 1))()
+    offset = -ctypes.addressof(raw) % HASH_BUFFER_ALIGN
+    return HashBuffer.from_buffer(raw, offset)
+
+# Nonces a CPU pool worker claims per trip to the shared NonceDispenser.
+CPU_NONCE_SEGMENT = 1024
+
 
 class Algorithm(Enum):
     """Supported mining algorithms"""
@@ -170,10 +194,81 @@ class MiningStats:
     stats_file: str = ""
 
 
+class JobState:
+    """Current pool job shared between the session loop and mining workers.
+
+    Workers poll ``version`` without taking the job lock, so it is a plain
+    slot attribute (single attribute load) rather than a dict entry.
+    """
+
+    __slots__ = (
+        "job_id",
+        "blob_hex",
+        "blob_bytes",
+        "difficulty",
+        "height",
+        "target_64",
+        "target_256",
+        "target_cosmic32",
+        "version",
+    )
+
+    def __init__(self):
+        self.job_id: Optional[str] = None
+        self.blob_hex: Optional[str] = None
+        self.blob_bytes: Optional[bytes] = None
+        self.difficulty: Optional[int] = None
+        self.height: Any = None
+        self.target_64: Optional[int] = None
+        self.target_256: Optional[int] = None
+        self.target_cosmic32: Optional[int] = None
+        self.version: int = 0
+
+    def copy(self) -> "JobState":
+        other = JobState.__new__(JobState)
+        for name in JobState.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+
+
+class NonceDispenser:
+    """Shared nonce cursor that mining workers claim segments from on demand.
+
+    Every CPU thread and the GPU worker call ``claim()`` when they finish a
+    segment, so faster devices simply come back more often and nobody idles
+    waiting on a fixed range. A claim is a couple of attribute operations
+    under an uncontended lock, taken once per segment.
+    """
+
+    __slots__ = ("_next", "_lock")
+
+    def __init__(self, start: int = 0):
+        self._next = start
+        self._lock = threading.Lock()
+
+    def claim(self, count: int) -> int:
+        """Reserve ``count`` consecutive nonces and return the first one."""
+        with self._lock:
+            start = self._next
+            self._next = start + count
+        return start
+
+    def reset(self, start: int = 0) -> None:
+        """Restart the nonce space (new job)."""
+        with self._lock:
+            self._next = start
+
+
 class StratumClient:
     """Stratum protocol client for pool communication"""
     
-    def __init__(self, pool_host: str, pool_port: int, worker_id: str = "worker"):
+    def __init__(
+        self,
+        pool_host: str,
+        pool_port: int,
+        worker_id: str = "worker",
+        on_job_notification: Optional[Callable[[Dict], None]] = None,
+    ):
         self.pool_host = pool_host
         self.pool_port = pool_port
         self.worker_id = worker_id
@@ -181,6 +276,16 @@ class StratumClient:
         self.request_id = 1
         self.job_queue = Queue()
         self.current_job = None
+
+        # When set, new jobs are pushed to this callback from the listener
+        # thread instead of being queued for get_job() polling.
+        self.on_job_notification = on_job_notification
+        # Receive order of mining.notify jobs, stamped on each job as "_seq"
+        # so consumers can drop a job older than one they already applied.
+        self._job_seq = 0
+        # Optional event set when a job arrives or the connection drops, so a
+        # supervising loop can wait on it instead of polling.
+        self.wake_event: Optional[threading.Event] = None
         self.connected = False
         self.extranonce1 = None
         self.extranonce2_size = 4
@@ -391,7 +496,13 @@ class StratumClient:
         except OSError as e:
             self.last_disconnect_reason = f"send failed: {e}"
             self.connected = False
+            self._wake()
             raise
+
+    def _wake(self):
+        ev = self.wake_event
+        if ev is not None:
+            ev.set()
     
     def _listen_loop(self):
         """Background listener for pool messages"""
@@ -437,6 +548,8 @@ class StratumClient:
                 logger.error(f"Listener error: {e}")
                 break
         
+        self.connected = False
+        self._wake()
         logger.debug("Listener loop terminated")
     
     def _handle_message(self, message: Dict):
@@ -496,8 +609,18 @@ class StratumClient:
                         pass
 
                 # Latest job always wins
+                self._job_seq += 1
+                job['_seq'] = self._job_seq
                 self.current_job = job
-                self.job_queue.put(job)
+                callback = self.on_job_notification
+                if callback is not None:
+                    try:
+                        callback(job)
+                    except Exception as e:
+                        logger.error(f"Job notification handler failed: {e}")
+                else:
+                    self.job_queue.put(job)
+                self._wake()
                 logger.debug(
                     f"📋 Received job: {job.get('job_id', 'unknown')} (height={job.get('height', '?')}, diff={job.get('difficulty', '?')})"
                 )
@@ -567,9 +690,10 @@ class StratumClient:
 class HotkeyController:
     """Non-blocking hotkeys reader (Windows only)."""
 
-    def __init__(self):
+    def __init__(self, wake_event: Optional[threading.Event] = None):
         self.enabled = HOTKEYS_AVAILABLE
         self._queue: "Queue[str]" = Queue()
+        self._wake_event = wake_event
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
@@ -596,6 +720,8 @@ class HotkeyController:
                     ch = msvcrt.getwch()
                     if ch:
                         self._queue.put(ch)
+                        if self._wake_event is not None:
+                            self._wake_event.set()
                 else:
                     time.sleep(0.05)
             except Exception:
@@ -859,27 +985,33 @@ class CPUMiningThread:
         if self.algorithm == Algorithm.COSMIC_HARMONY:
             input_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
             output_array = (ctypes.c_uint8 * 32)()
+            data_len = len(data)
+            cosmic_hash = self.lib.cosmic_hash
             
             for i in range(nonce_count):
-                self.lib.cosmic_hash(input_array, len(data), nonce_start + i, output_array)
+                cosmic_hash(input_array, data_len, nonce_start + i, output_array)
                 results.append(bytes(output_array))
                 self.hashes += 1
         
         elif self.algorithm == Algorithm.RANDOMX:
             input_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
             output_array = (ctypes.c_uint8 * 32)()
+            data_len = len(data)
+            rx_hash = self.lib.zion_randomx_hash_bytes
             
             for i in range(nonce_count):
-                self.lib.zion_randomx_hash_bytes(input_array, len(data), output_array)
+                rx_hash(input_array, data_len, output_array)
                 results.append(bytes(output_array))
                 self.hashes += 1
         
         elif self.algorithm == Algorithm.YESCRYPT:
             input_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
             output_array = (ctypes.c_uint8 * 32)()
+            data_len = len(data)
+            yc_hash = self.lib.yescrypt_hash_bytes
 
             for i in range(nonce_count):
-                rc = self.lib.yescrypt_hash_bytes(input_array, len(data), output_array)
+                rc = yc_hash(input_array, data_len, output_array)
                 if rc != 0:
                     # Keep behavior simple: skip failed hashes.
                     continue
@@ -896,25 +1028,31 @@ class CPUMiningThread:
         if self.algorithm == Algorithm.COSMIC_HARMONY:
             input_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
             output_array = (ctypes.c_uint8 * 32)()
+            data_len = len(data)
+            cosmic_hash = self.lib.cosmic_hash
             for i in range(nonce_count):
-                self.lib.cosmic_hash(input_array, len(data), nonce_start + i, output_array)
+                cosmic_hash(input_array, data_len, nonce_start + i, output_array)
                 self.hashes += 1
             return nonce_count
 
         if self.algorithm == Algorithm.RANDOMX:
             input_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
             output_array = (ctypes.c_uint8 * 32)()
+            data_len = len(data)
+            rx_hash = self.lib.zion_randomx_hash_bytes
             for _ in range(nonce_count):
-                self.lib.zion_randomx_hash_bytes(input_array, len(data), output_array)
+                rx_hash(input_array, data_len, output_array)
                 self.hashes += 1
             return nonce_count
 
         if self.algorithm == Algorithm.YESCRYPT:
             input_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
             output_array = (ctypes.c_uint8 * 32)()
+            data_len = len(data)
+            yc_hash = self.lib.yescrypt_hash_bytes
             done = 0
             for _ in range(nonce_count):
-                rc = self.lib.yescrypt_hash_bytes(input_array, len(data), output_array)
+                rc = yc_hash(input_array, data_len, output_array)
                 if rc != 0:
                     continue
                 self.hashes += 1
@@ -1116,9 +1254,13 @@ class ZionNativeMiner:
     
     Unified mining client with native library support
     """
+
+    # Order used by the 'a' hotkey to cycle algorithms.
+    ALGO_CYCLE = (Algorithm.COSMIC_HARMONY, Algorithm.RANDOMX, Algorithm.YESCRYPT)
     
     def __init__(self, config: MinerConfig):
         self.config = config
+        self._algo_cursor = self._algo_cycle_pos(config.algorithm)
         self.running = False
         self.total_hashes = 0
         self.shares_found = 0
@@ -1136,6 +1278,12 @@ class ZionNativeMiner:
         # Performance stats
         self.hashrate_samples = deque(maxlen=600)  # (t, hashes) ~ last minute at 0.1s-1s sampling
         self.last_hashrate_update = 0
+
+        # Stats file is serialized/written on a background thread so a slow disk
+        # never stalls the session loop. Only the latest payload is kept.
+        self._stats_q: "Queue[Optional[Dict[str, Any]]]" = Queue(maxsize=1)
+        self._stats_thread: Optional[threading.Thread] = None
+        self._last_stats_blob: Optional[bytes] = None
         
         # Initialize algorithm
         self._initialize_algorithm()
@@ -1253,10 +1401,18 @@ class ZionNativeMiner:
                 test_hash = bytes(test_output).hex()
                 logger.info(f"✅ YesCrypt test hash: {test_hash[:32]}...")
 
+    @classmethod
+    def _algo_cycle_pos(cls, algorithm: Algorithm) -> int:
+        try:
+            return cls.ALGO_CYCLE.index(algorithm)
+        except ValueError:
+            return 0
+
     def switch_algorithm(self, new_algorithm: Algorithm):
         """Switch algorithm at runtime (reinitializes native libs + thread pools)."""
         if new_algorithm == self.config.algorithm:
             return
+        self._algo_cursor = self._algo_cycle_pos(new_algorithm)
 
         old_algo = self.config.algorithm
         logger.info(f"🔁 Switching algorithm: {old_algo.value} -> {new_algorithm.value}")
@@ -1448,17 +1604,62 @@ class ZionNativeMiner:
         return one_line[: max_len - 3] + "..."
 
     def _write_stats_file(self, payload: Dict[str, Any]):
-        path = (self.config.stats_file or "").strip()
-        if not path:
+        """Queue a stats payload for the background writer (latest wins)."""
+        if not (self.config.stats_file or "").strip():
             return
+        if self._stats_thread is None or not self._stats_thread.is_alive():
+            self._stats_thread = threading.Thread(target=self._stats_writer_loop, daemon=True)
+            self._stats_thread.start()
+        # Replace any payload the writer has not picked up yet.
         try:
-            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-            tmp_path = path + ".tmp"
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-            os.replace(tmp_path, path)
-        except Exception as e:
-            logger.debug(f"Failed to write stats file '{path}': {e}")
+            self._stats_q.get_nowait()
+        except Empty:
+            pass
+        try:
+            self._stats_q.put_nowait(payload)
+        except Full:
+            pass
+
+    def _stats_writer_loop(self):
+        while True:
+            payload = self._stats_q.get()
+            if payload is None:
+                return
+            path = (self.config.stats_file or "").strip()
+            if not path:
+                continue
+            try:
+                blob = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                if blob == self._last_stats_blob:
+                    continue
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                tmp_path = path + ".tmp"
+                # Raw fd + os.write: one syscall for a few hundred bytes, no
+                # buffered file object per snapshot.
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                try:
+                    view = memoryview(blob)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                # Atomic swap: the dashboard never sees a partially written file.
+                os.replace(tmp_path, path)
+                self._last_stats_blob = blob
+            except Exception as e:
+                logger.debug(f"Failed to write stats file '{path}': {e}")
+
+    def _stop_stats_writer(self, timeout: float = 2.0):
+        """Let the stats writer finish the pending payload, then stop it."""
+        t = self._stats_thread
+        if t is None or not t.is_alive():
+            return
+        try:
+            self._stats_q.put(None, timeout=timeout)
+        except Full:
+            return
+        t.join(timeout=timeout)
+        self._stats_thread = None
 
     def mine_to_pool(self, duration: Optional[float] = None):
         """Mine to pool server"""
@@ -1472,7 +1673,6 @@ class ZionNativeMiner:
         print("   Stop : Ctrl+C")
         print()
 
-        algo_cycle = [Algorithm.COSMIC_HARMONY, Algorithm.RANDOMX, Algorithm.YESCRYPT]
         global_start = time.perf_counter()
         end_at = (global_start + duration) if duration else None
 
@@ -1625,7 +1825,12 @@ class ZionNativeMiner:
                 return
             print("✅ Connected to pool successfully\n")
 
-            hotkeys = HotkeyController()
+            # Set by job notifications, pool disconnects and hotkeys; the
+            # session loop below waits on it instead of sleeping.
+            session_wake = threading.Event()
+            stratum.wake_event = session_wake
+
+            hotkeys = HotkeyController(wake_event=session_wake)
             hotkeys.start()
 
             pause_event = threading.Event()  # set => paused
@@ -1673,33 +1878,17 @@ class ZionNativeMiner:
                         print(f"⚠️  GPU init failed: {err}")
 
             job_lock = threading.Lock()
-            nonce_lock = threading.Lock()
             stats_lock = threading.Lock()
-            job_state: Dict[str, Any] = {
-                "job_id": None,
-                "blob_hex": None,
-                "blob_bytes": None,
-                "difficulty": None,
-                "height": None,
-                "target_64": None,
-                "target_256": None,
-                "target_cosmic32": None,
-                "version": 0,
-            }
-            nonce_cursor = 0
+            job_state = JobState()
+            nonces = NonceDispenser()
+            claim_nonces = nonces.claim
 
             cpu_hashes = 0
             gpu_hashes = 0
-
-            def _alloc_nonces(count: int) -> int:
-                nonlocal nonce_cursor
-                with nonce_lock:
-                    start = nonce_cursor
-                    nonce_cursor += count
-                    return start
+            applied_job_seq = 0
 
             def _update_job_from_stratum(job: Dict[str, Any]):
-                nonlocal nonce_cursor
+                nonlocal applied_job_seq
                 job_id = job.get("job_id")
                 blob_hex = job.get("blob")
                 pool_difficulty = int(job.get("difficulty") or 1)
@@ -1739,18 +1928,24 @@ class ZionNativeMiner:
                         target_cosmic32 = None
 
                 with job_lock:
-                    if job_state.get("job_id") != job_id:
-                        job_state["job_id"] = job_id
-                        job_state["blob_hex"] = blob_hex
-                        job_state["blob_bytes"] = blob_bytes
-                        job_state["difficulty"] = difficulty
-                        job_state["height"] = height
-                        job_state["target_64"] = target_64
-                        job_state["target_256"] = target_256
-                        job_state["target_cosmic32"] = target_cosmic32
-                        job_state["version"] = int(job_state.get("version") or 0) + 1
-                        with nonce_lock:
-                            nonce_cursor = 0
+                    # The listener thread and the session start can both hand
+                    # in jobs; never let an older one replace a newer one.
+                    job_seq = job.get("_seq", 0)
+                    if job_seq < applied_job_seq:
+                        return
+                    applied_job_seq = job_seq
+                    if job_state.job_id != job_id:
+                        job_state.job_id = job_id
+                        job_state.blob_hex = blob_hex
+                        job_state.blob_bytes = blob_bytes
+                        job_state.difficulty = difficulty
+                        job_state.height = height
+                        job_state.target_64 = target_64
+                        job_state.target_256 = target_256
+                        job_state.target_cosmic32 = target_cosmic32
+                        # Bumped last: workers read version without the lock.
+                        job_state.version += 1
+                        nonces.reset()
                         
                         # � Výpis jobu a targetu
                         algo_name = self.config.algorithm.value
@@ -1762,27 +1957,29 @@ class ZionNativeMiner:
                             expected_hashes = difficulty
                             logger.info(f"📋 [{algo_name}] Job {job_id[:12]}... h={height} diff={difficulty} (pool={pool_difficulty}) → ~{expected_hashes:,} hashů/share")
 
-            def _snapshot_job() -> Optional[Dict[str, Any]]:
+            def _snapshot_job() -> Optional[JobState]:
                 with job_lock:
-                    if not job_state.get("job_id") or not job_state.get("blob_bytes"):
+                    if not job_state.job_id or not job_state.blob_bytes:
                         return None
-                    return dict(job_state)
+                    return job_state.copy()
 
-            def _cpu_worker(worker_index: int):
+            def _flush_cpu_hashes(count: int) -> None:
                 nonlocal cpu_hashes
-                if not cpu_ready:
-                    return
+                with stats_lock:
+                    cpu_hashes += count
+
+            # CPU workers share one loop (job snapshots, nonce claims, share
+            # submission, stats flushing). Only the per-job hasher is
+            # specialized per algorithm at session start: the algorithm never
+            # changes within a session, so each variant hardcodes its hash
+            # call and target check instead of branching per hash.
+            def _cpu_worker_loop(new_job_hasher: Callable[[JobState], Callable[[int], Any]]) -> None:
+                """Mine until stopped; ``new_job_hasher(snap)`` returns a per-job
+                ``check(nonce)`` that hashes one nonce and returns the hash buffer
+                if it meets the share target, else None."""
+                submit_share = stratum.submit_share
                 last_flush_t = time.perf_counter()
-
-                import struct
-
-                rx_lib = self.loader.libs.get('randomx') if self.config.algorithm == Algorithm.RANDOMX else None
-                yc_lib = self.loader.libs.get('yescrypt') if self.config.algorithm == Algorithm.YESCRYPT else None
-
-                # Reusable per-thread buffers to avoid per-hash allocations.
-                work_buf: Optional[bytearray] = None
-                input_array = None
-                output_array = (ctypes.c_uint8 * 32)()
+                check = None
                 last_job_version = None
 
                 while not stop_event.is_set():
@@ -1794,26 +1991,14 @@ class ZionNativeMiner:
                         time.sleep(0.05)
                         continue
 
-                    job_id = snap["job_id"]
-                    blob_bytes = snap["blob_bytes"]
-                    target_64 = snap["target_64"]
-                    target_256 = snap["target_256"]
-                    target_cosmic32 = snap.get("target_cosmic32")
-                    version = snap["version"]
-
-                    # Prepare per-job reusable input buffer.
-                    # For non-Cosmic algos, nonce is at byte offset 38..41.
-                    if last_job_version != version or work_buf is None:
-                        if self.config.algorithm == Algorithm.COSMIC_HARMONY:
-                            work_buf = None
-                            input_array = None
-                        else:
-                            work_buf = bytearray(blob_bytes)
-                            input_array = (ctypes.c_uint8 * len(work_buf)).from_buffer(work_buf)
+                    job_id = snap.job_id
+                    version = snap.version
+                    if last_job_version != version or check is None:
+                        check = new_job_hasher(snap)
                         last_job_version = version
 
-                    batch = 1000
-                    start = _alloc_nonces(batch)
+                    batch = CPU_NONCE_SEGMENT
+                    start = claim_nonces(batch)
                     processed_since_last_flush = 0
                     for i in range(batch):
                         if stop_event.is_set() or pause_event.is_set():
@@ -1821,76 +2006,124 @@ class ZionNativeMiner:
                         # Avoid lock contention in the hot path. A slightly stale job version
                         # check is acceptable; we re-check periodically.
                         if (i & 31) == 0:
-                            if job_state.get("version") != version:
+                            if job_state.version != version:
                                 break
 
                         nonce = start + i
-                        if self.config.algorithm == Algorithm.COSMIC_HARMONY:
-                            result_hash = self.hash_single_cpu(blob_bytes, nonce)
-                        else:
-                            assert work_buf is not None and input_array is not None
-                            struct.pack_into("<I", work_buf, 38, nonce)
-                            if rx_lib is not None:
-                                # NOTE: zion_randomx_hash_bytes_vm is currently much slower on macOS;
-                                # use the thread-local VM selection path.
-                                rx_lib.zion_randomx_hash_bytes(input_array, len(work_buf), output_array)
-                                # Avoid copying hash bytes unless we need to submit.
-                                result_hash = None
-                            elif yc_lib is not None:
-                                rc = yc_lib.yescrypt_hash_bytes(input_array, len(work_buf), output_array)
-                                if rc != 0:
-                                    continue
-                                result_hash = None
-                            else:
-                                # Fallback path: must materialize bytes.
-                                result_hash = self.hash_single_cpu(bytes(work_buf), 0)
-
-                        meets = False
-                        if target_64 is not None:
-                            # RandomX target check uses low 64 bits (little-endian)
-                            # Pool-side validation uses FIRST 8 bytes (little-endian)
-                            # (see src/pool/mining/share_validator.py).
-                            hash_low64 = int.from_bytes(bytes(output_array[:8]), 'little')
-                            meets = hash_low64 <= target_64
-                            # 🔍 DEBUG: Každých 10000 hashů vypíšem info
-                            if (i % 10000) == 0:
-                                logger.debug(f"[RandomX] Worker {worker_index}: hash_low64={hash_low64:016x} target={target_64:016x} meets={meets}")
-                        elif target_256 is not None:
-                            if self.config.algorithm == Algorithm.COSMIC_HARMONY and target_cosmic32 is not None:
-                                # Cosmic Harmony (pool-compat): state0 (first 4 bytes, LE) <= top32(target_256)
-                                if result_hash is None:
-                                    hb = bytes(output_array)
-                                else:
-                                    hb = result_hash
-                                state0 = int.from_bytes(hb[:4], 'little', signed=False)
-                                meets = state0 <= int(target_cosmic32)
-                            else:
-                                # YesCrypt + others: big-endian integer comparison
-                                if result_hash is None:
-                                    result_int = int.from_bytes(output_array, 'big')
-                                else:
-                                    result_int = int.from_bytes(result_hash, 'big')
-                                meets = result_int < target_256
-
-                        if meets:
-                            if result_hash is None:
-                                result_hash = bytes(output_array)
-                            stratum.submit_share(job_id, nonce, result_hash)
+                        hit = check(nonce)
+                        if hit is not None:
+                            # Hash bytes are only copied for a share.
+                            submit_share(job_id, nonce, bytes(hit))
 
                         processed_since_last_flush += 1
 
-                        now_t = time.perf_counter()
-                        if processed_since_last_flush >= 64 or (processed_since_last_flush > 0 and (now_t - last_flush_t) >= 1.0):
-                            with stats_lock:
-                                cpu_hashes += processed_since_last_flush
-                            processed_since_last_flush = 0
-                            last_flush_t = now_t
+                        # Only read the clock every 8 hashes: keeps the miss path
+                        # free of per-hash float allocations.
+                        if (processed_since_last_flush & 7) == 0:
+                            now_t = time.perf_counter()
+                            if processed_since_last_flush >= 64 or (now_t - last_flush_t) >= 1.0:
+                                _flush_cpu_hashes(processed_since_last_flush)
+                                processed_since_last_flush = 0
+                                last_flush_t = now_t
 
                     if processed_since_last_flush:
-                        with stats_lock:
-                            cpu_hashes += processed_since_last_flush
+                        _flush_cpu_hashes(processed_since_last_flush)
                         last_flush_t = time.perf_counter()
 
+            def _cpu_worker_randomx(worker_index: int):
+                # Bound once: argtypes/restype are set by NativeLibraryLoader, so
+                # the hot loop skips the CDLL attribute lookup per hash.
+                rx_hash = self.loader.libs['randomx'].zion_randomx_hash_bytes
+                pack_nonce = _H_I_LE.pack_into
+                unpack_low64 = _H_Q_LE.unpack_from
+                output_array = aligned_hash_buffer()
+
+                def new_job(snap: JobState):
+                    # Per-job reusable input buffer (nonce at byte offset 38..41).
+                    work_buf = bytearray(snap.blob_bytes)
+                    input_array = (ctypes.c_uint8 * len(work_buf)).from_buffer(work_buf)
+                    work_len = len(work_buf)
+                    target_64 = snap.target_64
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"[RandomX] Worker {worker_index}: job {snap.job_id} target={target_64:016x}")
+
+                    def check(nonce: int):
+                        pack_nonce(work_buf, 38, nonce)
+                        # NOTE: zion_randomx_hash_bytes_vm is currently much slower on macOS;
+                        # use the thread-local VM selection path.
+                        rx_hash(input_array, work_len, output_array)
+                        # Pool-side validation uses FIRST 8 bytes (little-endian)
+                        # (see src/pool/mining/share_validator.py).
+                        if unpack_low64(output_array)[0] <= target_64:
+                            return output_array
+                        return None
+
+                    return check
+
+                _cpu_worker_loop(new_job)
+
+            def _cpu_worker_yescrypt(worker_index: int):
+                yc_hash = self.loader.libs['yescrypt'].yescrypt_hash_bytes
+                pack_nonce = _H_I_LE.pack_into
+                unpack_top64 = _H_Q_BE.unpack_from
+                output_array = aligned_hash_buffer()
+
+                def new_job(snap: JobState):
+                    work_buf = bytearray(snap.blob_bytes)
+                    input_array = (ctypes.c_uint8 * len(work_buf)).from_buffer(work_buf)
+                    work_len = len(work_buf)
+                    target_256 = snap.target_256
+                    target_top64 = target_256 >> 192
+
+                    def check(nonce: int):
+                        pack_nonce(work_buf, 38, nonce)
+                        if yc_hash(input_array, work_len, output_array) != 0:
+                            return None
+                        # YesCrypt: big-endian 256-bit integer comparison. The top
+                        # 64 bits reject almost every hash without building a big int.
+                        if (unpack_top64(output_array)[0] <= target_top64
+                                and int.from_bytes(output_array, 'big') < target_256):
+                            return output_array
+                        return None
+
+                    return check
+
+                _cpu_worker_loop(new_job)
+
+            def _cpu_worker_cosmic(worker_index: int):
+                # Native C++ hasher when the DLL is loaded, Python wrapper otherwise.
+                cosmic_lib = self.loader.libs.get('cosmic_harmony')
+                cosmic_hash = cosmic_lib.cosmic_hash if cosmic_lib is not None else None
+                cosmic_py = getattr(self, 'cosmic_hasher', None)
+                if cosmic_hash is None and cosmic_py is None:
+                    return
+                unpack_state0 = _H_I_LE.unpack_from
+                output_array = aligned_hash_buffer()
+
+                def new_job(snap: JobState):
+                    blob_bytes = snap.blob_bytes
+                    blob_len = len(blob_bytes)
+                    input_array = (ctypes.c_uint8 * blob_len).from_buffer_copy(blob_bytes)
+                    target_cosmic32 = int(snap.target_cosmic32)
+
+                    # Pool-compat: state0 (first 4 bytes, LE) <= top32(target_256)
+                    if cosmic_hash is not None:
+                        def check(nonce: int):
+                            cosmic_hash(input_array, blob_len, nonce, output_array)
+                            if unpack_state0(output_array)[0] <= target_cosmic32:
+                                return output_array
+                            return None
+                    else:
+                        def check(nonce: int):
+                            hb = cosmic_py.hash(blob_bytes, nonce)
+                            if unpack_state0(hb)[0] <= target_cosmic32:
+                                return hb
+                            return None
+
+                    return check
+
+                _cpu_worker_loop(new_job)
+
             def _gpu_worker():
                 nonlocal gpu_hashes
                 while not stop_event.is_set():
@@ -1905,56 +2138,70 @@ class ZionNativeMiner:
                         time.sleep(0.05)
                         continue
 
-                    job_id = snap["job_id"]
-                    blob_bytes = snap["blob_bytes"]
-                    target_64 = snap["target_64"]
-                    target_256 = snap["target_256"]
-                    target_cosmic32 = snap.get("target_cosmic32")
-                    version = snap["version"]
+                    job_id = snap.job_id
+                    blob_bytes = snap.blob_bytes
+                    target_64 = snap.target_64
+                    target_256 = snap.target_256
+                    target_cosmic32 = snap.target_cosmic32
+                    version = snap.version
 
                     batch_size = min(int(self.config.gpu_batch_size), 50_000)
-                    nonce_start = _alloc_nonces(batch_size)
+                    nonce_start = claim_nonces(batch_size)
                     hashes_out = self.gpu_miner.hash_batch(blob_bytes, nonce_start, batch_size)
 
-                    processed = 0
-                    for i in range(batch_size):
-                        if stop_event.is_set() or pause_event.is_set() or (not gpu_enabled.is_set()):
-                            break
-                        with job_lock:
-                            if job_state.get("version") != version:
-                                break
-                        nonce = nonce_start + i
-                        result_hash = hashes_out[i * 32 : (i + 1) * 32].tobytes()
-
-                        meets = False
-                        if target_64 is not None:
-                            # Match pool validation: FIRST 8 bytes, little-endian
-                            hash_low64 = int.from_bytes(result_hash[:8], 'little')
-                            meets = hash_low64 <= target_64
-                        elif target_256 is not None:
-                            if self.config.algorithm == Algorithm.COSMIC_HARMONY and target_cosmic32 is not None:
-                                state0 = int.from_bytes(result_hash[:4], 'little', signed=False)
-                                meets = state0 <= int(target_cosmic32)
-                            else:
-                                result_int = int.from_bytes(result_hash, 'big')
-                                meets = result_int < target_256
+                    # One zero-copy view per batch; bytes are only materialized
+                    # for hashes that meet the target.
+                    mv = memoryview(hashes_out).cast('B')
+                    if target_cosmic32 is not None:
+                        # Cosmic Harmony (pool-compat): state0 (first 4 bytes, LE) <= top32(target_256)
+                        state0 = hashes_out[: batch_size * 32].view('<u4')[::8]
+                        hits = np.flatnonzero(state0 <= np.uint32(target_cosmic32))
+                    elif target_64 is not None:
+                        # Match pool validation: FIRST 8 bytes, little-endian
+                        low64 = hashes_out[: batch_size * 32].view('<u8')[::4]
+                        hits = np.flatnonzero(low64 <= np.uint64(target_64))
+                    elif target_256 is not None:
+                        # Big-endian top 64 bits reject almost every hash in one
+                        # vector compare; only candidates get the 256-bit check.
+                        top64 = hashes_out[: batch_size * 32].view('>u8')[::4]
+                        hits = [
+                            i for i in np.flatnonzero(top64 <= np.uint64(target_256 >> 192))
+                            if int.from_bytes(mv[i * 32 : (i + 1) * 32], 'big') < target_256
+                        ]
+                    else:
+                        hits = []
 
-                        if meets:
-                            stratum.submit_share(job_id, nonce, result_hash)
+                    if stop_event.is_set() or pause_event.is_set() or (not gpu_enabled.is_set()):
+                        continue
+                    if job_state.version != version:
+                        # Job changed while the kernel ran; results are stale.
+                        continue
 
-                        processed += 1
+                    for i in hits:
+                        i = int(i)
+                        stratum.submit_share(job_id, nonce_start + i, bytes(mv[i * 32 : (i + 1) * 32]))
 
                     with stats_lock:
-                        gpu_hashes += processed
+                        gpu_hashes += batch_size
 
+            # From here on the listener thread publishes new jobs directly.
+            # Install the callback before draining so no notify is missed; a
+            # notify racing the drain is ordered by its "_seq" stamp.
+            stratum.on_job_notification = _update_job_from_stratum
             first_job = stratum.get_job() or stratum.current_job
             if first_job:
                 _update_job_from_stratum(first_job)
 
+            cpu_worker_fn = {
+                Algorithm.RANDOMX: _cpu_worker_randomx,
+                Algorithm.YESCRYPT: _cpu_worker_yescrypt,
+                Algorithm.COSMIC_HARMONY: _cpu_worker_cosmic,
+            }[self.config.algorithm]
+
             cpu_threads: List[threading.Thread] = []
             cpu_workers = max(1, int(self.config.cpu_threads or 1)) if cpu_ready else 0
             for wi in range(cpu_workers):
-                t = threading.Thread(target=_cpu_worker, args=(wi,), daemon=True)
+                t = threading.Thread(target=cpu_worker_fn, args=(wi,), daemon=True)
                 cpu_threads.append(t)
                 t.start()
             gpu_t = threading.Thread(target=_gpu_worker, daemon=True)
@@ -1966,9 +2213,9 @@ class ZionNativeMiner:
             def _print_summary():
                 elapsed = time.perf_counter() - global_start
                 with job_lock:
-                    jid = job_state.get('job_id')
-                    h = job_state.get('height')
-                    diff = job_state.get('difficulty')
+                    jid = job_state.job_id
+                    h = job_state.height
+                    diff = job_state.difficulty
                 with stats_lock:
                     ch = cpu_hashes
                     gh = gpu_hashes
@@ -2057,10 +2304,6 @@ class ZionNativeMiner:
                             stop_event.set()
                             break
 
-                    new_job = stratum.get_job()
-                    if new_job:
-                        _update_job_from_stratum(new_job)
-
                     if self.config.stats_interval and (now - last_stats_t) >= float(self.config.stats_interval or 10.0):
                         elapsed = now - global_start
                         with stats_lock:
@@ -2077,9 +2320,9 @@ class ZionNativeMiner:
                         last_stats_t = now
 
                         with job_lock:
-                            jid = job_state.get('job_id')
-                            h = job_state.get('height')
-                            diff = job_state.get('difficulty')
+                            jid = job_state.job_id
+                            h = job_state.height
+                            diff = job_state.difficulty
 
                         uptime = self._format_uptime(elapsed)
                         err_short = self._format_last_error(stratum.last_share_error)
@@ -2160,7 +2403,19 @@ class ZionNativeMiner:
                             "last_share_error": stratum.last_share_error,
                         })
 
-                    time.sleep(0.05)
+                    # Jobs arrive via on_job_notification; this loop only serves
+                    # hotkeys, stats and connection checks. A pending hotkey is
+                    # handled right away, otherwise sleep until the next stats
+                    # tick, the duration limit or a wake event.
+                    if not hk:
+                        timeout = 1.0
+                        if self.config.stats_interval:
+                            timeout = min(timeout, last_stats_t + float(self.config.stats_interval) - now)
+                        if end_at:
+                            timeout = min(timeout, end_at - now)
+                        if timeout > 0:
+                            session_wake.wait(timeout)
+                        session_wake.clear()
 
                     if not stratum.connected:
                         reason = stratum.last_disconnect_reason or "disconnected"
@@ -2177,15 +2432,16 @@ class ZionNativeMiner:
                     hotkeys.stop()
                 except Exception:
                     pass
-                for t in cpu_threads:
+                # Workers check stop_event every few hashes, so they normally
+                # exit at once. Still wait for them (one shared deadline, not
+                # per thread): an algo switch frees the native hash state
+                # they use.
+                join_deadline = time.perf_counter() + 2.0
+                for t in (*cpu_threads, gpu_t):
                     try:
-                        t.join(timeout=2.0)
+                        t.join(timeout=max(0.0, join_deadline - time.perf_counter()))
                     except Exception:
                         pass
-                try:
-                    gpu_t.join(timeout=2.0)
-                except Exception:
-                    pass
 
                 with stats_lock:
                     ch = cpu_hashes
@@ -2206,11 +2462,7 @@ class ZionNativeMiner:
                 continue
 
             if session_action == "algo":
-                try:
-                    idx = algo_cycle.index(self.config.algorithm)
-                except ValueError:
-                    idx = 0
-                next_algo = algo_cycle[(idx + 1) % len(algo_cycle)]
+                next_algo = self.ALGO_CYCLE[(self._algo_cursor + 1) % len(self.ALGO_CYCLE)]
                 print(f"⚙️  Switching algorithm -> {next_algo.value} (reinit + reconnect)")
                 self.switch_algorithm(next_algo)
                 # If the next algo doesn't support GPU, force desired state OFF.
@@ -2235,6 +2487,8 @@ class ZionNativeMiner:
     def cleanup(self):
         """Cleanup resources"""
         algo = self.config.algorithm
+
+        self._stop_stats_writer()
         
         # Shutdown thread pool
         if self.thread_pool:
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 
-from .zion_miner_v2_9 import main
+from .zion_miner_v2_9 import main, use_uvloop
 
 
 if __name__ == "__main__":
@@ -10,4 +10,5 @@ if __name__ == "__main__":
         format="%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    use_uvloop()
     asyncio.run(main())
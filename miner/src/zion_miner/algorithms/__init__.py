@@ -6,7 +6,7 @@ Lazy-loading wrapper pro native mining libraries s fallback na Python.
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -128,13 +128,73 @@ class AlgorithmEngine:
             nonce: Nonce value
             
         Returns:
-            Hash hex string
+            Hash hex string (use hash_bytes() to skip the hex encoding)
+        """
+        return self.hash_bytes(algorithm, data, nonce).hex()
+    
+    def hash_bytes(self, algorithm: str, data: bytes, nonce: int) -> bytes:
+        """
+        Compute hash using specified algorithm
+        
+        Args:
+            algorithm: Algorithm name
+            data: Input data
+            nonce: Nonce value
+            
+        Returns:
+            Raw 32-byte hash (compare to targets as big-endian; hex-encode
+            only for share submission)
+        """
+        if not self._initialized:
+            self.initialize([algorithm])
+        
+        algo_module = _lazy_load_algorithms()
+        return algo_module.get_hash_bytes(algorithm, data, nonce)
+    
+    def resolve(self, algorithm: str) -> Callable[[bytes, int], bytes]:
+        """
+        Get the raw hash function for an algorithm
+        
+        Args:
+            algorithm: Algorithm name
+            
+        Returns:
+            Callable (data, nonce) -> 32-byte hash (bytes, not hex)
+        """
+        if not self._initialized:
+            self.initialize([algorithm])
+        
+        algo_module = _lazy_load_algorithms()
+        return algo_module.resolve(algorithm)
+    
+    def scan_nonces(
+        self,
+        algorithm: str,
+        blob: bytes,
+        nonce_start: int,
+        count: int,
+        target: int,
+        nonce_step: int = 1
+    ) -> Tuple[int, Optional[int], Optional[bytes]]:
+        """
+        Hash a batch of nonces and stop at the first share
+        
+        Args:
+            algorithm: Algorithm name
+            blob: Hashing blob (nonce is written at byte 39)
+            nonce_start: First nonce
+            count: Number of nonces to try
+            target: Share target (hash <= target as big-endian int)
+            nonce_step: Distance between consecutive nonces
+            
+        Returns:
+            (hashes_done, nonce, hash); nonce and hash are None if no share
         """
         if not self._initialized:
             self.initialize([algorithm])
         
         algo_module = _lazy_load_algorithms()
-        return algo_module.get_hash(algorithm, data, nonce)
+        return algo_module.scan_nonces(algorithm, blob, nonce_start, count, target, nonce_step)
     
     def is_available(self, algorithm: str) -> bool:
         """Check if algorithm is available"""
@@ -1,97 +1,222 @@
-import pyopencl as cl
 import numpy as np
 import os
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# pyopencl is imported by the first AutolykosOpenCL(); importing this module
+# alone does not load the OpenCL ICD.
+cl = None
+
+# Device buffers are allocated once for this many nonces; larger batches are
+# dispatched in MAX_BATCH-sized chunks.
+MAX_BATCH = 1 << 16
+MAX_INPUT = 192  # kMaxInputBytes in autolykos_v2.cl
+
+_MAP_WRITE_DISCARD = None
+
+
+def _import_pyopencl():
+    global cl, _MAP_WRITE_DISCARD
+    if cl is None:
+        import pyopencl
+
+        # CL 1.2 lets the driver skip reading back a region the host will overwrite.
+        _MAP_WRITE_DISCARD = getattr(
+            pyopencl.map_flags, "WRITE_INVALIDATE_REGION", pyopencl.map_flags.WRITE
+        )
+        cl = pyopencl
+    return cl
+
+
+def _has_unified_memory(device) -> bool:
+    try:
+        return bool(device.host_unified_memory)
+    except Exception:
+        return False
+
+
 class AutolykosOpenCL:
-    def __init__(self, platform_idx=0, device_idx=0):
+    def __init__(self, platform_idx=0, device_idx=0, max_batch=MAX_BATCH):
         self.ctx = None
         self.queue = None
         self.program = None
         self.initialized = False
-        
+        # One instance is shared by all mining threads; hold this around a
+        # dispatch and the copy-out of its results (see hash_batch_array).
+        self.lock = threading.Lock()
+
         try:
+            _import_pyopencl()
             platforms = cl.get_platforms()
             if not platforms:
                 raise RuntimeError("No OpenCL platforms found")
-            
+
             platform = platforms[platform_idx]
             devices = platform.get_devices()
             if not devices:
                 raise RuntimeError("No OpenCL devices found")
-            
+
             device = devices[device_idx]
             logger.info(f"Using OpenCL device: {device.name}")
-            
+
             self.ctx = cl.Context([device])
             self.queue = cl.CommandQueue(self.ctx)
-            
+
             # Load kernel source
             kernel_path = os.path.join(os.path.dirname(__file__), "autolykos_v2.cl")
             with open(kernel_path, "r") as f:
                 kernel_src = f.read()
-            
+
             self.program = cl.Program(self.ctx, kernel_src).build()
+            self.kernel = self.program.autolykos_kernel
+
+            # Persistent device buffers, reused by every hash_batch call.
+            mf = cl.mem_flags
+            self.max_batch = int(max_batch)
+            self.d_input = cl.Buffer(self.ctx, mf.READ_ONLY, size=MAX_INPUT)
+
+            # iGPUs/APUs (and CPU devices) share physical memory with the host:
+            # nonces and results then live in host-visible buffers that are
+            # mapped around each dispatch instead of being copied.
+            self.zero_copy = _has_unified_memory(device)
+            if self.zero_copy:
+                self.d_nonces = cl.Buffer(
+                    self.ctx, mf.READ_ONLY | mf.ALLOC_HOST_PTR, size=self.max_batch * 4
+                )
+                self.d_output = cl.Buffer(
+                    self.ctx, mf.WRITE_ONLY | mf.ALLOC_HOST_PTR, size=self.max_batch * 32
+                )
+                self.h_output = None
+                self._output_map = None
+            else:
+                self.d_nonces = cl.Buffer(self.ctx, mf.READ_ONLY, size=self.max_batch * 4)
+                self.d_output = cl.Buffer(self.ctx, mf.WRITE_ONLY, size=self.max_batch * 32)
+
+                # Pinned host staging buffer for results, mapped once for the
+                # lifetime of this object.
+                self._pinned_output = cl.Buffer(
+                    self.ctx, mf.READ_WRITE | mf.ALLOC_HOST_PTR, size=self.max_batch * 32
+                )
+                self.h_output, _ = cl.enqueue_map_buffer(
+                    self.queue,
+                    self._pinned_output,
+                    cl.map_flags.READ | cl.map_flags.WRITE,
+                    0,
+                    (self.max_batch * 32,),
+                    np.uint8,
+                )
+            logger.info(f"OpenCL zero-copy buffers: {'on' if self.zero_copy else 'off'}")
+
+            # Input blob currently resident in d_input (uploaded only on change).
+            self._input_data = None
             self.initialized = True
-            
+
         except Exception as e:
             logger.error(f"Failed to initialize OpenCL: {e}")
             raise
 
-    def hash_batch(self, input_data: bytes, nonces: list[int]) -> list[bytes]:
-        if not self.initialized:
-            raise RuntimeError("OpenCL not initialized")
-            
-        count = len(nonces)
-        if count == 0:
-            return []
-            
-        input_len = len(input_data)
-        
-        # Prepare buffers
-        mf = cl.mem_flags
-        
-        # Input buffer (single shared input)
-        input_np = np.frombuffer(input_data, dtype=np.uint8)
-        d_input = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=input_np)
-        
-        # Nonces buffer
-        nonces_np = np.array(nonces, dtype=np.uint32)
-        d_nonces = cl.Buffer(self.ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=nonces_np)
-        
-        # Output buffer (32 bytes per nonce)
-        output_size = 32 * count
-        d_output = cl.Buffer(self.ctx, mf.WRITE_ONLY, size=output_size)
-        
+    def _upload_input(self, input_data: bytes):
+        if input_data == self._input_data:
+            return
+        if len(input_data) > MAX_INPUT:
+            raise ValueError(f"Input too long for Autolykos kernel: {len(input_data)} > {MAX_INPUT} bytes")
+        # Non-blocking: the queue is in-order and self._input_data keeps the
+        # source bytes alive until the copy completes.
+        cl.enqueue_copy(
+            self.queue, self.d_input, np.frombuffer(input_data, dtype=np.uint8), is_blocking=False
+        )
+        self._input_data = input_data
+
+    def _release_output_map(self):
+        if self._output_map is not None:
+            self._output_map.base.release(self.queue)
+            self._output_map = None
+
+    def _run_chunk(self, input_len: int, nonces_np) -> np.ndarray:
+        count = len(nonces_np)
+        if self.zero_copy:
+            # The kernel must not run while its buffers are mapped.
+            self._release_output_map()
+            mapped, _ = cl.enqueue_map_buffer(
+                self.queue, self.d_nonces, _MAP_WRITE_DISCARD, 0, (count,), np.uint32
+            )
+            mapped[:] = nonces_np
+            mapped.base.release(self.queue)
+        else:
+            cl.enqueue_copy(self.queue, self.d_nonces, nonces_np, is_blocking=False)
+
         # Execute kernel
-        global_size = (count,)
-        local_size = None  # Let driver decide
-        
-        self.program.autolykos_kernel(
-            self.queue, 
-            global_size, 
-            local_size,
-            d_input,
+        self.kernel(
+            self.queue,
+            (count,),
+            None,  # Let driver decide
+            self.d_input,
             np.uint32(input_len),
-            d_nonces,
-            d_output,
+            self.d_nonces,
+            self.d_output,
             np.uint32(count)
         )
-        
-        # Read result
-        output_np = np.empty(output_size, dtype=np.uint8)
-        cl.enqueue_copy(self.queue, output_np, d_output)
-        
-        # Parse results
-        results = []
-        for i in range(count):
-            start = i * 32
-            end = start + 32
-            results.append(bytes(output_np[start:end]))
-            
-        return results
-
-    def hash_single(self, input_data: bytes, nonce: int) -> bytes:
-        return self.hash_batch(input_data, [nonce])[0]
+
+        if self.zero_copy:
+            # Stays mapped until hash_batch_bytes() has copied it out or the
+            # next dispatch, whichever comes first.
+            self._output_map, _ = cl.enqueue_map_buffer(
+                self.queue, self.d_output, cl.map_flags.READ, 0, (count * 32,), np.uint8
+            )
+            return self._output_map
+
+        # Read result straight into the pinned host buffer (blocking, so
+        # the nonce upload has completed too).
+        output_np = self.h_output[: count * 32]
+        cl.enqueue_copy(self.queue, output_np, self.d_output, is_blocking=True)
+        return output_np
+
+    def hash_batch_array(self, input_data: bytes, nonces) -> np.ndarray:
+        """Hash nonces against input_data; returns a (count, 32) uint8 array.
+
+        Batches of up to max_batch nonces return a view of the pinned (or,
+        on zero-copy devices, mapped) output buffer, which the next call
+        overwrites or unmaps -- copy it if it must outlive that. Callers
+        sharing the instance across threads must hold self.lock from the
+        call until the copy is made (hash_batch_bytes() does both).
+
+        Difficulty words can be read without per-nonce objects, e.g.
+        ``out.view('<u8')[:, 0]``.
+        """
+        if not self.initialized:
+            raise RuntimeError("OpenCL not initialized")
+
+        nonces_np = np.ascontiguousarray(nonces, dtype=np.uint32)
+        total = len(nonces_np)
+        if total == 0:
+            return np.empty((0, 32), dtype=np.uint8)
+
+        input_len = len(input_data)
+        self._upload_input(input_data)
+
+        if total <= self.max_batch:
+            return self._run_chunk(input_len, nonces_np).reshape(total, 32)
+
+        out = np.empty((total, 32), dtype=np.uint8)
+        for offset in range(0, total, self.max_batch):
+            chunk = nonces_np[offset : offset + self.max_batch]
+            out[offset : offset + len(chunk)] = self._run_chunk(input_len, chunk).reshape(-1, 32)
+        return out
+
+    def hash_batch_bytes(self, input_data: bytes, nonces) -> bytes:
+        """Thread-safe hash_batch_array(): the concatenated 32-byte digests.
+
+        The results are copied out and any zero-copy output mapping is
+        released before the lock is dropped.
+        """
+        with self.lock:
+            raw = self.hash_batch_array(input_data, nonces).tobytes()
+            if self.zero_copy:
+                self._release_output_map()
+        return raw
+
+    def hash_batch(self, input_data: bytes, nonces) -> list[bytes]:
+        raw = self.hash_batch_bytes(input_data, nonces)
+        return [raw[i : i + 32] for i in range(0, len(raw), 32)]
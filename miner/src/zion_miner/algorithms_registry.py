@@ -10,8 +10,8 @@ Design goals:
 
 Supported identifiers:
 - `cosmic_harmony` (optional native wrapper)
-- `randomx` (sha3-chain fallback)
-- `yescrypt` (pbkdf2 fallback or optional bindings)
+- `randomx` (native librandomx via ctypes, light or full-memory mode; sha3-chain fallback)
+- `yescrypt` (optional bindings, native libyescrypt via ctypes, or pbkdf2 fallback)
 - `autolykos_v2` (optional OpenCL helper or blake2b fallback)
 
 NOTE: This registry does not implement consensus or validation logic.
@@ -19,9 +19,18 @@ NOTE: This registry does not implement consensus or validation logic.
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
+import functools
 import hashlib
+import logging
+import os
+import struct
+import threading
 from importlib import import_module
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
 
 # --- Cosmic Harmony (optional native wrapper) -------------------------------
 _get_cosmic_hasher = None
@@ -32,32 +41,189 @@ except Exception:
     _get_cosmic_hasher = None
 
 
+# Bound ``hasher.hash`` of the wrapper's hasher, fetched on first use.
+_cosmic_hash_fn = None
+
+
 def _hash_cosmic_harmony(data: bytes, nonce: int) -> bytes:
-    if _get_cosmic_hasher is None:
-        raise RuntimeError(
-            "Cosmic Harmony wrapper not available. Install/build the native wrapper and expose cosmic_harmony_wrapper.get_hasher()."
-        )
-    hasher = _get_cosmic_hasher(use_cpp=True)
-    if nonce == 0:
-        return hasher.hash(data, 0)
-    return hasher.hash(data, int(nonce))
+    global _cosmic_hash_fn
+    if _cosmic_hash_fn is None:
+        if _get_cosmic_hasher is None:
+            raise RuntimeError(
+                "Cosmic Harmony wrapper not available. Install/build the native wrapper and expose cosmic_harmony_wrapper.get_hasher()."
+            )
+        _cosmic_hash_fn = _get_cosmic_hasher(use_cpp=True).hash
+    return _cosmic_hash_fn(data, int(nonce))
 
 
 COSMIC_HARMONY_AVAILABLE = _get_cosmic_hasher is not None
 
-# --- RandomX (fallback) -----------------------------------------------------
+# --- RandomX (native librandomx or fallback) --------------------------------
 _RANDOMX_BLOB_THRESHOLD = 64
 
+# Seed key used for the RandomX cache (same default as the desktop native miner).
+_RANDOMX_KEY = bytes(32)
+
+# randomx_flags (randomx.h)
+RANDOMX_FLAG_LARGE_PAGES = 1
+RANDOMX_FLAG_HARD_AES = 2
+RANDOMX_FLAG_FULL_MEM = 4
+RANDOMX_FLAG_JIT = 8
+
+# Fast mode (ZION_RANDOMX_FULL_MEM=1): hash against the full ~2 GiB dataset,
+# built once and shared read-only by every thread's VM. Default is light mode.
+_RX_FULL_MEM = os.environ.get("ZION_RANDOMX_FULL_MEM", "") not in ("", "0")
+
+
+def _load_librandomx() -> Optional[ctypes.CDLL]:
+    """Load tevador's librandomx (override path with ZION_RANDOMX_LIB)."""
+    path = os.environ.get("ZION_RANDOMX_LIB") or ctypes.util.find_library("randomx")
+    if not path:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+
+    vp = ctypes.c_void_p
+    try:
+        lib.randomx_get_flags.argtypes = []
+        lib.randomx_get_flags.restype = ctypes.c_int
+        lib.randomx_alloc_cache.argtypes = [ctypes.c_int]
+        lib.randomx_alloc_cache.restype = vp
+        lib.randomx_init_cache.argtypes = [vp, ctypes.c_char_p, ctypes.c_size_t]
+        lib.randomx_init_cache.restype = None
+        lib.randomx_create_vm.argtypes = [ctypes.c_int, vp, vp]
+        lib.randomx_create_vm.restype = vp
+        lib.randomx_calculate_hash.argtypes = [vp, ctypes.c_char_p, ctypes.c_size_t, vp]
+        lib.randomx_calculate_hash.restype = None
+        lib.randomx_calculate_hash_first.argtypes = [vp, ctypes.c_char_p, ctypes.c_size_t]
+        lib.randomx_calculate_hash_first.restype = None
+        lib.randomx_calculate_hash_next.argtypes = [vp, ctypes.c_char_p, ctypes.c_size_t, vp]
+        lib.randomx_calculate_hash_next.restype = None
+        lib.randomx_calculate_hash_last.argtypes = [vp, vp]
+        lib.randomx_calculate_hash_last.restype = None
+        lib.randomx_alloc_dataset.argtypes = [ctypes.c_int]
+        lib.randomx_alloc_dataset.restype = vp
+        lib.randomx_dataset_item_count.argtypes = []
+        lib.randomx_dataset_item_count.restype = ctypes.c_ulong
+        lib.randomx_init_dataset.argtypes = [vp, vp, ctypes.c_ulong, ctypes.c_ulong]
+        lib.randomx_init_dataset.restype = None
+    except AttributeError:
+        return None
+    return lib
+
+
+_RX_LIB = _load_librandomx()
+_rx_cache = None
+_rx_dataset = None
+_rx_flags = 0
+_rx_failed = False  # native setup failed once: use the Python path from then on
+_rx_cache_lock = threading.Lock()
+_rx_tls = threading.local()
+
+RANDOMX_NATIVE_AVAILABLE = _RX_LIB is not None
+
+
+def _init_randomx_dataset(cache: int, flags: int) -> Optional[int]:
+    """Allocate and build the full-memory dataset (None if it can't be allocated).
+
+    Large pages are tried first. The build is split across one thread per CPU;
+    ctypes releases the GIL inside randomx_init_dataset.
+    """
+    dataset = _RX_LIB.randomx_alloc_dataset(flags | RANDOMX_FLAG_LARGE_PAGES)
+    if not dataset:
+        dataset = _RX_LIB.randomx_alloc_dataset(flags & ~RANDOMX_FLAG_LARGE_PAGES)
+    if not dataset:
+        return None
+
+    items = _RX_LIB.randomx_dataset_item_count()
+    per_thread = -(-items // (os.cpu_count() or 1))
+    builders = [
+        threading.Thread(
+            target=_RX_LIB.randomx_init_dataset,
+            args=(dataset, cache, start, min(per_thread, items - start)),
+        )
+        for start in range(0, items, per_thread)
+    ]
+    for t in builders:
+        t.start()
+    for t in builders:
+        t.join()
+    return dataset
+
+
+def _randomx_thread_vm() -> Optional[Tuple[int, ctypes.Array]]:
+    """Return this thread's RandomX VM and output buffer (created on first use).
+
+    All VMs share one cache, initialized once with the seed key, and in fast
+    mode one dataset; only the VM (scratchpad) is per thread. Returns None if
+    librandomx can't run here (e.g. JIT forbidden); callers then use the
+    Python path.
+    """
+    vm = getattr(_rx_tls, "vm", None)
+    if vm is not None:
+        return vm, _rx_tls.out
+
+    global _rx_cache, _rx_dataset, _rx_flags, _rx_failed
+    with _rx_cache_lock:
+        if _rx_failed:
+            return None
+        if _rx_cache is None:
+            # randomx_get_flags() only reports JIT/hard-AES where supported.
+            flags = _RX_LIB.randomx_get_flags()
+            cache = None
+            # Large pages need OS support (hugepages), JIT may be forbidden
+            # (W^X): drop them in that order until the cache allocates.
+            for extra, drop in (
+                (RANDOMX_FLAG_LARGE_PAGES, 0),
+                (0, 0),
+                (0, RANDOMX_FLAG_JIT),
+            ):
+                cache = _RX_LIB.randomx_alloc_cache((flags | extra) & ~drop)
+                if cache:
+                    flags = (flags | extra) & ~drop
+                    break
+            if not cache:
+                _rx_failed = True
+                logger.warning("randomx_alloc_cache failed; using Python RandomX fallback")
+                return None
+            _RX_LIB.randomx_init_cache(cache, _RANDOMX_KEY, len(_RANDOMX_KEY))
+            if _RX_FULL_MEM:
+                # Falls back to light mode if the dataset can't be allocated
+                _rx_dataset = _init_randomx_dataset(cache, flags)
+                if _rx_dataset:
+                    flags |= RANDOMX_FLAG_FULL_MEM
+            _rx_cache = cache
+            _rx_flags = flags
+
+        for drop in (0, RANDOMX_FLAG_LARGE_PAGES, RANDOMX_FLAG_LARGE_PAGES | RANDOMX_FLAG_JIT):
+            if drop and not _rx_flags & drop:
+                continue
+            vm = _RX_LIB.randomx_create_vm(_rx_flags & ~drop, _rx_cache, _rx_dataset)
+            if vm:
+                break
+        if not vm:
+            _rx_failed = True
+            logger.warning("randomx_create_vm failed; using Python RandomX fallback")
+            return None
+    _rx_tls.vm = vm
+    _rx_tls.out = ctypes.create_string_buffer(32)
+    return vm, _rx_tls.out
+
+
+# Precompiled nonce packer: cheaper than int.to_bytes(8, "little") per hash.
+_pack_nonce_le = struct.Struct("<Q").pack
+
 
 def _prepare_randomx_input(data: bytes | None, nonce: int) -> bytes:
     data = data or b""
     if len(data) >= _RANDOMX_BLOB_THRESHOLD:
         return data
-    nonce_bytes = int(nonce).to_bytes(8, "little", signed=False)
-    return data + nonce_bytes
+    return data + _pack_nonce_le(nonce)
 
 
-def _hash_randomx(data: bytes, nonce: int) -> bytes:
+def _hash_randomx_py(data: bytes, nonce: int) -> bytes:
     # If nonce=0, assume blob already has embedded nonce
     if nonce == 0:
         state = hashlib.sha3_256(data).digest()
@@ -72,7 +238,181 @@ def _hash_randomx(data: bytes, nonce: int) -> bytes:
     return state
 
 
-# --- Yescrypt (optional bindings or fallback) --------------------------------
+if _RX_LIB is not None:
+
+    def _hash_randomx(data: bytes, nonce: int) -> bytes:
+        vm_out = _randomx_thread_vm()
+        if vm_out is None:
+            return _hash_randomx_py(data, nonce)
+        vm, out = vm_out
+        # If nonce=0, assume blob already has embedded nonce
+        input_bytes = data if nonce == 0 else _prepare_randomx_input(data, nonce)
+        _RX_LIB.randomx_calculate_hash(vm, input_bytes, len(input_bytes), out)
+        return out.raw
+
+else:
+
+    _hash_randomx = _hash_randomx_py
+
+
+def randomx_hash_batch(blobs: Sequence[bytes]) -> List[bytes]:
+    """Hash blobs (nonce already embedded) in order.
+
+    With native librandomx this uses the pipelined
+    ``randomx_calculate_hash_first``/``_next``/``_last`` API so program
+    generation for blob N+1 overlaps execution of blob N.
+    """
+    if not blobs:
+        return []
+    vm_out = _randomx_thread_vm() if _RX_LIB is not None else None
+    if vm_out is None:
+        return [_hash_randomx_py(blob, 0) for blob in blobs]
+
+    vm, out = vm_out
+    results: List[bytes] = []
+    first = blobs[0]
+    _RX_LIB.randomx_calculate_hash_first(vm, first, len(first))
+    for blob in blobs[1:]:
+        _RX_LIB.randomx_calculate_hash_next(vm, blob, len(blob), out)
+        results.append(out.raw)
+    _RX_LIB.randomx_calculate_hash_last(vm, out)
+    results.append(out.raw)
+    return results
+
+
+# --- Yescrypt (optional bindings, native lib or fallback) -------------------
+_YESCRYPT_N = 2048
+_YESCRYPT_R = 8
+_YESCRYPT_P = 1
+# yescrypt_flags_t for read-write mode. 0.x: YESCRYPT_RW. 1.x: YESCRYPT_DEFAULTS,
+# the only RW flavor its yescrypt_kdf() accepts.
+_YESCRYPT_RW_0X = 0x01
+_YESCRYPT_RW_1X = 0xB6
+
+
+class _YescryptRegion(ctypes.Structure):
+    """yescrypt_region_t (yescrypt_local_t / yescrypt_shared_t)."""
+
+    _fields_ = [
+        ("base", ctypes.c_void_p),
+        ("aligned", ctypes.c_void_p),
+        ("base_size", ctypes.c_size_t),
+        ("aligned_size", ctypes.c_size_t),
+    ]
+
+
+class _YescryptParams(ctypes.Structure):
+    """yescrypt_params_t (yescrypt >= 1.0)."""
+
+    _fields_ = [
+        ("flags", ctypes.c_uint32),
+        ("N", ctypes.c_uint64),
+        ("r", ctypes.c_uint32),
+        ("p", ctypes.c_uint32),
+        ("t", ctypes.c_uint32),
+        ("g", ctypes.c_uint32),
+        ("NROM", ctypes.c_uint64),
+    ]
+
+
+# RFC 7914 scrypt test vector 1 (P="", S="", N=16, r=1, p=1). With flags == 0
+# yescrypt_kdf() computes classic scrypt in every library version.
+_YESCRYPT_KAT = bytes.fromhex(
+    "77d6576238657b203b19ca42c18a0497f16b4844e3074ae8dfdffa3fede21442"
+    "fcd0069ded0948f8326a753a0fc81f17e8d3e0fb2e0d3628cf35e20c38d18906"
+)
+
+
+def _bind_yescrypt_kdf(lib: ctypes.CDLL) -> Tuple[Callable[..., int], int]:
+    """Return kdf(local, passwd, salt, N, r, p, flags, out) and the RW flags.
+
+    yescrypt 1.x passes N/r/p/t/g/flags in a yescrypt_params_t; the pre-1.0
+    releases take them as scalar arguments.
+    """
+    u8p = ctypes.c_char_p
+    kdf = lib.yescrypt_kdf
+    head = [
+        ctypes.c_void_p,  # shared (NULL: no ROM)
+        ctypes.POINTER(_YescryptRegion),  # local
+        u8p, ctypes.c_size_t,  # passwd
+        u8p, ctypes.c_size_t,  # salt
+    ]
+    kdf.restype = ctypes.c_int
+
+    if hasattr(lib, "yescrypt_encode_params_r"):  # only exported by 1.x
+        kdf.argtypes = head + [
+            ctypes.POINTER(_YescryptParams),
+            ctypes.c_void_p, ctypes.c_size_t,  # buf
+        ]
+
+        def call(local, passwd, salt, N, r, p, flags, out):
+            params = _YescryptParams(flags=flags, N=N, r=r, p=p)
+            return kdf(
+                None, ctypes.byref(local), passwd, len(passwd), salt, len(salt),
+                ctypes.byref(params), out, len(out),
+            )
+
+        return call, _YESCRYPT_RW_1X
+
+    kdf.argtypes = head + [
+        ctypes.c_uint64,  # N
+        ctypes.c_uint32,  # r
+        ctypes.c_uint32,  # p
+        ctypes.c_uint32,  # t
+        ctypes.c_uint32,  # g
+        ctypes.c_uint32,  # flags
+        ctypes.c_void_p, ctypes.c_size_t,  # buf
+    ]
+
+    def call(local, passwd, salt, N, r, p, flags, out):
+        return kdf(
+            None, ctypes.byref(local), passwd, len(passwd), salt, len(salt),
+            N, r, p, 0, 0, flags, out, len(out),
+        )
+
+    return call, _YESCRYPT_RW_0X
+
+
+def _yescrypt_self_test(lib: ctypes.CDLL, kdf: Callable[..., int]) -> bool:
+    """Check the bound yescrypt_kdf() against a known answer."""
+    local = _YescryptRegion()
+    if lib.yescrypt_init_local(ctypes.byref(local)) != 0:
+        return False
+    out = ctypes.create_string_buffer(len(_YESCRYPT_KAT))
+    rc = kdf(local, b"", b"", 16, 1, 1, 0, out)
+    free_local = getattr(lib, "yescrypt_free_local", None)
+    if free_local is not None:
+        free_local(ctypes.byref(local))
+    return rc == 0 and out.raw == _YESCRYPT_KAT
+
+
+def _load_libyescrypt() -> Optional[Tuple[ctypes.CDLL, Callable[..., int], int]]:
+    """Load the reference libyescrypt (override path with ZION_YESCRYPT_LIB).
+
+    Returns the library, its bound kdf (see _bind_yescrypt_kdf) and the RW
+    flags, or None if it is missing or fails the known-answer test.
+    """
+    path = os.environ.get("ZION_YESCRYPT_LIB") or ctypes.util.find_library("yescrypt")
+    if not path:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+        lib.yescrypt_init_local.argtypes = [ctypes.POINTER(_YescryptRegion)]
+        lib.yescrypt_init_local.restype = ctypes.c_int
+        kdf, rw_flags = _bind_yescrypt_kdf(lib)
+    except (OSError, AttributeError):
+        return None
+    if not _yescrypt_self_test(lib, kdf):
+        logger.warning("libyescrypt %s failed the known-answer test; using fallback", path)
+        return None
+    return lib, kdf, rw_flags
+
+
+_YC_LIB = None
+_yc_kdf = None
+_yc_rw_flags = 0
+_yc_tls = threading.local()
+
 _yescrypt_hash = None
 try:
     import yescrypt  # type: ignore
@@ -81,51 +421,131 @@ try:
         if nonce == 0:
             salt = hashlib.sha256(data).digest()
             return yescrypt.hash(data, salt)
-        salt = hashlib.sha256(data + int(nonce).to_bytes(8, "little")).digest()
+        salt = hashlib.sha256(data + _pack_nonce_le(nonce)).digest()
         return yescrypt.hash(data, salt)
 
 except Exception:
+    _loaded = _load_libyescrypt()
+    if _loaded is not None:
+        _YC_LIB, _yc_kdf, _yc_rw_flags = _loaded
+
+if _yescrypt_hash is None and _YC_LIB is not None:
+
+    def _yescrypt_thread_local() -> Tuple[_YescryptRegion, ctypes.Array]:
+        """Return this thread's yescrypt_local_t and output buffer (created once)."""
+        local = getattr(_yc_tls, "local", None)
+        if local is None:
+            local = _YescryptRegion()
+            if _YC_LIB.yescrypt_init_local(ctypes.byref(local)) != 0:
+                raise RuntimeError("yescrypt_init_local failed")
+            _yc_tls.local = local
+            _yc_tls.out = ctypes.create_string_buffer(32)
+        return local, _yc_tls.out
+
+    def _yescrypt_hash(data: bytes, nonce: int) -> bytes:
+        if nonce == 0:
+            salt = hashlib.sha256(data).digest()
+        else:
+            salt = hashlib.sha256(data + _pack_nonce_le(nonce)).digest()
+        local, out = _yescrypt_thread_local()
+        rc = _yc_kdf(local, data, salt, _YESCRYPT_N, _YESCRYPT_R, _YESCRYPT_P, _yc_rw_flags, out)
+        if rc != 0:
+            raise RuntimeError(f"yescrypt_kdf failed (rc={rc})")
+        return out.raw
+
+elif _yescrypt_hash is None:
 
     def _yescrypt_hash(data: bytes, nonce: int) -> bytes:
         if nonce == 0:
             salt = hashlib.sha256(data[:8]).digest()
         else:
-            salt = hashlib.sha256(int(nonce).to_bytes(8, "little")).digest()
+            salt = hashlib.sha256(_pack_nonce_le(nonce)).digest()
         return hashlib.pbkdf2_hmac("sha256", data, salt, iterations=1024, dklen=32)
 
 
-# --- Autolykos v2 (optional OpenCL helper or fallback) -----------------------
-_autolykos_opencl = None
-_autolykos_native_available = False
+YESCRYPT_NATIVE_AVAILABLE = _YC_LIB is not None
 
+
+# --- Autolykos v2 (optional OpenCL helper or fallback) -----------------------
+_pyautolykos2 = None
 try:
-    from .algorithms.autolykos_opencl import AutolykosOpenCL
+    _pyautolykos2 = import_module("pyautolykos2")  # type: ignore
+except Exception:
+    _pyautolykos2 = None
 
-    _autolykos_opencl = AutolykosOpenCL()
-    _autolykos_native_available = True
 
-    def _hash_autolykos_v2(data: bytes, nonce: int) -> bytes:
-        return _autolykos_opencl.hash_single(data, int(nonce))
+@functools.cache
+def _get_autolykos_gpu():
+    """Create the OpenCL helper on first Autolykos hash (None if unusable).
 
-except Exception:
+    Deferred so that importing the registry (e.g. for cosmic_harmony or
+    randomx) never loads pyopencl or the OpenCL ICD.
+    """
     try:
-        pyautolykos2 = import_module("pyautolykos2")  # type: ignore
-
-        def _hash_autolykos_v2(data: bytes, nonce: int) -> bytes:
-            return pyautolykos2.hash(data, int(nonce))
+        from .algorithms.autolykos_opencl import AutolykosOpenCL
 
-        _autolykos_native_available = True
+        return AutolykosOpenCL()
     except Exception:
+        return None
 
-        def _hash_autolykos_v2(data: bytes, nonce: int) -> bytes:
-            if nonce == 0:
-                input_bytes = data
-            else:
-                input_bytes = data + int(nonce).to_bytes(8, "little", signed=False)
-            state = hashlib.blake2b(input_bytes, digest_size=32).digest()
-            for _ in range(8):
-                state = hashlib.blake2b(state + input_bytes, digest_size=32).digest()
-            return state
+
+# Parameter block for digest_size=32 is set up once; copy() is
+# cheaper than constructing a fresh hasher with keyword args.
+_blake2b_32 = hashlib.blake2b(digest_size=32)
+
+
+def _autolykos_blake2b_chain(input_bytes: bytes) -> bytes:
+    new = _blake2b_32.copy
+    h = new()
+    h.update(input_bytes)
+    state = h.digest()
+    for _ in range(8):
+        h = new()
+        h.update(state + input_bytes)
+        state = h.digest()
+    return state
+
+
+def _hash_autolykos_v2_blake2b(data: bytes, nonce: int) -> bytes:
+    if nonce == 0:
+        return _autolykos_blake2b_chain(data)
+    return _autolykos_blake2b_chain(data + _pack_nonce_le(nonce))
+
+
+def _hash_autolykos_v2_batch(data: bytes, nonces: Sequence[int]) -> List[bytes]:
+    # All nonce bytes are packed in one call instead of a
+    # to_bytes() per nonce.
+    packed = struct.pack(f"<{len(nonces)}Q", *nonces)
+    chain = _autolykos_blake2b_chain
+    return [
+        chain(data + packed[i : i + 8] if nonce else data)
+        for i, nonce in zip(range(0, len(packed), 8), nonces)
+    ]
+
+
+def _hash_autolykos_v2(data: bytes, nonce: int) -> bytes:
+    gpu = _get_autolykos_gpu()
+    if gpu is not None:
+        # Single-nonce compatibility path; batch callers should use
+        # autolykos_v2_hash_batch() so one dispatch covers many nonces.
+        return gpu.hash_batch_bytes(data, (int(nonce),))
+    if _pyautolykos2 is not None:
+        return _pyautolykos2.hash(data, int(nonce))
+    return _hash_autolykos_v2_blake2b(data, nonce)
+
+
+def autolykos_v2_hash_batch(data: bytes, nonces: Sequence[int]) -> List[bytes]:
+    """Hash many nonces against one blob.
+
+    On the OpenCL path this is one kernel dispatch over persistent device
+    buffers instead of one dispatch per nonce.
+    """
+    gpu = _get_autolykos_gpu()
+    if gpu is not None:
+        return gpu.hash_batch(data, nonces)
+    if _pyautolykos2 is not None:
+        return [_pyautolykos2.hash(data, int(n)) for n in nonces]
+    return _hash_autolykos_v2_batch(data, nonces)
 
 
 AVAILABLE_ALGOS: Dict[str, Dict[str, object]] = {
@@ -133,33 +553,127 @@ AVAILABLE_ALGOS: Dict[str, Dict[str, object]] = {
         "available": COSMIC_HARMONY_AVAILABLE,
         "hash": _hash_cosmic_harmony if COSMIC_HARMONY_AVAILABLE else None,
     },
-    "cosmic": {
-        "available": COSMIC_HARMONY_AVAILABLE,
-        "hash": _hash_cosmic_harmony if COSMIC_HARMONY_AVAILABLE else None,
-    },
     "randomx": {"available": True, "hash": _hash_randomx},
     "yescrypt": {"available": True, "hash": _yescrypt_hash},
     "autolykos_v2": {"available": True, "hash": _hash_autolykos_v2},
 }
 
 
+# Alternate names accepted by the lookup helpers (not listed separately).
+_ALIASES: Dict[str, str] = {"cosmic": "cosmic_harmony"}
+
+
 def is_available(name: str) -> bool:
-    info = AVAILABLE_ALGOS.get(name)
+    info = AVAILABLE_ALGOS.get(_ALIASES.get(name, name))
     return bool(info and info.get("available"))
 
 
-def get_hash(name: str, data: bytes, nonce: int = 0) -> str:
-    algo = AVAILABLE_ALGOS.get(name)
+def resolve(name: str) -> Callable[[bytes, int], bytes]:
+    """Return the raw hash function for ``name`` (32-byte digest, no hex).
+
+    Hot loops should bind this once and call it directly instead of going
+    through ``get_hash`` per nonce.
+    """
+    algo = AVAILABLE_ALGOS.get(_ALIASES.get(name, name))
     if algo and algo.get("available") and callable(algo.get("hash")):
-        hash_bytes = algo["hash"](data, int(nonce))  # type: ignore[index]
-        return hash_bytes.hex()
+        return algo["hash"]  # type: ignore[return-value]
     raise RuntimeError(f"Algorithm '{name}' is not available")
 
 
+def get_hash_bytes(name: str, data: bytes, nonce: int = 0) -> bytes:
+    """Hash ``data`` with ``name`` and return the raw 32-byte digest.
+
+    Byte order: digests are compared against pool targets as a big-endian
+    integer, i.e. ``int.from_bytes(h, "big")`` == ``int(h.hex(), 16)``.
+    """
+    return resolve(name)(data, int(nonce))
+
+
+def get_hash(name: str, data: bytes, nonce: int = 0) -> str:
+    """Hex form of ``get_hash_bytes`` (kept for existing callers)."""
+    return get_hash_bytes(name, data, nonce).hex()
+
+
 def list_supported() -> Dict[str, bool]:
-    excluded = {"cosmic"}
-    return {
-        k: bool(v.get("available"))
-        for k, v in AVAILABLE_ALGOS.items()
-        if k not in excluded
-    }
+    return {k: bool(v.get("available")) for k, v in AVAILABLE_ALGOS.items()}
+
+
+# --- Nonce scanning ---------------------------------------------------------
+# Byte offset of the 32-bit nonce in a Monero-style hashing blob.
+BLOB_NONCE_OFFSET = 39
+
+# Nonce bytes are written big-endian, i.e. exactly the bytes of the
+# ``f"{nonce:08x}"`` string submitted to the pool.
+_pack_nonce32_into = struct.Struct(">I").pack_into
+
+
+# Targets >= 2**256 accept every 32-byte digest.
+_TARGET_CEIL = 1 << 256
+_MAX_DIGEST = b"\xff" * 32
+
+
+def scan_nonces(
+    name: str,
+    blob: bytes,
+    nonce_start: int,
+    count: int,
+    target: int,
+    nonce_step: int = 1,
+) -> Tuple[int, Optional[int], Optional[bytes]]:
+    """Hash ``count`` nonces written into ``blob`` and stop at the first share.
+
+    Nonces are ``nonce_start + k * nonce_step`` (mod 2**32), patched in place
+    at ``BLOB_NONCE_OFFSET``. A hash is a share when
+    ``int.from_bytes(h, "big") <= target``.
+
+    Returns ``(hashes_done, nonce, hash)``; ``nonce``/``hash`` are None if no
+    share was found. With native librandomx the batch runs on the pipelined
+    ``randomx_calculate_hash_first``/``_next``/``_last`` API.
+    """
+    if len(blob) < BLOB_NONCE_OFFSET + 4:
+        raise ValueError(f"Blob too short: {len(blob)} bytes")
+    if count <= 0:
+        return 0, None, None
+
+    # Equal-length big-endian bytes compare like the integers they encode,
+    # so each hash is checked with one memcmp instead of a bigint build.
+    if target < 0:
+        limit = b""  # below every digest: nothing is a share
+    elif target < _TARGET_CEIL:
+        limit = target.to_bytes(32, "big")
+    else:
+        limit = _MAX_DIGEST
+
+    buf = bytearray(blob)
+    nonce = nonce_start & 0xFFFFFFFF
+
+    vm_out = None
+    if _RX_LIB is not None and _ALIASES.get(name, name) == "randomx":
+        vm_out = _randomx_thread_vm()
+    if vm_out is not None:
+        vm, out = vm_out
+        _pack_nonce32_into(buf, BLOB_NONCE_OFFSET, nonce)
+        _RX_LIB.randomx_calculate_hash_first(vm, bytes(buf), len(buf))
+        for k in range(1, count):
+            nxt = (nonce + nonce_step) & 0xFFFFFFFF
+            _pack_nonce32_into(buf, BLOB_NONCE_OFFSET, nxt)
+            # Returns the hash of ``nonce`` while starting ``nxt``
+            _RX_LIB.randomx_calculate_hash_next(vm, bytes(buf), len(buf), out)
+            digest = out.raw
+            if digest <= limit:
+                return k, nonce, digest
+            nonce = nxt
+        _RX_LIB.randomx_calculate_hash_last(vm, out)
+        digest = out.raw
+        if digest <= limit:
+            return count, nonce, digest
+        return count, None, None
+
+    hash_fn = resolve(name)
+    for k in range(count):
+        _pack_nonce32_into(buf, BLOB_NONCE_OFFSET, nonce)
+        digest = hash_fn(bytes(buf), 0)
+        if digest <= limit:
+            return k + 1, nonce, digest
+        nonce = (nonce + nonce_step) & 0xFFFFFFFF
+    return count, None, None
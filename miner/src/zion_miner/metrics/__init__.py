@@ -5,16 +5,21 @@
 Comprehensive mining statistics and monitoring.
 """
 
+import math
 import time
 import logging
 from typing import Dict, List, Optional
+from array import array
 from dataclasses import dataclass, field
-from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# Clocks bound once for the per-update paths
+_now = time.time
+_monotonic_ns = time.monotonic_ns
 
-@dataclass
+
+@dataclass(slots=True)
 class MiningStats:
     """Mining statistics snapshot"""
     hashrate_current: float = 0.0
@@ -89,12 +94,27 @@ class MiningStats:
         }
 
 
+# Hashrate history capacity: 15 minutes @ 1Hz
+HISTORY_SIZE = 900
+
+# Time constants (seconds) of the 1/5/15 minute hashrate EWMAs
+EWMA_TAUS = (60.0, 300.0, 900.0)
+
+# Shortest span (ns) taken as a hashrate sample; shorter calls accumulate
+# into the next one (a first call right after start would seed the EWMAs
+# with a meaningless rate)
+MIN_SAMPLE_NS = 1_000_000_000
+
+# Share history capacity (most recent shares kept)
+SHARE_HISTORY_SIZE = 1000
+
+
 class MetricsCollector:
     """
     Real-time metrics collector with rolling averages
     
     Features:
-    - Rolling hashrate averages (1min, 5min, 15min)
+    - Rolling hashrate averages (1min, 5min, 15min EWMA)
     - Share tracking
     - Hardware monitoring
     - Prometheus export support
@@ -103,14 +123,26 @@ class MetricsCollector:
     def __init__(self, algorithm: str = "unknown", threads: int = 1):
         self.stats = MiningStats(algorithm=algorithm, threads=threads)
         
-        # Hashrate history (timestamp, hashrate) for averages
-        self.hashrate_history: deque = deque(maxlen=900)  # 15 minutes @ 1Hz
+        # Hashrate history (timestamp, hashrate) as a struct-of-arrays ring
+        # buffer: sample n lives in slot n % HISTORY_SIZE.
+        self._hist_ts = array("d", bytes(8 * HISTORY_SIZE))
+        self._hist_hr = array("d", bytes(8 * HISTORY_SIZE))
+        self._hist_count = 0  # samples recorded so far
+        
+        # Exponentially weighted hashrate averages (1min, 5min, 15min)
+        self._ewma = [0.0, 0.0, 0.0]
         
-        # Share history for detailed tracking
-        self.share_history: List[Dict] = []
+        # Share history for detailed tracking: columnar ring buffer, share n
+        # lives in slot n % SHARE_HISTORY_SIZE.
+        self._sh_ts = array("d", bytes(8 * SHARE_HISTORY_SIZE))
+        self._sh_accepted = array("B", bytes(SHARE_HISTORY_SIZE))
+        self._sh_difficulty = array("Q", bytes(8 * SHARE_HISTORY_SIZE))
+        self._sh_latency = array("f", bytes(4 * SHARE_HISTORY_SIZE))
+        self._sh_count = 0  # shares recorded so far
         
         self._last_hashes = 0
-        self._last_time = time.time()
+        # Monotonic clock: NTP/wall-clock jumps must not skew hashrate
+        self._last_time_ns = _monotonic_ns()
     
     def update_hashrate(self, total_hashes: int):
         """
@@ -119,48 +151,57 @@ class MetricsCollector:
         Args:
             total_hashes: Total hashes computed since start
         """
-        now = time.time()
-        elapsed = now - self._last_time
+        now_ns = _monotonic_ns()
+        elapsed_ns = now_ns - self._last_time_ns
         
-        if elapsed > 0:
-            # Calculate instantaneous hashrate
+        if elapsed_ns >= MIN_SAMPLE_NS:
             delta_hashes = total_hashes - self._last_hashes
-            hashrate = delta_hashes / elapsed
+            if delta_hashes < 0:
+                # Counter was reset (e.g. miner restart): rebase, no sample
+                self._last_hashes = total_hashes
+                self._last_time_ns = now_ns
+                return
+            
+            # Calculate instantaneous hashrate
+            now = now_ns / 1e9
+            hashrate = delta_hashes * 1e9 / elapsed_ns
             
             # Update current
             self.stats.hashrate_current = hashrate
             
-            # Add to history
-            self.hashrate_history.append((now, hashrate))
+            # Add to history (overwrites the oldest sample once full)
+            slot = self._hist_count % HISTORY_SIZE
+            self._hist_ts[slot] = now
+            self._hist_hr[slot] = hashrate
+            self._hist_count += 1
             
             # Calculate averages
-            self._calculate_averages()
+            self._calculate_averages(elapsed_ns / 1e9, hashrate)
             
             # Update for next iteration
             self._last_hashes = total_hashes
-            self._last_time = now
+            self._last_time_ns = now_ns
     
-    def _calculate_averages(self):
-        """Calculate rolling hashrate averages"""
-        if not self.hashrate_history:
-            return
-        
-        now = time.time()
-        
-        # 1 minute average
-        recent_1min = [h for t, h in self.hashrate_history if now - t <= 60]
-        if recent_1min:
-            self.stats.hashrate_avg_1min = sum(recent_1min) / len(recent_1min)
-        
-        # 5 minute average
-        recent_5min = [h for t, h in self.hashrate_history if now - t <= 300]
-        if recent_5min:
-            self.stats.hashrate_avg_5min = sum(recent_5min) / len(recent_5min)
-        
-        # 15 minute average
-        if self.hashrate_history:
-            all_hashrates = [h for _, h in self.hashrate_history]
-            self.stats.hashrate_avg_15min = sum(all_hashrates) / len(all_hashrates)
+    @property
+    def hashrate_history(self) -> List[tuple]:
+        """(timestamp, hashrate) samples, oldest first (time.monotonic() seconds)"""
+        count = self._hist_count
+        start = max(0, count - HISTORY_SIZE)
+        ts, hr = self._hist_ts, self._hist_hr
+        return [(ts[i % HISTORY_SIZE], hr[i % HISTORY_SIZE]) for i in range(start, count)]
+    
+    def _calculate_averages(self, elapsed: float, hashrate: float):
+        """Update EWMA hashrate averages (O(1), no history scan)"""
+        ewma = self._ewma
+        if self._hist_count == 1:
+            # Seed with the first sample (spans >= MIN_SAMPLE_NS) instead of
+            # decaying up from zero
+            ewma[:] = (hashrate, hashrate, hashrate)
+        else:
+            for k, tau in enumerate(EWMA_TAUS):
+                ewma[k] += (1.0 - math.exp(-elapsed / tau)) * (hashrate - ewma[k])
+        stats = self.stats
+        stats.hashrate_avg_1min, stats.hashrate_avg_5min, stats.hashrate_avg_15min = ewma
     
     def record_share(self, accepted: bool, difficulty: int = 1, latency: float = 0.0):
         """
@@ -184,20 +225,49 @@ class MetricsCollector:
             self.stats.pool_latency = latency
         
         # Record in history
-        self.share_history.append({
-            "timestamp": time.time(),
-            "accepted": accepted,
-            "difficulty": difficulty,
-            "latency": latency
-        })
+        slot = self._sh_count % SHARE_HISTORY_SIZE
+        self._sh_ts[slot] = _now()
+        self._sh_accepted[slot] = 1 if accepted else 0
+        self._sh_difficulty[slot] = difficulty
+        self._sh_latency[slot] = latency
+        self._sh_count += 1
+    
+    @property
+    def share_history(self) -> List[Dict]:
+        """Recorded shares as dicts, oldest first (at most SHARE_HISTORY_SIZE)"""
+        count = self._sh_count
+        return [
+            {
+                "timestamp": self._sh_ts[i % SHARE_HISTORY_SIZE],
+                "accepted": bool(self._sh_accepted[i % SHARE_HISTORY_SIZE]),
+                "difficulty": self._sh_difficulty[i % SHARE_HISTORY_SIZE],
+                "latency": self._sh_latency[i % SHARE_HISTORY_SIZE],
+            }
+            for i in range(max(0, count - SHARE_HISTORY_SIZE), count)
+        ]
+    
+    def get_recent_acceptance(self, n: int = SHARE_HISTORY_SIZE) -> float:
+        """
+        Acceptance rate (%) over the last n recorded shares
         
-        # Limit history size
-        if len(self.share_history) > 1000:
-            self.share_history = self.share_history[-1000:]
+        Args:
+            n: Number of most recent shares to consider (capped at history size)
+        """
+        n = min(n, self._sh_count, SHARE_HISTORY_SIZE)
+        if n <= 0:
+            return 0.0
+        end = self._sh_count % SHARE_HISTORY_SIZE
+        start = end - n
+        accepted = self._sh_accepted
+        if start >= 0:
+            hits = sum(accepted[start:end])
+        else:
+            hits = sum(accepted[start:]) + sum(accepted[:end])
+        return hits / n * 100.0
     
     def update_uptime(self):
         """Update uptime counter"""
-        self.stats.uptime = time.time() - self.stats.start_time
+        self.stats.uptime = _now() - self.stats.start_time
     
     def update_hardware(self, cpu_temp=None, cpu_usage=None, gpu_temp=None, gpu_fan=None, gpu_power=None):
         """Update hardware metrics"""
@@ -220,61 +290,69 @@ class MetricsCollector:
     def print_stats(self):
         """Print formatted statistics to console"""
         stats = self.get_stats()
+        rule = "=" * 60
+        sep = "-" * 60
         
-        print("\n" + "=" * 60)
-        print(f"⛏️  ZION Miner v2.9 - {stats.algorithm.upper()}")
-        print("=" * 60)
-        print(f"Hashrate:  {stats.hashrate_current:>10.2f} H/s (current)")
-        print(f"           {stats.hashrate_avg_1min:>10.2f} H/s (1 min avg)")
-        print(f"           {stats.hashrate_avg_5min:>10.2f} H/s (5 min avg)")
-        print(f"           {stats.hashrate_avg_15min:>10.2f} H/s (15 min avg)")
-        print("-" * 60)
-        print(f"Shares:    {stats.shares_accepted}/{stats.shares_total} accepted ({stats.acceptance_rate():.1f}%)")
-        print(f"           {stats.shares_rejected} rejected")
-        print("-" * 60)
-        print(f"Uptime:    {stats.uptime_str()}")
-        print(f"Threads:   {stats.threads}")
-        print(f"Diff:      {stats.pool_difficulty}")
+        # Assemble the block and print it once (one stdout write, no
+        # interleaving with log lines from other tasks)
+        lines = [
+            "",
+            rule,
+            f"⛏️  ZION Miner v2.9 - {stats.algorithm.upper()}",
+            rule,
+            f"Hashrate:  {stats.hashrate_current:>10.2f} H/s (current)",
+            f"           {stats.hashrate_avg_1min:>10.2f} H/s (1 min avg)",
+            f"           {stats.hashrate_avg_5min:>10.2f} H/s (5 min avg)",
+            f"           {stats.hashrate_avg_15min:>10.2f} H/s (15 min avg)",
+            sep,
+            f"Shares:    {stats.shares_accepted}/{stats.shares_total} accepted ({stats.acceptance_rate():.1f}%)",
+            f"           {stats.shares_rejected} rejected",
+            sep,
+            f"Uptime:    {stats.uptime_str()}",
+            f"Threads:   {stats.threads}",
+            f"Diff:      {stats.pool_difficulty}",
+        ]
         
         if stats.cpu_temp > 0:
-            print("-" * 60)
-            print(f"CPU:       {stats.cpu_temp:.1f}°C | {stats.cpu_usage:.1f}%")
+            lines.append(sep)
+            lines.append(f"CPU:       {stats.cpu_temp:.1f}°C | {stats.cpu_usage:.1f}%")
         
         if stats.gpu_temp > 0:
-            print(f"GPU:       {stats.gpu_temp:.1f}°C | {stats.gpu_fan}% fan | {stats.gpu_power:.1f}W")
+            lines.append(f"GPU:       {stats.gpu_temp:.1f}°C | {stats.gpu_fan}% fan | {stats.gpu_power:.1f}W")
         
-        print("=" * 60 + "\n")
+        lines.append(rule + "\n")
+        print("\n".join(lines))
     
     def export_prometheus(self) -> str:
         """Export metrics in Prometheus format"""
         stats = self.get_stats()
         
-        metrics = [
-            f"# HELP zion_miner_hashrate_current Current hashrate in H/s",
-            f"# TYPE zion_miner_hashrate_current gauge",
-            f"zion_miner_hashrate_current {stats.hashrate_current}",
-            "",
-            f"# HELP zion_miner_hashrate_avg Average hashrate in H/s",
-            f"# TYPE zion_miner_hashrate_avg gauge",
-            f'zion_miner_hashrate_avg{{period="1min"}} {stats.hashrate_avg_1min}',
-            f'zion_miner_hashrate_avg{{period="5min"}} {stats.hashrate_avg_5min}',
-            f'zion_miner_hashrate_avg{{period="15min"}} {stats.hashrate_avg_15min}',
-            "",
-            f"# HELP zion_miner_shares_total Total shares submitted",
-            f"# TYPE zion_miner_shares_total counter",
-            f"zion_miner_shares_total {stats.shares_total}",
-            "",
-            f"# HELP zion_miner_shares_accepted Accepted shares",
-            f"# TYPE zion_miner_shares_accepted counter",
-            f"zion_miner_shares_accepted {stats.shares_accepted}",
-            "",
-            f"# HELP zion_miner_shares_rejected Rejected shares",
-            f"# TYPE zion_miner_shares_rejected counter",
-            f"zion_miner_shares_rejected {stats.shares_rejected}",
-            "",
-            f"# HELP zion_miner_uptime Miner uptime in seconds",
-            f"# TYPE zion_miner_uptime counter",
-            f"zion_miner_uptime {stats.uptime}",
-        ]
-        
-        return "\n".join(metrics) + "\n"
+        # One f-string: the HELP/TYPE lines are compile-time constants and the
+        # whole exposition is built in a single string allocation.
+        return (
+            "# HELP zion_miner_hashrate_current Current hashrate in H/s\n"
+            "# TYPE zion_miner_hashrate_current gauge\n"
+            f"zion_miner_hashrate_current {stats.hashrate_current}\n"
+            "\n"
+            "# HELP zion_miner_hashrate_avg Average hashrate in H/s\n"
+            "# TYPE zion_miner_hashrate_avg gauge\n"
+            f'zion_miner_hashrate_avg{{period="1min"}} {stats.hashrate_avg_1min}\n'
+            f'zion_miner_hashrate_avg{{period="5min"}} {stats.hashrate_avg_5min}\n'
+            f'zion_miner_hashrate_avg{{period="15min"}} {stats.hashrate_avg_15min}\n'
+            "\n"
+            "# HELP zion_miner_shares_total Total shares submitted\n"
+            "# TYPE zion_miner_shares_total counter\n"
+            f"zion_miner_shares_total {stats.shares_total}\n"
+            "\n"
+            "# HELP zion_miner_shares_accepted Accepted shares\n"
+            "# TYPE zion_miner_shares_accepted counter\n"
+            f"zion_miner_shares_accepted {stats.shares_accepted}\n"
+            "\n"
+            "# HELP zion_miner_shares_rejected Rejected shares\n"
+            "# TYPE zion_miner_shares_rejected counter\n"
+            f"zion_miner_shares_rejected {stats.shares_rejected}\n"
+            "\n"
+            "# HELP zion_miner_uptime Miner uptime in seconds\n"
+            "# TYPE zion_miner_uptime counter\n"
+            f"zion_miner_uptime {stats.uptime}\n"
+        )
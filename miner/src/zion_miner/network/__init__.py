@@ -8,14 +8,55 @@ Async pool communication with job management.
 import asyncio
 import json
 import logging
+import random
 import time
+from json.encoder import encode_basestring_ascii as _json_str
 from typing import Optional, Dict, Any, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Optional fast JSON codec (falls back to stdlib json)
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
-@dataclass
+if orjson is not None:
+
+    def _dumps_line(data: Dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+
+else:
+
+    def _dumps_line(data: Dict) -> bytes:
+        return (json.dumps(data) + "\n").encode()
+
+    _loads = json.loads
+
+
+def _json_bytes(value: Optional[str]) -> bytes:
+    """Encode a string (or None) as a JSON literal, safe to embed in a %-template"""
+    return json.dumps(value).encode().replace(b"%", b"%%")
+
+
+# Bound once for the per-share/per-job paths
+_now = time.time
+
+# Bytes requested per socket read in PoolClient._recv_json
+RECV_CHUNK = 65536
+
+# Longest pool message accepted, as with StreamReader.readline()'s default limit
+MAX_LINE = 65536
+
+# Reconnect delay: doubles per failed attempt up to the cap, with +/-50% jitter
+RECONNECT_BACKOFF_MIN = 1.0
+RECONNECT_BACKOFF_MAX = 60.0
+
+
+@dataclass(slots=True)
 class MiningJob:
     """Mining job from pool"""
     job_id: str
@@ -26,10 +67,17 @@ class MiningJob:
     seed_hash: Optional[str] = None
     difficulty: int = 1
     timestamp: float = 0.0
+    # Share threshold parsed from ``target`` once per job: a hash h is a
+    # share when int.from_bytes(h, "big") <= target_int (-1: unparsable)
+    target_int: int = field(init=False, default=-1, repr=False)
     
     def __post_init__(self):
         if self.timestamp == 0.0:
-            self.timestamp = time.time()
+            self.timestamp = _now()
+        try:
+            self.target_int = int(self.target, 16)
+        except (TypeError, ValueError):
+            self.target_int = -1
 
 
 class PoolClient:
@@ -67,6 +115,13 @@ class PoolClient:
         self.current_job: Optional[MiningJob] = None
         self.miner_id: Optional[str] = None
         
+        # Last decoded job blob (pools often resend the same template)
+        self._last_blob_hex = ""
+        self._last_blob: Optional[bytes] = None
+        
+        # Receive buffer; one read() may carry several newline-framed messages
+        self._rx_buf = bytearray()
+        
         # Callbacks
         self.on_job_callback: Optional[Callable] = None
         self.on_connect_callback: Optional[Callable] = None
@@ -78,8 +133,12 @@ class PoolClient:
         self.shares_rejected = 0
         self.last_share_time = 0.0
         
+        # Pre-encoded submit request, rebuilt on every successful login
+        self._submit_template: Optional[bytes] = None
+        
         self._tasks = []
         self._running = False
+        self._backoff = RECONNECT_BACKOFF_MIN
     
     async def connect(self) -> bool:
         """Connect to pool"""
@@ -90,6 +149,7 @@ class PoolClient:
                 self.host, self.port
             )
             
+            self._rx_buf.clear()
             self.connected = True
             logger.info(f"✅ Connected to pool")
             
@@ -110,12 +170,17 @@ class PoolClient:
         
         try:
             if self.protocol == "xmrig":
-                return await self._login_xmrig()
+                ok = await self._login_xmrig()
             elif self.protocol == "stratum":
-                return await self._login_stratum()
+                ok = await self._login_stratum()
             else:
                 logger.error(f"Unknown protocol: {self.protocol}")
                 return False
+            
+            if ok:
+                self._submit_template = self._build_submit_template()
+                self._backoff = RECONNECT_BACKOFF_MIN
+            return ok
                 
         except Exception as e:
             logger.error(f"❌ Login failed: {e}")
@@ -159,29 +224,40 @@ class PoolClient:
         return True
     
     async def _login_stratum(self) -> bool:
-        """Stratum protocol login (subscribe + authorize)"""
-        # Subscribe
+        """Stratum protocol login (subscribe + authorize, pipelined)"""
         subscribe_req = {
             "id": 1,
             "method": "mining.subscribe",
             "params": ["ZIONMiner/2.9.0"]
         }
-        await self._send_json(subscribe_req)
-        subscribe_resp = await self._recv_json()
-        
-        if not subscribe_resp or not subscribe_resp.get("result"):
-            return False
-        
-        # Authorize
         auth_req = {
             "id": 2,
             "method": "mining.authorize",
             "params": [f"{self.wallet}.{self.worker}", "x"]
         }
-        await self._send_json(auth_req)
-        auth_resp = await self._recv_json()
         
-        if auth_resp and auth_resp.get("result"):
+        # Send both requests in one write so login costs a single round-trip
+        if not self.writer:
+            raise RuntimeError("Not connected")
+        self.writer.write(_dumps_line(subscribe_req) + _dumps_line(auth_req))
+        await self.writer.drain()
+        
+        # Match responses by id; pools may interleave notifications
+        responses: Dict[int, Dict] = {}
+        while len(responses) < 2:
+            msg = await self._recv_json()
+            if not msg:
+                return False
+            msg_id = msg.get("id")
+            if msg_id in (1, 2):
+                responses[msg_id] = msg
+            else:
+                logger.debug("Ignoring message during login: %s", msg.get("method"))
+        
+        if not responses[1].get("result"):
+            return False
+        
+        if responses[2].get("result"):
             self.authenticated = True
             logger.info("✅ Authenticated (Stratum)")
             return True
@@ -195,48 +271,60 @@ class PoolClient:
             return False
         
         try:
-            if self.protocol == "xmrig":
-                request = {
-                    "jsonrpc": "2.0",
-                    "id": self.shares_submitted + 10,
-                    "method": "submit",
-                    "params": {
-                        "id": self.miner_id,
-                        "job_id": job_id,
-                        "nonce": nonce,
-                        "result": result
-                    }
-                }
-            else:  # stratum
-                request = {
-                    "id": self.shares_submitted + 10,
-                    "method": "mining.submit",
-                    "params": [
-                        f"{self.wallet}.{self.worker}",
-                        job_id,
-                        nonce,
-                        result
-                    ]
-                }
+            if not self.writer:
+                raise RuntimeError("Not connected")
             
-            await self._send_json(request)
+            self.writer.write(self._submit_template % (
+                self.shares_submitted + 10,
+                _json_str(job_id).encode(),
+                _json_str(nonce).encode(),
+                _json_str(result).encode(),
+            ))
+            await self.writer.drain()
             self.shares_submitted += 1
-            self.last_share_time = time.time()
+            self.last_share_time = _now()
             
-            logger.info(f"📤 Share submitted: {job_id}")
+            logger.info("📤 Share submitted: %s", job_id)
             return True
             
         except Exception as e:
             logger.error(f"❌ Share submission failed: {e}")
             return False
     
+    def _build_submit_template(self) -> bytes:
+        """
+        Encode the constant part of the submit request once per login;
+        submit_share only fills in id, job_id, nonce and result.
+        """
+        if self.protocol == "xmrig":
+            return (
+                b'{"jsonrpc":"2.0","id":%d,"method":"submit","params":{"id":'
+                + _json_bytes(self.miner_id)
+                + b',"job_id":%s,"nonce":%s,"result":%s}}\n'
+            )
+        
+        # stratum
+        return (
+            b'{"id":%d,"method":"mining.submit","params":['
+            + _json_bytes(f"{self.wallet}.{self.worker}")
+            + b',%s,%s,%s]}\n'
+        )
+    
     def _handle_job(self, job_data: Dict):
         """Handle new job from pool"""
         try:
+            blob_hex = job_data.get("blob") or ""
+            if blob_hex == self._last_blob_hex:
+                blob = self._last_blob
+            else:
+                blob = bytes.fromhex(blob_hex) if blob_hex else None
+                self._last_blob_hex = blob_hex
+                self._last_blob = blob
+            
             job = MiningJob(
                 job_id=job_data.get("job_id", ""),
                 algorithm=job_data.get("algo", self.algorithm),
-                blob=bytes.fromhex(job_data.get("blob", "")) if job_data.get("blob") else None,
+                blob=blob,
                 target=job_data.get("target", "ffffffff"),
                 height=job_data.get("height", 0),
                 seed_hash=job_data.get("seed_hash"),
@@ -245,7 +333,7 @@ class PoolClient:
             
             self.current_job = job
             
-            logger.info(f"📦 New job: {job.job_id} | height={job.height} | diff={job.difficulty}")
+            logger.info("📦 New job: %s | height=%s | diff=%s", job.job_id, job.height, job.difficulty)
             
             if self.on_job_callback:
                 asyncio.create_task(self.on_job_callback(job))
@@ -258,8 +346,7 @@ class PoolClient:
         if not self.writer:
             raise RuntimeError("Not connected")
         
-        msg = json.dumps(data) + "\n"
-        self.writer.write(msg.encode())
+        self.writer.write(_dumps_line(data))
         await self.writer.drain()
     
     async def _recv_json(self) -> Optional[Dict]:
@@ -267,12 +354,29 @@ class PoolClient:
         if not self.reader:
             return None
         
+        buf = self._rx_buf
         try:
-            line = await asyncio.wait_for(self.reader.readline(), timeout=30.0)
-            if not line:
+            # Frames already buffered are returned without touching the loop
+            end = buf.find(b"\n")
+            while end < 0 and len(buf) <= MAX_LINE:
+                start = len(buf)
+                chunk = await asyncio.wait_for(self.reader.read(RECV_CHUNK), timeout=30.0)
+                if not chunk:
+                    return None
+                buf += chunk
+                end = buf.find(b"\n", start)
+            
+            if end < 0 or end > MAX_LINE:
+                logger.warning(f"❌ Pool message exceeds {MAX_LINE} bytes, reconnecting")
+                buf.clear()
+                self.connected = False
                 return None
             
-            return json.loads(line.decode().strip())
+            line = bytes(buf[:end])
+            del buf[:end + 1]
+            
+            # Both codecs take bytes and ignore surrounding whitespace
+            return _loads(line)
             
         except asyncio.TimeoutError:
             logger.debug("⏱️  Receive timeout (no message)")
@@ -282,14 +386,31 @@ class PoolClient:
             return None
     
     async def _message_loop(self):
-        """Background message handler"""
+        """Background message handler; reconnects until stopped"""
+        while self._running:
+            await self._receive_messages()
+            
+            if self.on_disconnect_callback:
+                await self.on_disconnect_callback()
+            
+            if not await self._reconnect():
+                break
+    
+    async def _receive_messages(self):
+        """Dispatch pool messages until the connection is lost"""
         timeout_count = 0
         max_consecutive_timeouts = 20
+        recv = self._recv_json
+        handle_job = self._handle_job
         
         while self._running and self.connected:
             try:
-                msg = await self._recv_json()
+                msg = await recv()
                 if msg is None:
+                    if self.reader is None or self.reader.at_eof():
+                        logger.warning("❌ Pool closed the connection")
+                        self.connected = False
+                        break
                     timeout_count += 1
                     if timeout_count >= max_consecutive_timeouts:
                         logger.warning("❌ Too many timeouts, connection lost")
@@ -306,24 +427,51 @@ class PoolClient:
                 if method == "job":
                     # New job notification
                     params = msg.get("params", {})
-                    self._handle_job(params)
+                    handle_job(params)
                     
                 elif "result" in msg:
                     # Response to submit
                     result = msg.get("result")
                     if result and result.get("status") == "OK":
                         self.shares_accepted += 1
-                        logger.info(f"✅ Share accepted ({self.shares_accepted}/{self.shares_submitted})")
+                        logger.info("✅ Share accepted (%d/%d)", self.shares_accepted, self.shares_submitted)
                     else:
                         self.shares_rejected += 1
-                        logger.warning(f"❌ Share rejected ({self.shares_rejected}/{self.shares_submitted})")
+                        logger.warning("❌ Share rejected (%d/%d)", self.shares_rejected, self.shares_submitted)
                         
             except Exception as e:
                 logger.error(f"❌ Message loop error: {e}")
                 await asyncio.sleep(1)
+    
+    async def _close_connection(self):
+        """Close the current socket, ignoring errors from a dead peer"""
+        writer, self.writer, self.reader = self.writer, None, None
+        self.connected = False
+        self.authenticated = False
+        if writer:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+    
+    async def _reconnect(self) -> bool:
+        """Reconnect and log in again with exponential backoff and jitter"""
+        await self._close_connection()
         
-        if self.on_disconnect_callback:
-            await self.on_disconnect_callback()
+        while self._running:
+            delay = min(RECONNECT_BACKOFF_MAX, self._backoff) * (0.5 + random.random())
+            self._backoff = min(RECONNECT_BACKOFF_MAX, self._backoff * 2)
+            logger.info(f"🔄 Reconnecting in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            
+            if not self._running:
+                break
+            if await self.connect() and await self.login():
+                return True
+            await self._close_connection()
+        
+        return False
     
     async def start(self):
         """Start pool client"""
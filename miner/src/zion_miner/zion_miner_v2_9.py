@@ -6,9 +6,13 @@ Modulární mining client s nativními algoritmy.
 """
 
 import asyncio
+import itertools
 import logging
+import os
 import signal
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 
@@ -18,6 +22,9 @@ from .metrics import MetricsCollector
 
 logger = logging.getLogger(__name__)
 
+# Found shares waiting to be sent; beyond this they are dropped
+SHARE_QUEUE_SIZE = 64
+
 
 @dataclass
 class MinerConfig:
@@ -35,6 +42,8 @@ class MinerConfig:
     
     # Performance
     intensity: int = 1  # Concurrent nonce searches per thread
+    batch_size: int = 256  # Nonces per hashing call (x intensity), run off the event loop
+    cpu_affinity: bool = False  # Pin each hashing thread to its own core (Linux)
     update_interval: float = 2.0  # Stats update interval
     
     # Display
@@ -70,20 +79,48 @@ class ZionMiner:
         # State
         self.running = False
         self.current_job: Optional[MiningJob] = None
-        self.total_hashes = 0
+        # Hashes done per worker; each worker only writes its own slot
+        self._hash_counts = array("Q", [0] * config.threads)
         
         # Tasks
         self._tasks = []
         
+        # Found shares, sent by _share_submitter so workers never wait on
+        # the pool round-trip (created in start(), inside the event loop)
+        self._share_queue: Optional[asyncio.Queue] = None
+        
+        # One OS thread per worker runs the hash batches (native hashes
+        # release the GIL, so workers hash in parallel)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cpu_ids = itertools.count()
+        
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
+    @property
+    def total_hashes(self) -> int:
+        """Hashes done by all workers since start"""
+        return sum(self._hash_counts)
+    
     def _signal_handler(self, sig, frame):
         """Handle shutdown signals"""
         logger.info("🛑 Received shutdown signal")
         self.running = False
     
+    def _init_hash_thread(self):
+        """Executor thread initializer: optionally pin the thread to a core"""
+        if not self.config.cpu_affinity or not hasattr(os, "sched_setaffinity"):
+            return
+        
+        cpus = sorted(os.sched_getaffinity(0))
+        cpu = cpus[next(self._cpu_ids) % len(cpus)]
+        try:
+            os.sched_setaffinity(0, {cpu})  # 0 = calling thread on Linux
+            logger.debug("Hash thread pinned to CPU %d", cpu)
+        except OSError as e:
+            logger.warning(f"⚠️  CPU affinity not applied: {e}")
+    
     async def initialize(self):
         """Initialize miner components"""
         logger.info(f"🚀 Initializing ZION Miner v{self.VERSION}")
@@ -121,12 +158,12 @@ class ZionMiner:
     async def _on_disconnect(self):
         """Called when disconnected from pool"""
         logger.warning("❌ Disconnected from pool")
-        # TODO: Implement auto-reconnect
+        # PoolClient reconnects on its own (exponential backoff + jitter)
     
     async def _on_new_job(self, job: MiningJob):
         """Called when new job received"""
         self.current_job = job
-        logger.info(f"📦 New job: {job.job_id} | height={job.height} | diff={job.difficulty}")
+        logger.info("📦 New job: %s | height=%s | diff=%s", job.job_id, job.height, job.difficulty)
     
     async def _mining_worker(self, worker_id: int):
         """
@@ -138,7 +175,12 @@ class ZionMiner:
         logger.info(f"⚙️  Worker {worker_id} started")
         
         nonce = worker_id  # Start nonce
-        nonce_step = self.config.threads * self.config.intensity
+        nonce_step = self.config.threads
+        batch = self.config.batch_size * self.config.intensity
+        algorithm = self.config.algorithm
+        scan = self.algo_engine.scan_nonces
+        hash_counts = self._hash_counts
+        loop = asyncio.get_running_loop()
         
         while self.running:
             job = self.current_job
@@ -147,99 +189,48 @@ class ZionMiner:
                 await asyncio.sleep(0.1)
                 continue
             
-            # Mine multiple nonces per iteration (intensity)
-            for _ in range(self.config.intensity):
-                if not self.running or job != self.current_job:
-                    break
+            try:
+                # One call hashes the whole batch (nonce patched in place),
+                # in a worker thread so the event loop keeps serving the pool
+                done, found_nonce, hash_result = await loop.run_in_executor(
+                    self._executor, scan, algorithm, job.blob, nonce, batch, job.target_int, nonce_step
+                )
+            except Exception as e:
+                logger.error(f"❌ Mining error: {e}")
+                await asyncio.sleep(1)
+                continue
+            
+            hash_counts[worker_id] += done
+            nonce = (nonce + done * nonce_step) & 0xFFFFFFFF
+            
+            if found_nonce is not None and job is self.current_job:
+                logger.info("💎 Found share! Nonce: %08x", found_nonce)
                 
+                # Queue share for _share_submitter
                 try:
-                    # Apply nonce to blob for hashing (XMRig style for RandomX)
-                    blob_for_hash = self._apply_nonce_to_blob(job.blob, f"{nonce:08x}")
-                    
-                    # Compute hash
-                    hash_result = self.algo_engine.hash(
-                        self.config.algorithm,
-                        bytes.fromhex(blob_for_hash),
-                        0  # Nonce already applied to blob
-                    )
-                    
-                    self.total_hashes += 1
-                    
-                    # Check if hash meets target
-                    if self._check_target(hash_result, job.target):
-                        logger.info(f"💎 Found share! Nonce: {nonce:08x}")
-                        
-                        # Submit share
-                        await self.pool_client.submit_share(
-                            job_id=job.job_id,
-                            nonce=f"{nonce:08x}",
-                            result=hash_result
-                        )
-                        
-                        # Record in metrics
-                        self.metrics.record_share(
-                            accepted=True,  # Will be updated when pool responds
-                            difficulty=job.difficulty
-                        )
-                    
-                    # Increment nonce
-                    nonce += nonce_step
-                    
-                except Exception as e:
-                    logger.error(f"❌ Mining error: {e}")
-                    await asyncio.sleep(1)
-            
-            # Yield control periodically
-            await asyncio.sleep(0)
+                    self._share_queue.put_nowait({
+                        "job_id": job.job_id,
+                        "nonce": f"{found_nonce:08x}",
+                        "result": hash_result.hex(),
+                    })
+                except asyncio.QueueFull:
+                    logger.warning("⚠️  Share queue full, dropping share %08x", found_nonce)
+                
+                # Record in metrics
+                self.metrics.record_share(
+                    accepted=True,  # Will be updated when pool responds
+                    difficulty=job.difficulty
+                )
         
         logger.info(f"⚙️  Worker {worker_id} stopped")
     
-    def _apply_nonce_to_blob(self, blob: str, nonce: str) -> str:
-        """
-        Apply nonce to block blob (XMRig style)
-        
-        Args:
-            blob: Block blob hex
-            nonce: Nonce hex (8 chars)
-            
-        Returns:
-            Blob with nonce applied
-        """
-        if len(nonce) != 8:
-            raise ValueError(f"Nonce must be 8 hex chars, got {len(nonce)}")
-        
-        if len(blob) < 84:  # Need at least 42 bytes
-            raise ValueError(f"Blob too short: {len(blob)} chars")
-        
-        # Nonce position: byte 39 = hex char 78
-        nonce_pos = 78
-        
-        # Replace nonce in blob
-        blob_with_nonce = (
-            blob[:nonce_pos] +
-            nonce +
-            blob[nonce_pos + 8:]
-        )
-        
-        return blob_with_nonce
-    
-    def _check_target(self, hash_hex: str, target_hex: str) -> bool:
-        """
-        Check if hash meets target difficulty
-        
-        Args:
-            hash_hex: Hash hex string
-            target_hex: Target hex string
-            
-        Returns:
-            True if hash <= target
-        """
-        try:
-            hash_int = int(hash_hex, 16)
-            target_int = int(target_hex, 16)
-            return hash_int <= target_int
-        except ValueError:
-            return False
+    async def _share_submitter(self):
+        """Send queued shares to the pool, in the order they were found"""
+        queue = self._share_queue
+        while self.running:
+            share = await queue.get()
+            await self.pool_client.submit_share(**share)
+            queue.task_done()
     
     async def _metrics_loop(self):
         """Background metrics update loop"""
@@ -274,6 +265,15 @@ class ZionMiner:
         
         self.running = True
         
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.threads,
+            thread_name_prefix="zion-hash",
+            initializer=self._init_hash_thread
+        )
+        
+        self._share_queue = asyncio.Queue(maxsize=SHARE_QUEUE_SIZE)
+        self._tasks.append(asyncio.create_task(self._share_submitter()))
+        
         # Start mining workers
         for i in range(self.config.threads):
             task = asyncio.create_task(self._mining_worker(i))
@@ -307,6 +307,11 @@ class ZionMiner:
         # Wait for tasks to finish
         await asyncio.gather(*self._tasks, return_exceptions=True)
         
+        # Batches already running finish in the background
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        
         # Stop pool client
         if self.pool_client:
             await self.pool_client.stop()
@@ -321,6 +326,17 @@ class ZionMiner:
         logger.info("✅ Miner stopped")
 
 
+def use_uvloop() -> bool:
+    """Switch asyncio to uvloop when installed; call before asyncio.run()"""
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 # CLI entry point
 async def main():
     """Main entry point for CLI"""
@@ -354,4 +370,5 @@ if __name__ == "__main__":
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    use_uvloop()
     asyncio.run(main())
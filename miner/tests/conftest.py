@@ -0,0 +1,5 @@
+import os
+import sys
+
+# src layout: make zion_miner importable without installing the package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
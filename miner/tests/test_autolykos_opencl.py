@@ -0,0 +1,137 @@
+"""
+Autolykos OpenCL helper: concurrent hashing through one shared instance
+
+pyopencl is replaced by a host-memory stand-in whose kernel hashes
+sha256(input || nonce_le32). Mapped READ regions are host copies that are
+scribbled over on release, so reading a result after another thread's
+dispatch unmapped it shows up as a wrong digest.
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from zion_miner import algorithms_registry
+from zion_miner.algorithms import autolykos_opencl
+from zion_miner.algorithms.autolykos_opencl import AutolykosOpenCL
+
+THREADS = 8
+ROUNDS = 25
+
+
+class FakeBuffer:
+    def __init__(self, ctx, flags, size):
+        self.data = np.zeros(size, dtype=np.uint8)
+
+
+class FakeMapping(np.ndarray):
+    """Host-side copy of a mapped region; release() writes back / unmaps it"""
+
+    def release(self, queue):
+        if self.writable_map:
+            self.buffer.data[self.offset : self.offset + self.nbytes] = self.view(np.uint8).reshape(-1)
+        self.view(np.uint8)[:] = 0xEE
+
+
+def fake_enqueue_map_buffer(queue, buf, flags, offset, shape, dtype):
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    host = buf.data[offset : offset + nbytes].copy().view(dtype).reshape(shape)
+    mapping = host.view(FakeMapping)
+    mapping.buffer, mapping.offset = buf, offset
+    mapping.writable_map = flags != FakeCL.map_flags.READ
+    return mapping[...], None
+
+
+def fake_enqueue_copy(queue, dst, src, is_blocking=True):
+    if isinstance(dst, FakeBuffer):
+        raw = np.ascontiguousarray(src).view(np.uint8).reshape(-1)
+        dst.data[: len(raw)] = raw
+    else:
+        time.sleep(0)
+        dst.view(np.uint8)[:] = src.data[: dst.nbytes]
+
+
+def fake_kernel(queue, gsize, lsize, d_input, input_len, d_nonces, d_output, count):
+    data = d_input.data[: int(input_len)].tobytes()
+    nonces = d_nonces.data[: int(count) * 4].view("<u4")
+    for i, nonce in enumerate(nonces):
+        d_output.data[i * 32 : (i + 1) * 32] = np.frombuffer(
+            hashlib.sha256(data + int(nonce).to_bytes(4, "little")).digest(), dtype=np.uint8
+        )
+        time.sleep(0)
+
+
+class FakeCL:
+    mem_flags = SimpleNamespace(READ_ONLY=1, WRITE_ONLY=2, READ_WRITE=4, ALLOC_HOST_PTR=8)
+    map_flags = SimpleNamespace(READ=1, WRITE=2, WRITE_INVALIDATE_REGION=4)
+    Buffer = FakeBuffer
+    Context = staticmethod(lambda devices: object())
+    CommandQueue = staticmethod(lambda ctx: object())
+    enqueue_copy = staticmethod(fake_enqueue_copy)
+    enqueue_map_buffer = staticmethod(fake_enqueue_map_buffer)
+
+    def __init__(self, unified):
+        device = SimpleNamespace(name="fake", host_unified_memory=unified)
+        platform = SimpleNamespace(get_devices=lambda: [device])
+        self.get_platforms = lambda: [platform]
+        program = SimpleNamespace(autolykos_kernel=fake_kernel)
+        self.Program = lambda ctx, src: SimpleNamespace(build=lambda: program)
+
+
+def expected(data, nonces):
+    return [hashlib.sha256(data + n.to_bytes(4, "little")).digest() for n in nonces]
+
+
+@pytest.fixture(params=[False, True], ids=["pinned", "zero-copy"])
+def gpu(request, monkeypatch):
+    fake = FakeCL(unified=request.param)
+    monkeypatch.setattr(autolykos_opencl, "cl", fake)
+    monkeypatch.setattr(autolykos_opencl, "_MAP_WRITE_DISCARD", fake.map_flags.WRITE_INVALIDATE_REGION)
+    instance = AutolykosOpenCL(max_batch=64)
+    assert instance.zero_copy is request.param
+    monkeypatch.setattr(algorithms_registry, "_get_autolykos_gpu", lambda: instance)
+    return instance
+
+
+def run_threads(work):
+    barrier = threading.Barrier(THREADS)
+
+    def worker(tid):
+        barrier.wait()
+        return [work(tid, r) for r in range(ROUNDS)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        return list(pool.map(worker, range(THREADS)))
+
+
+def job(tid):
+    return bytes([tid]) * (40 + tid)
+
+
+def test_single_threaded_matches_reference(gpu):
+    nonces = list(range(100, 200))  # spans two max_batch chunks
+    assert gpu.hash_batch(job(1), nonces) == expected(job(1), nonces)
+    if gpu.zero_copy:
+        assert gpu._output_map is None  # unmapped once copied out
+    assert algorithms_registry.get_hash_bytes("autolykos_v2", job(2), 5) == expected(job(2), [5])[0]
+
+
+def test_concurrent_batches_match_single_threaded(gpu):
+    nonces = lambda tid, r: [tid * 1000 + r * 10 + k for k in range(10)]
+    single = [[gpu.hash_batch(job(t), nonces(t, r)) for r in range(ROUNDS)] for t in range(THREADS)]
+    results = run_threads(lambda tid, r: algorithms_registry.autolykos_v2_hash_batch(job(tid), nonces(tid, r)))
+    assert results == single
+
+
+def test_concurrent_single_nonce_hashes_match_single_threaded(gpu):
+    single = [
+        [algorithms_registry.get_hash_bytes("autolykos_v2", job(t), t * 100 + r) for r in range(ROUNDS)]
+        for t in range(THREADS)
+    ]
+    results = run_threads(lambda tid, r: algorithms_registry.get_hash_bytes("autolykos_v2", job(tid), tid * 100 + r))
+    assert results == single
@@ -0,0 +1,54 @@
+"""
+PoolClient receive framing: newline-split messages and the line-length cap
+"""
+
+import asyncio
+
+from zion_miner.network import MAX_LINE, PoolClient
+
+
+def recv_all(*chunks):
+    """Feed chunks (then EOF) to a client and collect _recv_json() results"""
+
+    async def run():
+        client = PoolClient("localhost", 0, "wallet")
+        client.reader = asyncio.StreamReader()
+        client.connected = True
+        for chunk in chunks:
+            client.reader.feed_data(chunk)
+        client.reader.feed_eof()
+        out = []
+        while True:
+            msg = await client._recv_json()
+            if msg is None:
+                return out, client
+            out.append(msg)
+
+    return asyncio.run(run())
+
+
+def test_messages_split_and_batched_across_reads():
+    msgs, client = recv_all(b'{"id": 1}\n{"id"', b': 2}\n{"id": 3}\n')
+    assert msgs == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert client.connected
+
+
+def test_line_at_limit_is_accepted():
+    pad = "x" * (MAX_LINE - len('{"p": ""}'))
+    msgs, client = recv_all(f'{{"p": "{pad}"}}'.encode() + b"\n")
+    assert msgs == [{"p": pad}]
+
+
+def test_overlong_line_drops_connection():
+    # Newline arrives in the same read as the bytes past the limit
+    msgs, client = recv_all(b'{"id": 1}\n', b"x" * (MAX_LINE + 1), b'\n{"id": 2}\n')
+    assert msgs == [{"id": 1}]
+    assert not client.connected
+    assert len(client._rx_buf) == 0
+
+
+def test_overlong_line_without_newline_drops_connection():
+    msgs, client = recv_all(b"x" * (3 * MAX_LINE))
+    assert msgs == []
+    assert not client.connected
+    assert len(client._rx_buf) == 0
@@ -0,0 +1,141 @@
+"""
+scan_nonces regression tests: byte-wise target compare at boundary targets
+"""
+
+import ctypes
+import hashlib
+
+import pytest
+
+from zion_miner import algorithms_registry
+from zion_miner.algorithms_registry import BLOB_NONCE_OFFSET, get_hash_bytes, scan_nonces
+
+ALGO = "randomx"
+BLOB = bytes(range(76))
+COUNT = 16
+
+
+def reference_digests(nonce_start, count, step=1):
+    """(nonce, digest) per scanned nonce, hashed one blob at a time"""
+    out = []
+    buf = bytearray(BLOB)
+    nonce = nonce_start & 0xFFFFFFFF
+    for _ in range(count):
+        buf[BLOB_NONCE_OFFSET:BLOB_NONCE_OFFSET + 4] = nonce.to_bytes(4, "big")
+        out.append((nonce, get_hash_bytes(ALGO, bytes(buf), 0)))
+        nonce = (nonce + step) & 0xFFFFFFFF
+    return out
+
+
+def reference_scan(digests, target):
+    """First (hashes_done, nonce, digest) with int(digest) <= target"""
+    for k, (nonce, digest) in enumerate(digests):
+        if int.from_bytes(digest, "big") <= target:
+            return k + 1, nonce, digest
+    return len(digests), None, None
+
+
+@pytest.fixture(scope="module")
+def digests():
+    return reference_digests(1000, COUNT)
+
+
+def test_target_equal_to_smallest_digest_hits_it(digests):
+    k_min = min(range(COUNT), key=lambda k: digests[k][1])
+    target = int.from_bytes(digests[k_min][1], "big")
+    assert scan_nonces(ALGO, BLOB, 1000, COUNT, target) == (k_min + 1, *digests[k_min])
+
+
+def test_target_just_below_smallest_digest_misses(digests):
+    target = min(int.from_bytes(d, "big") for _, d in digests) - 1
+    assert scan_nonces(ALGO, BLOB, 1000, COUNT, target) == (COUNT, None, None)
+
+
+@pytest.mark.parametrize("target", [-1, -(1 << 300), 0, 1, (1 << 255), (1 << 256) - 1, 1 << 256, 1 << 300])
+def test_boundary_targets_match_integer_compare(digests, target):
+    assert scan_nonces(ALGO, BLOB, 1000, COUNT, target) == reference_scan(digests, target)
+
+
+def test_target_at_each_digest_matches_integer_compare(digests):
+    for _, digest in digests:
+        target = int.from_bytes(digest, "big")
+        assert scan_nonces(ALGO, BLOB, 1000, COUNT, target) == reference_scan(digests, target)
+
+
+def test_nonce_wraps_at_32_bits():
+    start, step = 0xFFFFFFFE, 3
+    digests = reference_digests(start, 4, step)
+    assert [n for n, _ in digests] == [0xFFFFFFFE, 1, 4, 7]
+    target = int.from_bytes(digests[2][1], "big")
+    expected = reference_scan(digests, target)
+    assert scan_nonces(ALGO, BLOB, start, 4, target, nonce_step=step) == expected
+
+
+def test_empty_and_short_inputs():
+    assert scan_nonces(ALGO, BLOB, 0, 0, 1 << 256) == (0, None, None)
+    with pytest.raises(ValueError):
+        scan_nonces(ALGO, BLOB[:BLOB_NONCE_OFFSET + 3], 0, 1, 1 << 256)
+
+
+
+class FakeRandomX:
+    """librandomx pipelined API stand-in: hash = sha256(input)
+
+    Like the real library, _next/_last return the hash of the input passed
+    to the *previous* _first/_next call.
+    """
+
+    def __init__(self):
+        self.pending = None
+        self.calls = 0
+
+    def randomx_calculate_hash_first(self, vm, data, size):
+        self.pending = bytes(data[:size])
+
+    def randomx_calculate_hash_next(self, vm, data, size, out):
+        out.raw = hashlib.sha256(self.pending).digest()
+        self.pending = bytes(data[:size])
+        self.calls += 1
+
+    def randomx_calculate_hash_last(self, vm, out):
+        out.raw = hashlib.sha256(self.pending).digest()
+        self.pending = None
+        self.calls += 1
+
+
+@pytest.fixture
+def fake_randomx(monkeypatch):
+    lib = FakeRandomX()
+    out = ctypes.create_string_buffer(32)
+    monkeypatch.setattr(algorithms_registry, "_RX_LIB", lib)
+    monkeypatch.setattr(algorithms_registry, "_randomx_thread_vm", lambda: (1, out))
+    return lib
+
+
+def sha256_digests(nonce_start, count, step=1):
+    out = []
+    buf = bytearray(BLOB)
+    nonce = nonce_start & 0xFFFFFFFF
+    for _ in range(count):
+        buf[BLOB_NONCE_OFFSET:BLOB_NONCE_OFFSET + 4] = nonce.to_bytes(4, "big")
+        out.append((nonce, hashlib.sha256(bytes(buf)).digest()))
+        nonce = (nonce + step) & 0xFFFFFFFF
+    return out
+
+
+def test_pipelined_native_path_matches_per_nonce_hashing(fake_randomx):
+    start, step = 0xFFFFFFF9, 2  # wraps mid-batch
+    digests = sha256_digests(start, COUNT, step)
+    targets = [-1, 0, (1 << 256) - 1] + [int.from_bytes(d, "big") for _, d in digests]
+    for target in targets:
+        fake_randomx.calls = 0
+        result = scan_nonces(ALGO, BLOB, start, COUNT, target, nonce_step=step)
+        assert result == reference_scan(digests, target)
+        # One hash read back per nonce scanned, no extra pipeline stage
+        assert fake_randomx.calls == result[0]
+
+
+def test_pipelined_native_path_single_nonce(fake_randomx):
+    (nonce, digest), = sha256_digests(7, 1)
+    assert scan_nonces(ALGO, BLOB, 7, 1, 1 << 256) == (1, nonce, digest)
+    assert scan_nonces(ALGO, BLOB, 7, 1, -1) == (1, None, None)
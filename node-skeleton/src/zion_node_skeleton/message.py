@@ -3,7 +3,35 @@ from __future__ import annotations
 import json
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Union
+
+# Optional fast JSON codec (falls back to stdlib json)
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# encode_json() uses the same codec and settings as NetworkMessage.to_line(),
+# so pre-encoded fragments splice into byte-identical frames.
+if orjson is not None:
+
+    def encode_json(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def _dumps_line(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+
+else:
+
+    def encode_json(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def _dumps_line(payload: Dict[str, Any]) -> bytes:
+        return (json.dumps(payload, separators=(",", ":")) + "\n").encode()
+
+    _loads = json.loads
 
 
 @dataclass
@@ -13,15 +41,19 @@ class NetworkMessage:
     timestamp: float = field(default_factory=time.time)
     sender: str = ""
 
-    def to_json(self) -> str:
-        return json.dumps(
-            {"type": self.type, "data": self.data, "timestamp": self.timestamp, "sender": self.sender},
-            separators=(",", ":"),
+    def to_line(self) -> bytes:
+        """Encode as one newline-terminated wire frame."""
+        return _dumps_line(
+            {"type": self.type, "data": self.data, "timestamp": self.timestamp, "sender": self.sender}
         )
 
+    def to_json(self) -> str:
+        return self.to_line()[:-1].decode()
+
     @classmethod
-    def from_json(cls, raw: str) -> "NetworkMessage":
-        payload = json.loads(raw)
+    def from_json(cls, raw: Union[str, bytes]) -> "NetworkMessage":
+        # Both codecs take bytes directly and ignore surrounding whitespace
+        payload = _loads(raw)
         return cls(
             type=payload["type"],
             data=payload.get("data", {}),
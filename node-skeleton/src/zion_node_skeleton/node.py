@@ -3,15 +3,20 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import math
 import socket
 import time
 from typing import Optional
 
-from .message import NetworkMessage
+from .message import NetworkMessage, encode_json
 from .peer_store import PeerStore
 
 logger = logging.getLogger(__name__)
 
+# Outgoing frames are only awaited through drain() once this many bytes are
+# queued in the transport; smaller writes are flushed by the event loop.
+WRITE_BUFFER_HIGH = 64 * 1024
+
 
 class Node:
     def __init__(
@@ -28,6 +33,32 @@ class Node:
         self._server: Optional[asyncio.base_events.Server] = None
         self._running = False
 
+        # Handshake/pong/peers frames only differ in their timestamps, port and
+        # peer list: encode the constant parts once, in NetworkMessage.to_line
+        # field order.
+        sender = encode_json(self.node_id).replace(b"%", b"%%")
+        self._handshake_fmt = (
+            b'{"type":"handshake","data":{"node_id":' + sender
+            + b',"version":"2.9.0","timestamp":%d,"port":%d},"timestamp":%r,"sender":' + sender + b"}\n"
+        )
+        self._pong_fmt = b'{"type":"pong","data":{"timestamp":%r},"timestamp":%r,"sender":' + sender + b"}\n"
+        self._peers_fmt = b'{"type":"peers","data":{"peers":%b},"timestamp":%r,"sender":' + sender + b"}\n"
+
+    def _handshake_line(self) -> bytes:
+        now = time.time()
+        return self._handshake_fmt % (now, self.port, now)
+
+    def _pong_line(self, ping_timestamp: object) -> bytes:
+        if type(ping_timestamp) not in (int, float) or not math.isfinite(ping_timestamp):
+            # Peer-supplied value of another JSON type: full encoder
+            return NetworkMessage(
+                type="pong", data={"timestamp": ping_timestamp}, sender=self.node_id
+            ).to_line()
+        return self._pong_fmt % (ping_timestamp, time.time())
+
+    def _peers_line(self) -> bytes:
+        return self._peers_fmt % (self.peers.as_json(), time.time())
+
     async def start(self) -> None:
         self._running = True
         self._server = await asyncio.start_server(self._handle_conn, self.host, self.port)
@@ -46,12 +77,7 @@ class Node:
             self.peers.upsert(host, port)
 
             # send handshake
-            msg = NetworkMessage(
-                type="handshake",
-                data={"node_id": self.node_id, "version": "2.9.0", "timestamp": int(time.time()), "port": self.port},
-                sender=self.node_id,
-            )
-            writer.write((msg.to_json() + "\n").encode())
+            writer.write(self._handshake_line())
             await writer.drain()
 
             asyncio.create_task(self._listen(reader, writer, peer=f"{host}:{port}"))
@@ -70,10 +96,9 @@ class Node:
                 line = await reader.readline()
                 if not line:
                     break
-                raw = line.decode(errors="replace").strip()
-                if not raw:
+                if line.isspace():
                     continue
-                msg = NetworkMessage.from_json(raw)
+                msg = NetworkMessage.from_json(line)
                 await self._dispatch(msg, peer, writer)
         except Exception as e:
             logger.debug("listen_error", extra={"peer": peer, "error": str(e)})
@@ -89,9 +114,9 @@ class Node:
         if msg.type == "handshake":
             await self._on_handshake(msg, peer, writer)
         elif msg.type == "ping":
-            await self._send(writer, NetworkMessage(type="pong", data={"timestamp": msg.timestamp}, sender=self.node_id))
+            await self._write(writer, self._pong_line(msg.timestamp))
         elif msg.type == "get_peers":
-            await self._send(writer, NetworkMessage(type="peers", data={"peers": self.peers.as_dicts()}, sender=self.node_id))
+            await self._write(writer, self._peers_line())
         elif msg.type == "peers":
             self.peers.merge(msg.data.get("peers", []))
         # unknown types are ignored in the skeleton
@@ -106,16 +131,16 @@ class Node:
             pass
 
         # reply basic handshake
-        reply = NetworkMessage(
-            type="handshake",
-            data={"node_id": self.node_id, "version": "2.9.0", "timestamp": int(time.time()), "port": self.port},
-            sender=self.node_id,
-        )
-        await self._send(writer, reply)
+        await self._write(writer, self._handshake_line())
 
     async def _send(self, writer: asyncio.StreamWriter, msg: NetworkMessage) -> None:
-        writer.write((msg.to_json() + "\n").encode())
-        await writer.drain()
+        await self._write(writer, msg.to_line())
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, frame: bytes) -> None:
+        writer.write(frame)
+        if writer.transport.get_write_buffer_size() > WRITE_BUFFER_HIGH:
+            await writer.drain()
 
 
 def _parse_seed(seed: str) -> tuple[str, int]:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional
+
+from .message import encode_json
 
 
 @dataclass
@@ -19,22 +22,70 @@ class Peer:
 class PeerStore:
     def __init__(self, max_peers: int = 50):
         self.max_peers = max_peers
-        self._peers: Dict[str, Peer] = {}
+        # Struct-of-arrays: peer i is (_hosts[i], _ports[i], _last_seen[i]);
+        # _idx maps "host:port" to i. Peers are never removed.
+        self._idx: Dict[str, int] = {}
+        self._hosts: List[str] = []
+        self._ports = array("H")
+        self._last_seen = array("d")
+        # Last as_dicts()/as_json() results; dropped when a new peer is added.
+        self._dicts_cache: Optional[List[dict]] = None
+        self._json_cache: Optional[bytes] = None
+
+    def _upsert(self, host: str, port: int, now: float) -> bool:
+        """Insert or refresh a peer; True if a new peer was added."""
+        addr = f"{host}:{port}"
+        i = self._idx.get(addr)
+        if i is not None:
+            self._last_seen[i] = now
+            return False
+        if len(self._hosts) >= self.max_peers:
+            return False
+        self._ports.append(port)  # OverflowError for ports outside 0..65535
+        self._idx[addr] = len(self._hosts)
+        self._hosts.append(host)
+        self._last_seen.append(now)
+        return True
 
     def upsert(self, host: str, port: int) -> None:
-        if len(self._peers) >= self.max_peers and f"{host}:{port}" not in self._peers:
-            return
-        self._peers[f"{host}:{port}"] = Peer(host=host, port=port)
+        if self._upsert(host, port, time.time()):
+            self._invalidate()
 
     def list(self) -> List[Peer]:
-        return list(self._peers.values())
+        return [
+            Peer(host=h, port=p, last_seen=t)
+            for h, p, t in zip(self._hosts, self._ports, self._last_seen)
+        ]
 
     def as_dicts(self) -> List[dict]:
-        return [{"host": p.host, "port": p.port} for p in self._peers.values()]
+        """Peers as ``{"host", "port"}`` dicts (cached; treat as read-only)."""
+        cached = self._dicts_cache
+        if cached is None:
+            self._dicts_cache = cached = [
+                {"host": h, "port": p} for h, p in zip(self._hosts, self._ports)
+            ]
+        return cached
+
+    def as_json(self) -> bytes:
+        """as_dicts() encoded as a compact UTF-8 JSON array (cached)."""
+        cached = self._json_cache
+        if cached is None:
+            self._json_cache = cached = encode_json(self.as_dicts())
+        return cached
 
     def merge(self, peers: List[dict]) -> None:
+        now = time.time()
+        added = False
         for p in peers:
             host = p.get("host")
             port = p.get("port")
             if host and port:
-                self.upsert(str(host), int(port))
+                port = int(port)
+                if 0 < port < 65536:
+                    added |= self._upsert(str(host), port, now)
+        if added:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._dicts_cache = None
+        self._json_cache = None
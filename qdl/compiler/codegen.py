@@ -7,110 +7,204 @@ Generate executable quantum circuit from AST.
 Transforms AST into actual quantum operations using our simulator.
 """
 
+import functools
+import operator
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+import numpy as np
+
 from compiler.parser import *
-from simulator.qubit import QubitRegister
+from simulator.qubit import QubitRegister, CompactQubitRegister
 from simulator.gates import *
 from simulator.measurement import measure, measure_all
 
 
+# Opcodes of the flat instruction list produced by CodeGenerator.compile().
+# Every instruction is a tuple (opcode, *args) dispatched as handler(*args).
+OP_ECHO = 0      # (OP_ECHO, text)
+OP_MEASURE = 1   # (OP_MEASURE, register, index, classical_bit, qubit_name)
+OP_IF = 2        # (OP_IF, compare, left_name, right_value, operator, body)
+OP_FOR = 3       # (OP_FOR, variable, range, body)
+OP_FUSED_FOR = 4 # (OP_FUSED_FOR, variable, range, messages, [(register, index, U^N), ...])
+OP_U2 = 5        # (OP_U2, register, matrix, index) -- adjacent gates on one qubit, fused
+OP_H = 10        # (OP_H, register, index) -- likewise X, Y, Z, S, T
+OP_X = 11
+OP_Y = 12
+OP_Z = 13
+OP_S = 14
+OP_T = 15
+OP_CNOT = 20     # (OP_CNOT, register, index1, index2) -- likewise CZ, SWAP
+OP_CZ = 21
+OP_SWAP = 22
+
+SINGLE_QUBIT_OPS = {'H': OP_H, 'X': OP_X, 'Y': OP_Y, 'Z': OP_Z, 'S': OP_S, 'T': OP_T}
+TWO_QUBIT_OPS = {'CNOT': OP_CNOT, 'CZ': OP_CZ, 'SWAP': OP_SWAP}
+
+GATE_HANDLERS = {
+    OP_H: hadamard,
+    OP_X: pauli_x,
+    OP_Y: pauli_y,
+    OP_Z: pauli_z,
+    OP_S: s_gate,
+    OP_T: t_gate,
+    OP_CNOT: cnot,
+    OP_CZ: cz,
+    OP_SWAP: swap,
+}
+
+GATE_MATRICES = {
+    OP_H: HADAMARD,
+    OP_X: PAULI_X,
+    OP_Y: PAULI_Y,
+    OP_Z: PAULI_Z,
+    OP_S: S_GATE,
+    OP_T: T_GATE,
+}
+
+
+
+@functools.lru_cache(maxsize=256)
+def fused_gate_matrix(ops: tuple) -> np.ndarray:
+    """Product of the single-qubit gate opcodes in ops, first applied first"""
+    matrix = GATE_MATRICES[ops[0]]
+    for op in ops[1:]:
+        matrix = GATE_MATRICES[op] @ matrix
+    matrix.flags.writeable = False  # shared between all users of the cache
+    return matrix
+
+
+COMPARISONS = {
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
 class CodeGenerator:
     """
     Generate executable code from AST
+    
+    The AST is lowered once by compile() into a flat list of
+    (opcode, *args) tuples with qubit names already resolved to
+    (register, index); execute() then just dispatches through a table.
     """
     
-    def __init__(self):
+    def __init__(self, compact_state: bool = False):
+        # compact_state: store amplitudes as bfloat16 pairs (needs ml_dtypes)
+        self.register_class = CompactQubitRegister if compact_state else QubitRegister
         self.qubits = {}  # name -> (register, index)
         self.registers = {}  # name -> QubitRegister
         self.classical_bits = {}  # name -> value
+        self.handlers = {
+            **GATE_HANDLERS,
+            OP_ECHO: print,
+            OP_MEASURE: self.execute_measurement,
+            OP_IF: self.execute_if,
+            OP_FOR: self.execute_for,
+            OP_FUSED_FOR: self.execute_fused_for,
+            OP_U2: apply_single_qubit_gate,
+        }
     
     def generate(self, program: Program):
-        """Execute program"""
+        """Compile and execute program"""
+        code = self.compile(program)
+        
         print(f"\n🚀 Executing program: {program.name}")
         print("=" * 60)
         
-        for statement in program.statements:
-            self.execute_statement(statement)
+        self.execute(code)
         
         print("\n✅ Program completed!")
     
-    def execute_statement(self, stmt: ASTNode):
-        """Execute single statement"""
-        
-        if isinstance(stmt, QubitDeclaration):
-            self.execute_qubit_declaration(stmt)
-        
-        elif isinstance(stmt, GateApplication):
-            self.execute_gate_application(stmt)
-        
-        elif isinstance(stmt, Measurement):
-            self.execute_measurement(stmt)
-        
-        elif isinstance(stmt, IfStatement):
-            self.execute_if_statement(stmt)
-        
-        elif isinstance(stmt, ForLoop):
-            self.execute_for_loop(stmt)
+    # ------------------------------------------------------------------
+    # Compilation (AST -> instruction list)
+    # ------------------------------------------------------------------
+    
+    def compile(self, program: Program) -> list:
+        """Lower program into a list of (opcode, *args) instructions"""
+        return self.compile_block(program.statements)
+    
+    def compile_block(self, statements) -> list:
+        """Lower a statement list"""
+        code = []
+        for stmt in statements:
+            compile_fn = self._compilers.get(type(stmt))
+            if compile_fn is not None:
+                compile_fn(self, stmt, code)
+        return self.fuse_adjacent_gates(code)
+    
+    def fuse_adjacent_gates(self, code: list) -> list:
+        """
+        Peephole pass: merge runs of single-qubit gates on the same qubit
         
-        elif isinstance(stmt, PrintStatement):
-            self.execute_print_statement(stmt)
+        Only OP_ECHO instructions may sit between gates of a run (messages
+        keep their order); a run becomes one OP_U2 with the cached product
+        matrix, saving a state-vector pass per merged gate.
+        """
+        fused = []
+        run = None  # (position in fused, register, index, opcodes)
+        for ins in code:
+            op = ins[0]
+            if op == OP_ECHO:
+                fused.append(ins)
+                continue
+            if op not in GATE_MATRICES:
+                run = None
+                fused.append(ins)
+                continue
+            
+            _, reg, idx = ins
+            if run is not None and run[1] is reg and run[2] == idx:
+                pos = run[0]
+                ops = run[3] + (op,)
+                fused[pos] = (OP_U2, reg, fused_gate_matrix(ops), idx)
+                run = (pos, reg, idx, ops)
+            else:
+                run = (len(fused), reg, idx, (op,))
+                fused.append(ins)
+        return fused
     
-    def execute_qubit_declaration(self, stmt: QubitDeclaration):
-        """Create qubit or register"""
+    def compile_qubit_declaration(self, stmt: QubitDeclaration, code: list):
+        """Create qubit or register (allocation happens at compile time)"""
         if stmt.size:
             # Quantum register
-            register = QubitRegister(stmt.size)
+            register = self.register_class(stmt.size)
             self.registers[stmt.name] = register
-            print(f"Created register: {stmt.name}[{stmt.size}]")
+            code.append((OP_ECHO, f"Created register: {stmt.name}[{stmt.size}]"))
         else:
-            # Single qubit - create shared register for entanglement
-            # (Hack: all single qubits share one register for demo)
-            if 'shared_register' not in self.registers:
-                self.registers['shared_register'] = QubitRegister(2)  # Support 2 qubits (Bell state)
-                self.registers['shared_register_next_idx'] = 0
-            
-            register = self.registers['shared_register']
-            idx = self.registers['shared_register_next_idx']
-            self.registers['shared_register_next_idx'] += 1
+            # Single qubit - all single qubits live in one 'global'
+            # register that grows by one qubit per declaration
+            register = self.registers.get('global')
+            if register is None:
+                register = self.registers['global'] = self.register_class(0)
+            idx = register.add_qubit()
             
             self.qubits[stmt.name] = (register, idx)
-            print(f"Created qubit: {stmt.name}")
+            code.append((OP_ECHO, f"Created qubit: {stmt.name}"))
             
             # Apply initial state if specified
             if stmt.initial_state == "|1⟩":
-                pauli_x(register, idx)
-                print(f"  Initialized to |1⟩")
+                code.append((OP_X, register, idx))
+                code.append((OP_ECHO, "  Initialized to |1⟩"))
             elif stmt.initial_state == "|+⟩":
-                hadamard(register, idx)
-                print(f"  Initialized to |+⟩")
+                code.append((OP_H, register, idx))
+                code.append((OP_ECHO, "  Initialized to |+⟩"))
     
-    def execute_gate_application(self, stmt: GateApplication):
-        """Apply quantum gate"""
+    def compile_gate_application(self, stmt: GateApplication, code: list):
+        """Lower gate to its opcode with pre-resolved (register, index)"""
         gate_name = stmt.gate_name
         targets = stmt.targets
         
-        print(f"Applying gate: {gate_name} on {', '.join(targets)}")
+        code.append((OP_ECHO, f"Applying gate: {gate_name} on {', '.join(targets)}"))
         
-        # Get target qubits
         if len(targets) == 1:
             # Single-qubit gate
             reg, idx = self.qubits[targets[0]]
-            
-            if gate_name == 'H':
-                hadamard(reg, idx)
-            elif gate_name == 'X':
-                pauli_x(reg, idx)
-            elif gate_name == 'Y':
-                pauli_y(reg, idx)
-            elif gate_name == 'Z':
-                pauli_z(reg, idx)
-            elif gate_name == 'S':
-                s_gate(reg, idx)
-            elif gate_name == 'T':
-                t_gate(reg, idx)
+            op = SINGLE_QUBIT_OPS.get(gate_name)
+            if op is not None:
+                code.append((op, reg, idx))
         
         elif len(targets) == 2:
             # Two-qubit gate
@@ -119,63 +213,130 @@ class CodeGenerator:
             
             # Now both should be in shared register
             if reg1 == reg2:
-                if gate_name == 'CNOT':
-                    cnot(reg1, idx1, idx2)
-                elif gate_name == 'CZ':
-                    cz(reg1, idx1, idx2)
-                elif gate_name == 'SWAP':
-                    swap(reg1, idx1, idx2)
+                op = TWO_QUBIT_OPS.get(gate_name)
+                if op is not None:
+                    code.append((op, reg1, idx1, idx2))
             else:
-                print("  ⚠️  Cross-register gates not yet supported")
+                code.append((OP_ECHO, "  ⚠️  Cross-register gates not yet supported"))
     
-    def execute_measurement(self, stmt: Measurement):
-        """Measure qubit"""
+    def compile_measurement(self, stmt: Measurement, code: list):
+        """Lower measurement"""
         reg, idx = self.qubits[stmt.qubit]
+        code.append((OP_MEASURE, reg, idx, stmt.classical_bit, stmt.qubit))
+    
+    def compile_if_statement(self, stmt: IfStatement, code: list):
+        """Lower if statement; the body becomes a nested instruction list"""
+        condition = stmt.condition
+        compare = COMPARISONS.get(condition.operator)
+        body = self.compile_block(stmt.then_body)
+        code.append((OP_IF, compare, condition.left, condition.right, condition.operator, body))
+    
+    def compile_for_loop(self, stmt: ForLoop, code: list):
+        """Lower for loop; the body is compiled once and run per iteration"""
+        code.append((OP_ECHO, f"For loop: {stmt.variable} in {stmt.start}..{stmt.end}"))
+        body = self.compile_block(stmt.body)
+        iterations = range(stmt.start, stmt.end + 1)
+        
+        fused = self.fuse_gate_loop(body, len(iterations))
+        if fused is not None:
+            messages = [ins[1] for ins in body if ins[0] == OP_ECHO]
+            code.append((OP_FUSED_FOR, stmt.variable, iterations, messages, fused))
+        else:
+            code.append((OP_FOR, stmt.variable, iterations, body))
+    
+    def fuse_gate_loop(self, body: list, repeat: int):
+        """
+        Fuse a loop of single-qubit gates into one matrix per qubit
+        
+        Gates on different qubits commute, so N iterations of the body
+        equal (G_k ... G_1)^N applied once to each target qubit.
+        Returns [(register, index, matrix), ...], or None when the body
+        has anything besides single-qubit gates (measurements, ifs,
+        two-qubit gates, nested loops) and must be interpreted.
+        """
+        products = {}  # (id(register), index) -> [register, index, product]
+        for ins in body:
+            op = ins[0]
+            if op == OP_ECHO:
+                continue
+            if op == OP_U2:
+                _, reg, gate, idx = ins
+            elif op in GATE_MATRICES:
+                _, reg, idx = ins
+                gate = GATE_MATRICES[op]
+            else:
+                return None
+            entry = products.get((id(reg), idx))
+            if entry is None:
+                products[(id(reg), idx)] = [reg, idx, gate]
+            else:
+                entry[2] = gate @ entry[2]
         
+        return [
+            (reg, idx, np.linalg.matrix_power(product, repeat))
+            for reg, idx, product in products.values()
+        ]
+    
+    def compile_print_statement(self, stmt: PrintStatement, code: list):
+        """Lower print"""
+        code.append((OP_ECHO, f"📝 {stmt.message}"))
+    
+    _compilers = {
+        QubitDeclaration: compile_qubit_declaration,
+        GateApplication: compile_gate_application,
+        Measurement: compile_measurement,
+        IfStatement: compile_if_statement,
+        ForLoop: compile_for_loop,
+        PrintStatement: compile_print_statement,
+    }
+    
+    # ------------------------------------------------------------------
+    # Execution (instruction list -> quantum operations)
+    # ------------------------------------------------------------------
+    
+    def execute(self, code: list):
+        """Run a compiled instruction list"""
+        handlers = self.handlers
+        for op, *args in code:
+            handlers[op](*args)
+    
+    def execute_measurement(self, reg, idx, classical_bit, qubit_name):
+        """Measure qubit"""
         # Measure (simplified - measure entire register)
         result = measure(reg, idx)
-        self.classical_bits[stmt.classical_bit] = result
+        self.classical_bits[classical_bit] = result
         
-        print(f"Measured {stmt.qubit} -> {stmt.classical_bit} = {result}")
+        print(f"Measured {qubit_name} -> {classical_bit} = {result}")
     
-    def execute_if_statement(self, stmt: IfStatement):
+    def execute_if(self, compare, left, right_value, operator_str, body):
         """Execute if statement"""
-        condition = stmt.condition
-        
-        # Evaluate condition
-        left_value = self.classical_bits.get(condition.left, 0)
-        right_value = condition.right
-        
-        if condition.operator == "==":
-            result = (left_value == right_value)
-        elif condition.operator == ">":
-            result = (left_value > right_value)
-        elif condition.operator == "<":
-            result = (left_value < right_value)
-        else:
-            result = False
+        left_value = self.classical_bits.get(left, 0)
+        result = compare(left_value, right_value) if compare else False
         
         if result:
-            print(f"If condition TRUE: {condition.left}={left_value} {condition.operator} {right_value}")
-            for s in stmt.then_body:
-                self.execute_statement(s)
+            print(f"If condition TRUE: {left}={left_value} {operator_str} {right_value}")
+            self.execute(body)
         else:
-            print(f"If condition FALSE: {condition.left}={left_value} {condition.operator} {right_value}")
+            print(f"If condition FALSE: {left}={left_value} {operator_str} {right_value}")
     
-    def execute_for_loop(self, stmt: ForLoop):
+    def execute_for(self, variable, iterations, body):
         """Execute for loop"""
-        print(f"For loop: {stmt.variable} in {stmt.start}..{stmt.end}")
-        
-        for i in range(stmt.start, stmt.end + 1):
+        classical_bits = self.classical_bits
+        execute = self.execute
+        for i in iterations:
             # Store loop variable (simplified)
-            self.classical_bits[stmt.variable] = i
-            
-            for s in stmt.body:
-                self.execute_statement(s)
+            classical_bits[variable] = i
+            execute(body)
     
-    def execute_print_statement(self, stmt: PrintStatement):
-        """Print message"""
-        print(f"📝 {stmt.message}")
+    def execute_fused_for(self, variable, iterations, messages, fused):
+        """Execute a gate-only loop: one pass per qubit instead of per gate"""
+        for i in iterations:
+            for message in messages:
+                print(message)
+        if len(iterations):
+            self.classical_bits[variable] = iterations[-1]
+            for reg, idx, unitary in fused:
+                apply_single_qubit_gate(reg, unitary, idx)
 
 
 # ============================================================================
@@ -223,7 +384,7 @@ end
     print(f"   AST root: {ast.name}")
     
     print("\n3. CODE GENERATOR: Executing...")
-    generator = CodeGenerator()
+    generator = CodeGenerator(compact_state="--fp16" in sys.argv[1:])
     generator.generate(ast)
     
     print("\n" + "=" * 60)
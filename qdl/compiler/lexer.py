@@ -15,109 +15,207 @@ Token types:
 - NEWLINE, INDENT, DEDENT
 """
 
+import functools
 import re
-from enum import Enum, auto
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from dataclasses import dataclass
 
 
-class TokenType(Enum):
-    """Token types for QDL language"""
+class TokenType:
+    """Token types for QDL language (plain int constants; see NAMES)"""
     
     # Keywords
-    QUBIT = auto()
-    QUREG = auto()
-    MEASURE = auto()
-    PEEK = auto()
-    IF = auto()
-    ELSE = auto()
-    FOR = auto()
-    WHILE = auto()
-    END = auto()
-    FUNCTION = auto()
-    RETURN = auto()
-    PROGRAM = auto()
-    PRINT = auto()
+    QUBIT = 1
+    QUREG = 2
+    MEASURE = 3
+    PEEK = 4
+    IF = 5
+    ELSE = 6
+    FOR = 7
+    WHILE = 8
+    END = 9
+    FUNCTION = 10
+    RETURN = 11
+    PROGRAM = 12
+    PRINT = 13
     
     # Quantum gates
-    H = auto()          # Hadamard
-    X = auto()          # Pauli-X
-    Y = auto()          # Pauli-Y
-    Z = auto()          # Pauli-Z
-    S = auto()          # S gate
-    T = auto()          # T gate
-    CNOT = auto()       # Controlled-NOT
-    CZ = auto()         # Controlled-Z
-    SWAP = auto()       # SWAP
-    TOFFOLI = auto()    # Controlled-controlled-NOT
-    RX = auto()         # Rotation-X
-    RY = auto()         # Rotation-Y
-    RZ = auto()         # Rotation-Z
+    H = 14          # Hadamard
+    X = 15          # Pauli-X
+    Y = 16          # Pauli-Y
+    Z = 17          # Pauli-Z
+    S = 18          # S gate
+    T = 19          # T gate
+    CNOT = 20       # Controlled-NOT
+    CZ = 21         # Controlled-Z
+    SWAP = 22       # SWAP
+    TOFFOLI = 23    # Controlled-controlled-NOT
+    RX = 24         # Rotation-X
+    RY = 25         # Rotation-Y
+    RZ = 26         # Rotation-Z
     
     # Algorithms
-    GROVER = auto()
-    QFT = auto()
-    IQFT = auto()
-    SHOR = auto()
+    GROVER = 27
+    QFT = 28
+    IQFT = 29
+    SHOR = 30
     
     # ZION-specific
-    ENTANGLE = auto()
-    COHERENCE = auto()
-    QUANTUM_PULSE = auto()
-    CONSCIOUSNESS_LEVEL = auto()
-    SACRED_FREQUENCY = auto()
+    ENTANGLE = 31
+    COHERENCE = 32
+    QUANTUM_PULSE = 33
+    CONSCIOUSNESS_LEVEL = 34
+    SACRED_FREQUENCY = 35
     
     # Literals
-    IDENTIFIER = auto()
-    NUMBER = auto()
-    QUANTUM_STATE = auto()  # |0⟩, |1⟩, etc.
-    STRING = auto()
+    IDENTIFIER = 36
+    NUMBER = 37
+    QUANTUM_STATE = 38  # |0⟩, |1⟩, etc.
+    STRING = 39
     
     # Operators
-    PLUS = auto()
-    MINUS = auto()
-    MULTIPLY = auto()
-    DIVIDE = auto()
-    ASSIGN = auto()
-    EQUAL = auto()
-    NOT_EQUAL = auto()
-    GREATER = auto()
-    LESS = auto()
-    GREATER_EQUAL = auto()
-    LESS_EQUAL = auto()
-    AND = auto()
-    OR = auto()
-    NOT = auto()
-    ARROW = auto()      # ->
-    AT = auto()         # @ (for miner assignment)
+    PLUS = 40
+    MINUS = 41
+    MULTIPLY = 42
+    DIVIDE = 43
+    ASSIGN = 44
+    EQUAL = 45
+    NOT_EQUAL = 46
+    GREATER = 47
+    LESS = 48
+    GREATER_EQUAL = 49
+    LESS_EQUAL = 50
+    AND = 51
+    OR = 52
+    NOT = 53
+    ARROW = 54      # ->
+    AT = 55         # @ (for miner assignment)
     
     # Separators
-    LPAREN = auto()
-    RPAREN = auto()
-    LBRACKET = auto()
-    RBRACKET = auto()
-    COMMA = auto()
-    COLON = auto()
-    DOT = auto()
-    RANGE = auto()      # ..
+    LPAREN = 56
+    RPAREN = 57
+    LBRACKET = 58
+    RBRACKET = 59
+    COMMA = 60
+    COLON = 61
+    DOT = 62
+    RANGE = 63      # ..
     
     # Structure
-    NEWLINE = auto()
-    INDENT = auto()
-    DEDENT = auto()
-    EOF = auto()
+    NEWLINE = 64
+    INDENT = 65
+    DEDENT = 66
+    EOF = 67
 
 
-@dataclass
+# Token type -> name, for messages and Token.__repr__
+TokenType.NAMES = {
+    value: name for name, value in vars(TokenType).items() if not name.startswith('_')
+}
+
+
+# Keywords mapping (looked up lowercased: keywords are case-insensitive)
+KEYWORDS = {
+    'qubit': TokenType.QUBIT,
+    'qureg': TokenType.QUREG,
+    'measure': TokenType.MEASURE,
+    'peek': TokenType.PEEK,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'for': TokenType.FOR,
+    'while': TokenType.WHILE,
+    'end': TokenType.END,
+    'function': TokenType.FUNCTION,
+    'return': TokenType.RETURN,
+    'program': TokenType.PROGRAM,
+    'print': TokenType.PRINT,
+    
+    # Gates (case-insensitive)
+    'h': TokenType.H,
+    'x': TokenType.X,
+    'y': TokenType.Y,
+    'z': TokenType.Z,
+    's': TokenType.S,
+    't': TokenType.T,
+    'cnot': TokenType.CNOT,
+    'cz': TokenType.CZ,
+    'swap': TokenType.SWAP,
+    'toffoli': TokenType.TOFFOLI,
+    'rx': TokenType.RX,
+    'ry': TokenType.RY,
+    'rz': TokenType.RZ,
+    
+    # Algorithms
+    'grover': TokenType.GROVER,
+    'qft': TokenType.QFT,
+    'iqft': TokenType.IQFT,
+    'shor': TokenType.SHOR,
+    
+    # ZION
+    'entangle': TokenType.ENTANGLE,
+    'coherence': TokenType.COHERENCE,
+    'quantum_pulse': TokenType.QUANTUM_PULSE,
+    'consciousness_level': TokenType.CONSCIOUSNESS_LEVEL,
+    'sacred_frequency': TokenType.SACRED_FREQUENCY,
+}
+
+# Master token pattern: blanks, then one named alternative per token class,
+# tried in order at each position by a single TOKEN_RE.match(). Identifiers
+# accept Unicode letters; an unterminated state or string runs to the end
+# of the source, and a NUL character ends the source as before.
+TOKEN_RE = re.compile(
+    r"[ \t]*(?:"
+    r"(?P<IDENT>[^\W\dπ]\w*)"
+    r"|(?P<NEWLINE>\n)"
+    r"|(?P<OP>->|==|\.\.|[-+*/=<>()\[\],:.@])"
+    r"|(?P<NUMBER>\d+(?:\.(?!\.)\d*)?|π)"
+    r"|(?P<COMMENT>#[^\n\0]*)"
+    r"|(?P<STATE>\|[^⟩\0]*⟩?)"
+    r"|(?P<STRING>\"[^\"\0]*\"?|'[^'\0]*'?)"
+    r")"
+)
+BLANKS_RE = re.compile(r"[ \t]*")
+
+# Operators and separators matched by the OP group
+OPERATORS = {
+    '->': TokenType.ARROW,
+    '==': TokenType.EQUAL,
+    '..': TokenType.RANGE,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '=': TokenType.ASSIGN,
+    '>': TokenType.GREATER,
+    '<': TokenType.LESS,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA,
+    ':': TokenType.COLON,
+    '.': TokenType.DOT,
+    '@': TokenType.AT,
+}
+
+
+@dataclass(slots=True)
 class Token:
     """A single token"""
-    type: TokenType
+    type: int  # TokenType constant
     value: any
     line: int
     column: int
     
+    def as_number(self):
+        """Numeric value of a NUMBER token (its value is the source text)"""
+        text = self.value
+        if text == 'π':
+            return 3.141592653589793
+        return float(text) if '.' in text else int(text)
+    
     def __repr__(self):
-        return f"Token({self.type.name}, {repr(self.value)}, L{self.line}:C{self.column})"
+        return f"Token({TokenType.NAMES[self.type]}, {repr(self.value)}, L{self.line}:C{self.column})"
 
 
 class Lexer:
@@ -125,50 +223,8 @@ class Lexer:
     Tokenize QDL source code
     """
     
-    # Keywords mapping
-    KEYWORDS = {
-        'qubit': TokenType.QUBIT,
-        'qureg': TokenType.QUREG,
-        'measure': TokenType.MEASURE,
-        'peek': TokenType.PEEK,
-        'if': TokenType.IF,
-        'else': TokenType.ELSE,
-        'for': TokenType.FOR,
-        'while': TokenType.WHILE,
-        'end': TokenType.END,
-        'function': TokenType.FUNCTION,
-        'return': TokenType.RETURN,
-        'program': TokenType.PROGRAM,
-        'print': TokenType.PRINT,
-        
-        # Gates (case-insensitive)
-        'h': TokenType.H,
-        'x': TokenType.X,
-        'y': TokenType.Y,
-        'z': TokenType.Z,
-        's': TokenType.S,
-        't': TokenType.T,
-        'cnot': TokenType.CNOT,
-        'cz': TokenType.CZ,
-        'swap': TokenType.SWAP,
-        'toffoli': TokenType.TOFFOLI,
-        'rx': TokenType.RX,
-        'ry': TokenType.RY,
-        'rz': TokenType.RZ,
-        
-        # Algorithms
-        'grover': TokenType.GROVER,
-        'qft': TokenType.QFT,
-        'iqft': TokenType.IQFT,
-        'shor': TokenType.SHOR,
-        
-        # ZION
-        'entangle': TokenType.ENTANGLE,
-        'coherence': TokenType.COHERENCE,
-        'quantum_pulse': TokenType.QUANTUM_PULSE,
-        'consciousness_level': TokenType.CONSCIOUSNESS_LEVEL,
-        'sacred_frequency': TokenType.SACRED_FREQUENCY,
-    }
+    # Module-level KEYWORDS, kept here for existing Lexer.KEYWORDS users
+    KEYWORDS = KEYWORDS
     
     def __init__(self, source: str):
         self.source = source
@@ -177,222 +233,92 @@ class Lexer:
         self.column = 1
         self.tokens: List[Token] = []
     
-    def current_char(self) -> str:
-        """Get current character"""
-        if self.pos >= len(self.source):
-            return '\0'
-        return self.source[self.pos]
-    
-    def peek_char(self, offset: int = 1) -> str:
-        """Look ahead"""
-        pos = self.pos + offset
-        if pos >= len(self.source):
-            return '\0'
-        return self.source[pos]
-    
-    def advance(self):
-        """Move to next character"""
-        if self.current_char() == '\n':
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-        self.pos += 1
-    
-    def skip_whitespace(self):
-        """Skip spaces and tabs (but not newlines!)"""
-        while self.current_char() in ' \t':
-            self.advance()
-    
-    def skip_comment(self):
-        """Skip # comments"""
-        if self.current_char() == '#':
-            while self.current_char() != '\n' and self.current_char() != '\0':
-                self.advance()
-    
-    def read_number(self) -> Token:
-        """Read integer or float"""
-        start_line = self.line
-        start_col = self.column
-        num_str = ''
-        
-        # Handle π
-        if self.current_char() == 'π':
-            self.advance()
-            return Token(TokenType.NUMBER, 3.141592653589793, start_line, start_col)
-        
-        while self.current_char().isdigit() or self.current_char() == '.':
-            num_str += self.current_char()
-            self.advance()
-        
-        # Convert to number
-        if '.' in num_str:
-            value = float(num_str)
-        else:
-            value = int(num_str)
-        
-        return Token(TokenType.NUMBER, value, start_line, start_col)
-    
-    def read_identifier(self) -> Token:
-        """Read identifier or keyword"""
-        start_line = self.line
-        start_col = self.column
-        ident = ''
-        
-        while self.current_char().isalnum() or self.current_char() == '_':
-            ident += self.current_char()
-            self.advance()
-        
-        # Check if keyword (case-insensitive)
-        token_type = self.KEYWORDS.get(ident.lower(), TokenType.IDENTIFIER)
-        
-        return Token(token_type, ident, start_line, start_col)
-    
-    def read_quantum_state(self) -> Token:
-        """Read quantum state notation |0⟩, |1⟩, |+⟩, etc."""
-        start_line = self.line
-        start_col = self.column
-        
-        state = ''
-        self.advance()  # Skip |
-        
-        while self.current_char() not in '⟩\0':
-            state += self.current_char()
-            self.advance()
-        
-        if self.current_char() == '⟩':
-            self.advance()
-        
-        return Token(TokenType.QUANTUM_STATE, f"|{state}⟩", start_line, start_col)
-    
-    def read_string(self) -> Token:
-        """Read string literal"""
-        start_line = self.line
-        start_col = self.column
-        quote_char = self.current_char()
-        self.advance()  # Skip opening quote
-        
-        string = ''
-        while self.current_char() != quote_char and self.current_char() != '\0':
-            string += self.current_char()
-            self.advance()
-        
-        if self.current_char() == quote_char:
-            self.advance()  # Skip closing quote
-        
-        return Token(TokenType.STRING, string, start_line, start_col)
-    
     def tokenize(self) -> List[Token]:
         """Tokenize entire source"""
+        self.tokens.extend(self.iter_tokens())
+        return self.tokens
+    
+    def iter_tokens(self, _match=TOKEN_RE.match, _keyword=KEYWORDS.get,
+                    _operators=OPERATORS, _IDENTIFIER=TokenType.IDENTIFIER,
+                    _NUMBER=TokenType.NUMBER, _NEWLINE=TokenType.NEWLINE) -> Iterator[Token]:
+        """Yield tokens one at a time, ending with EOF (does not fill self.tokens)"""
+        # The hot-loop globals are bound as default arguments (fast locals).
+        # Blanks are consumed by the token match itself, and columns are
+        # computed from the offset where the current line starts.
+        src = self.source
+        end = len(src)
+        pos, line = self.pos, self.line
+        line_start = pos - self.column + 1
+        # Token type per identifier spelling seen so far, so repeated names
+        # skip the .lower() + KEYWORDS lookup.
+        ident_types = {}
+        ident_type = ident_types.get
         
-        while self.current_char() != '\0':
-            # Skip whitespace (except newlines)
-            if self.current_char() in ' \t':
-                self.skip_whitespace()
-                continue
-            
-            # Comments
-            if self.current_char() == '#':
-                self.skip_comment()
-                continue
-            
-            # Newlines
-            if self.current_char() == '\n':
-                self.tokens.append(Token(TokenType.NEWLINE, '\n', self.line, self.column))
-                self.advance()
-                continue
-            
-            # Numbers
-            if self.current_char().isdigit() or self.current_char() == 'π':
-                self.tokens.append(self.read_number())
-                continue
-            
-            # Quantum states
-            if self.current_char() == '|':
-                self.tokens.append(self.read_quantum_state())
-                continue
-            
-            # Strings
-            if self.current_char() in '"\'':
-                self.tokens.append(self.read_string())
-                continue
-            
-            # Identifiers/keywords
-            if self.current_char().isalpha() or self.current_char() == '_':
-                self.tokens.append(self.read_identifier())
+        while pos < end:
+            m = _match(src, pos)
+            if m is None:
+                # Only blanks before the end, a NUL or an unknown character
+                pos = BLANKS_RE.match(src, pos).end()
+                if pos >= end or src[pos] == '\0':
+                    break
+                # Unknown character - skip
+                print(f"Warning: Unknown character '{src[pos]}' at L{line}:C{pos - line_start + 1}")
+                pos += 1
                 continue
             
-            # Operators and separators
-            char = self.current_char()
-            line, col = self.line, self.column
+            kind = m.lastgroup
+            start, pos = m.span(kind)
+            col = start - line_start + 1
             
-            if char == '+':
-                self.tokens.append(Token(TokenType.PLUS, '+', line, col))
-                self.advance()
-            elif char == '-' and self.peek_char() == '>':
-                self.tokens.append(Token(TokenType.ARROW, '->', line, col))
-                self.advance()
-                self.advance()
-            elif char == '-':
-                self.tokens.append(Token(TokenType.MINUS, '-', line, col))
-                self.advance()
-            elif char == '*':
-                self.tokens.append(Token(TokenType.MULTIPLY, '*', line, col))
-                self.advance()
-            elif char == '/':
-                self.tokens.append(Token(TokenType.DIVIDE, '/', line, col))
-                self.advance()
-            elif char == '=' and self.peek_char() == '=':
-                self.tokens.append(Token(TokenType.EQUAL, '==', line, col))
-                self.advance()
-                self.advance()
-            elif char == '=':
-                self.tokens.append(Token(TokenType.ASSIGN, '=', line, col))
-                self.advance()
-            elif char == '>':
-                self.tokens.append(Token(TokenType.GREATER, '>', line, col))
-                self.advance()
-            elif char == '<':
-                self.tokens.append(Token(TokenType.LESS, '<', line, col))
-                self.advance()
-            elif char == '(':
-                self.tokens.append(Token(TokenType.LPAREN, '(', line, col))
-                self.advance()
-            elif char == ')':
-                self.tokens.append(Token(TokenType.RPAREN, ')', line, col))
-                self.advance()
-            elif char == '[':
-                self.tokens.append(Token(TokenType.LBRACKET, '[', line, col))
-                self.advance()
-            elif char == ']':
-                self.tokens.append(Token(TokenType.RBRACKET, ']', line, col))
-                self.advance()
-            elif char == ',':
-                self.tokens.append(Token(TokenType.COMMA, ',', line, col))
-                self.advance()
-            elif char == ':':
-                self.tokens.append(Token(TokenType.COLON, ':', line, col))
-                self.advance()
-            elif char == '.':
-                if self.peek_char() == '.':
-                    self.tokens.append(Token(TokenType.RANGE, '..', line, col))
-                    self.advance()
-                    self.advance()
+            if kind == 'IDENT':
+                # Keywords are case-insensitive
+                text = src[start:pos]
+                token_type = ident_type(text)
+                if token_type is None:
+                    token_type = ident_types[text] = _keyword(text.lower(), _IDENTIFIER)
+                yield Token(token_type, text, line, col)
+            elif kind == 'NEWLINE':
+                yield Token(_NEWLINE, '\n', line, col)
+                line += 1
+                line_start = pos
+            elif kind == 'OP':
+                text = src[start:pos]
+                yield Token(_operators[text], text, line, col)
+            elif kind == 'NUMBER':
+                # Value stays source text; see Token.as_number()
+                yield Token(_NUMBER, src[start:pos], line, col)
+            elif kind != 'COMMENT':
+                # Quantum state or string literal; either may span lines
+                text = src[start:pos]
+                if kind == 'STATE':
+                    value = text if text[-1] == '⟩' else text + '⟩'
+                    yield Token(TokenType.QUANTUM_STATE, value, line, col)
                 else:
-                    self.tokens.append(Token(TokenType.DOT, '.', line, col))
-                    self.advance()
-            elif char == '@':
-                self.tokens.append(Token(TokenType.AT, '@', line, col))
-                self.advance()
-            else:
-                # Unknown character - skip
-                print(f"Warning: Unknown character '{char}' at L{line}:C{col}")
-                self.advance()
+                    closed = len(text) > 1 and text[-1] == text[0]
+                    value = text[1:-1] if closed else text[1:]
+                    yield Token(TokenType.STRING, value, line, col)
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = start + text.rfind('\n') + 1
         
-        # Add EOF
-        self.tokens.append(Token(TokenType.EOF, None, self.line, self.column))
+        col = pos - line_start + 1
+        self.pos, self.line, self.column = pos, line, col
         
-        return self.tokens
+        # Add EOF
+        yield Token(TokenType.EOF, None, line, col)
+
+
+@functools.lru_cache(maxsize=128)
+def tokenize_cached(source: str) -> Tuple[Token, ...]:
+    """
+    Tokenize source, memoizing the result per source string
+    
+    For callers that recompile the same snippet (REPL, test runners).
+    The tokens are shared between calls and must not be modified; lexer
+    warnings are only printed the first time a source is seen.
+    """
+    return tuple(Lexer(source).tokenize())
 
 
 # ============================================================================
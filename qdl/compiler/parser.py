@@ -15,7 +15,7 @@ AST Nodes:
 - FunctionDefinition
 """
 
-from typing import List, Optional, Any
+from typing import Iterable, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import sys
@@ -39,7 +39,7 @@ class ASTNode:
 class Program(ASTNode):
     """Root node - entire program"""
     name: str
-    statements: List[ASTNode]
+    statements: Tuple[ASTNode, ...]
 
 
 @dataclass
@@ -69,8 +69,8 @@ class Measurement(ASTNode):
 class IfStatement(ASTNode):
     """Classical if statement"""
     condition: 'Expression'
-    then_body: List[ASTNode]
-    else_body: Optional[List[ASTNode]] = None
+    then_body: Tuple[ASTNode, ...]
+    else_body: Optional[Tuple[ASTNode, ...]] = None
 
 
 @dataclass
@@ -79,7 +79,7 @@ class ForLoop(ASTNode):
     variable: str
     start: int
     end: int
-    body: List[ASTNode]
+    body: Tuple[ASTNode, ...]
 
 
 @dataclass
@@ -87,7 +87,7 @@ class FunctionDefinition(ASTNode):
     """Function definition"""
     name: str
     parameters: List[str]
-    body: List[ASTNode]
+    body: Tuple[ASTNode, ...]
 
 
 @dataclass
@@ -108,6 +108,11 @@ class Expression(ASTNode):
 # PARSER
 # ============================================================================
 
+# Copies of the EOF token kept after the last real token, so current_token()
+# and small peek_token() offsets need no bounds check
+EOF_PADDING = 4
+
+
 class Parser:
     """
     Parse tokens into AST
@@ -132,34 +137,54 @@ class Parser:
     print_stmt   ::= "print" STRING
     """
     
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+    def __init__(self, tokens: Iterable[Token]):
+        if isinstance(tokens, (list, tuple)):
+            self.tokens = [*tokens, *[tokens[-1]] * EOF_PADDING]
+            self._stream = None
+        else:
+            # Token stream (e.g. Lexer.iter_tokens()): tokens are pulled
+            # as parsing reaches them, so a syntax error stops the lexer too
+            self.tokens = []
+            self._stream = iter(tokens)
+            self._fill(EOF_PADDING)
         self.pos = 0
     
+    def _fill(self, index: int):
+        """Pull streamed tokens until tokens[index] exists"""
+        tokens = self.tokens
+        for token in self._stream:
+            tokens.append(token)
+            if len(tokens) > index:
+                return
+        # End of stream: pad with the final (EOF) token like a list input
+        tokens.extend([tokens[-1]] * EOF_PADDING)
+        self._stream = None
+    
     def current_token(self) -> Token:
         """Get current token"""
-        if self.pos >= len(self.tokens):
-            return self.tokens[-1]  # EOF
         return self.tokens[self.pos]
     
     def peek_token(self, offset: int = 1) -> Token:
-        """Look ahead"""
+        """Look ahead (bounds-checked only past EOF_PADDING tokens)"""
         pos = self.pos + offset
-        if pos >= len(self.tokens):
-            return self.tokens[-1]
+        if offset > EOF_PADDING and pos >= len(self.tokens):
+            if self._stream is not None:
+                self._fill(pos)
+            pos = min(pos, len(self.tokens) - 1)
         return self.tokens[pos]
     
     def advance(self):
-        """Move to next token"""
-        if self.pos < len(self.tokens) - 1:
-            self.pos += 1
+        """Move to next token (stays on EOF)"""
+        self.pos += self.tokens[self.pos].type != TokenType.EOF
+        if self._stream is not None:
+            self._fill(self.pos + EOF_PADDING)
     
-    def expect(self, token_type: TokenType) -> Token:
+    def expect(self, token_type: int) -> Token:
         """Expect specific token type"""
         token = self.current_token()
         if token.type != token_type:
             raise SyntaxError(
-                f"Expected {token_type.name}, got {token.type.name} "
+                f"Expected {TokenType.NAMES[token_type]}, got {TokenType.NAMES[token.type]} "
                 f"at L{token.line}:C{token.column}"
             )
         self.advance()
@@ -188,57 +213,30 @@ class Parser:
         
         return Program(name=name_token.value, statements=statements)
     
-    def parse_statements(self) -> List[ASTNode]:
-        """Parse list of statements"""
+    def parse_statements(self) -> Tuple[ASTNode, ...]:
+        """Parse statements up to the next END or EOF (returned as a tuple)"""
         statements = []
+        tokens = self.tokens  # streamed input is appended to this same list
+        NEWLINE, END, EOF = TokenType.NEWLINE, TokenType.END, TokenType.EOF
         
-        while self.current_token().type != TokenType.END:
-            self.skip_newlines()
-            
-            if self.current_token().type == TokenType.END:
+        while True:
+            token_type = tokens[self.pos].type
+            if token_type == NEWLINE:
+                self.advance()
+            elif token_type == END or token_type == EOF:
                 break
-            
-            stmt = self.parse_statement()
-            if stmt:
-                statements.append(stmt)
-            
-            self.skip_newlines()
+            else:
+                stmt = self.parse_statement()
+                if stmt:
+                    statements.append(stmt)
         
-        return statements
+        return tuple(statements)
     
     def parse_statement(self) -> Optional[ASTNode]:
         """Parse single statement"""
-        token = self.current_token()
-        
-        # Qubit declaration
-        if token.type == TokenType.QUBIT:
-            return self.parse_qubit_declaration()
-        
-        # Quantum register declaration
-        if token.type == TokenType.QUREG:
-            return self.parse_qureg_declaration()
-        
-        # Measurement
-        if token.type == TokenType.MEASURE:
-            return self.parse_measurement()
-        
-        # If statement
-        if token.type == TokenType.IF:
-            return self.parse_if_statement()
-        
-        # For loop
-        if token.type == TokenType.FOR:
-            return self.parse_for_loop()
-        
-        # Print statement
-        if token.type == TokenType.PRINT:
-            return self.parse_print_statement()
-        
-        # Quantum gates
-        if token.type in [TokenType.H, TokenType.X, TokenType.Y, TokenType.Z,
-                         TokenType.S, TokenType.T, TokenType.CNOT, TokenType.CZ,
-                         TokenType.SWAP]:
-            return self.parse_gate_application()
+        parse_fn = self._statement_parsers.get(self.current_token().type)
+        if parse_fn is not None:
+            return parse_fn(self)
         
         # Unknown - skip
         self.advance()
@@ -268,7 +266,7 @@ class Parser:
         self.expect(TokenType.LBRACKET)
         
         size_token = self.expect(TokenType.NUMBER)
-        size = size_token.value
+        size = size_token.as_number()
         
         self.expect(TokenType.RBRACKET)
         
@@ -280,7 +278,7 @@ class Parser:
     def parse_gate_application(self) -> GateApplication:
         """Parse: H q0 or CNOT q0, q1"""
         gate_token = self.current_token()
-        gate_name = gate_token.type.name
+        gate_name = TokenType.NAMES[gate_token.type]
         self.advance()
         
         # Parse target qubits
@@ -324,7 +322,7 @@ class Parser:
         condition = Expression(
             operator=operator_token.value,
             left=left_token.value,
-            right=right_token.value
+            right=right_token.as_number()
         )
         
         self.expect(TokenType.COLON)
@@ -349,12 +347,12 @@ class Parser:
         self.advance()
         
         start_token = self.expect(TokenType.NUMBER)
-        start = start_token.value
+        start = start_token.as_number()
         
         self.expect(TokenType.RANGE)
         
         end_token = self.expect(TokenType.NUMBER)
-        end = end_token.value
+        end = end_token.as_number()
         
         self.expect(TokenType.COLON)
         self.skip_newlines()
@@ -372,6 +370,23 @@ class Parser:
         message = message_token.value
         
         return PrintStatement(message=message)
+    
+    _statement_parsers = {
+        TokenType.QUBIT: parse_qubit_declaration,
+        TokenType.QUREG: parse_qureg_declaration,
+        TokenType.MEASURE: parse_measurement,
+        TokenType.IF: parse_if_statement,
+        TokenType.FOR: parse_for_loop,
+        TokenType.PRINT: parse_print_statement,
+    }
+    
+    # Quantum gates
+    _statement_parsers.update(dict.fromkeys(
+        (TokenType.H, TokenType.X, TokenType.Y, TokenType.Z,
+         TokenType.S, TokenType.T, TokenType.CNOT, TokenType.CZ,
+         TokenType.SWAP),
+        parse_gate_application,
+    ))
 
 
 # ============================================================================
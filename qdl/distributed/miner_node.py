@@ -13,11 +13,14 @@ Each ZION miner runs one of these nodes.
 """
 
 import asyncio
+import base64
 import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import uuid
 
+import numpy as np
+
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -151,23 +154,29 @@ class QuantumMinerNode:
         print(f"📊 {self.miner_id}: Measured qubit {qubit_index} → {result}")
         return result
     
-    def get_local_state(self) -> List[complex]:
-        """Get current quantum state of local register."""
-        return list(self.local_register.state_vector)
+    def get_local_state(self) -> np.ndarray:
+        """Get current quantum state of local register (not a copy)."""
+        return self.local_register.state_vector
     
-    def sync_state_with_network(self) -> QuantumMessage:
+    def sync_state_with_network(self, precision: str = 'c64') -> QuantumMessage:
         """
         Create SYNC_STATE message with local quantum state.
         
         Used when network manager needs to know this miner's state.
+        The state is sent at the given precision ('c128', 'c64' or 'bf16',
+        see QuantumStateSerializer); payload['precision'] names it so the
+        receiver can pass it to deserialize_state. Single precision is the
+        register's own dtype; 'bf16' is only good for coherence-style metrics.
         """
         state = self.get_local_state()
+        state_bytes = QuantumStateSerializer.serialize_state(state, precision)
         
         msg = QuantumMessage(
             msg_type=MessageType.SYNC_STATE,
             sender_id=self.miner_id,
             payload={
-                'state_data': QuantumStateSerializer.serialize_state(state).hex(),
+                'state_data': base64.b64encode(state_bytes).decode('ascii'),
+                'precision': precision,
                 'num_qubits': self.num_qubits,
                 'consciousness_level': self.consciousness_level,
                 'multiplier': self.get_consciousness_multiplier()
@@ -272,7 +281,7 @@ if __name__ == "__main__":
     print("-" * 60)
     
     alice_sync = alice.sync_state_with_network()
-    print(f"📤 Alice synced state: {len(alice_sync.payload['state_data'])} hex chars")
+    print(f"📤 Alice synced state: {len(alice_sync.payload['state_data'])} base64 chars")
     print(f"   Consciousness: {alice_sync.payload['consciousness_level']}")
     print(f"   Multiplier: {alice_sync.payload['multiplier']}×")
     print()
@@ -13,6 +13,7 @@ Responsibilities:
 """
 
 import asyncio
+from collections import deque
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass, field
 import time
@@ -23,7 +24,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from simulator.qubit import QubitRegister
-from simulator.gates import hadamard, cnot, apply_single_qubit_gate, HADAMARD
+from simulator.gates import hadamard, cnot, apply_cnot_fanout, apply_single_qubit_gate, HADAMARD
 from simulator.measurement import measure_all
 from distributed.protocol import (
     MessageType,
@@ -56,6 +57,43 @@ class EntanglementPair:
     coherence: float = 1.0  # Decreases over time
 
 
+class MessageQueue:
+    """
+    Unbounded FIFO of network messages for a single event loop.
+    
+    Covers the asyncio.Queue calls the manager needs on a deque plus one
+    Event: put_nowait/get_nowait are plain deque operations with no lock
+    or waiter bookkeeping, and get() only suspends while the queue is empty.
+    """
+    
+    def __init__(self):
+        self._items: deque = deque()
+        self._ready = asyncio.Event()
+    
+    def put_nowait(self, item):
+        self._items.append(item)
+        self._ready.set()
+    
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+    
+    async def get(self):
+        items = self._items
+        while not items:
+            self._ready.clear()
+            await self._ready.wait()
+        return items.popleft()
+    
+    def qsize(self) -> int:
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        return not self._items
+
+
 class QuantumNetworkManager:
     """
     Manages distributed quantum computing network.
@@ -72,7 +110,11 @@ class QuantumNetworkManager:
         self.miners: Dict[str, MinerInfo] = {}
         self.entanglements: List[EntanglementPair] = []
         self.global_register: Optional[QubitRegister] = None
-        self.message_queue: asyncio.Queue = asyncio.Queue()
+        # miner_id -> (start, end) qubit range; rebuilt with the register
+        self._qubit_ranges: Dict[str, Tuple[int, int]] = {}
+        # Scratch rows (|ψ|², log2 |ψ|²) reused by measure_coherence()
+        self._coh_buf: Optional[np.ndarray] = None
+        self.message_queue = MessageQueue()
         
         # Performance tracking
         self.stats = {
@@ -122,7 +164,13 @@ class QuantumNetworkManager:
         
         Layout: [miner1_qubits][miner2_qubits][miner3_qubits]...
         """
-        total_qubits = sum(m.num_qubits for m in self.miners.values())
+        # Prefix sums over registration order give each miner's range
+        ranges = {}
+        total_qubits = 0
+        for mid, minfo in self.miners.items():
+            ranges[mid] = (total_qubits, total_qubits + minfo.num_qubits)
+            total_qubits += minfo.num_qubits
+        self._qubit_ranges = ranges
         
         if total_qubits == 0:
             self.global_register = None
@@ -138,16 +186,10 @@ class QuantumNetworkManager:
         Returns:
             (start_index, end_index) exclusive
         """
-        if miner_id not in self.miners:
-            raise ValueError(f"Miner {miner_id} not registered!")
-        
-        start = 0
-        for mid, minfo in self.miners.items():
-            if mid == miner_id:
-                return (start, start + minfo.num_qubits)
-            start += minfo.num_qubits
-        
-        raise ValueError("Logic error in qubit range calculation")
+        try:
+            return self._qubit_ranges[miner_id]
+        except KeyError:
+            raise ValueError(f"Miner {miner_id} not registered!") from None
     
     def create_bell_pair(self, miner_a: str, miner_b: str) -> bool:
         """
@@ -238,9 +280,8 @@ class QuantumNetworkManager:
         # Step 1: Hadamard on first qubit
         hadamard(self.global_register, qubit_indices[0])
         
-        # Step 2: CNOT cascade from first qubit to all others
-        for i in range(1, len(qubit_indices)):
-            cnot(self.global_register, qubit_indices[0], qubit_indices[i])
+        # Step 2: CNOT cascade from first qubit to all others (one state pass)
+        apply_cnot_fanout(self.global_register, qubit_indices[0], qubit_indices[1:])
         
         print(f"✅ GHZ state created! ({len(miner_ids)} qubits entangled)")
         
@@ -280,13 +321,22 @@ class QuantumNetworkManager:
         
         # Simplified: Check if state has dominant amplitudes
         state = self.global_register.state_vector
-        probabilities = np.abs(state) ** 2
+        n = len(state)
+        buf = self._coh_buf
+        if buf is None or buf.shape[1] != n or buf.dtype != state.real.dtype:
+            buf = self._coh_buf = np.empty((2, n), dtype=state.real.dtype)
+        probabilities, log_p = buf
+        np.abs(state, out=probabilities)
+        np.square(probabilities, out=probabilities)
         
         # Entropy-based coherence
         # High coherence = few dominant states
         # Low coherence = many states with similar probability
-        entropy = -np.sum(probabilities * np.log2(probabilities + 1e-10))
-        max_entropy = np.log2(len(state))
+        # (zero-probability terms are 0 * log2(tiny) = 0, no epsilon needed)
+        np.maximum(probabilities, np.finfo(buf.dtype).tiny, out=log_p)
+        np.log2(log_p, out=log_p)
+        entropy = -np.dot(probabilities, log_p)
+        max_entropy = np.log2(n)
         
         coherence = 1.0 - (entropy / max_entropy)
         
@@ -14,10 +14,19 @@ Design principles:
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
+import base64
 import json
 import struct
 import hashlib
 
+import numpy as np
+
+# Optional: bfloat16 amplitudes for the 'bf16' state precision
+try:
+    from ml_dtypes import bfloat16
+except ImportError:
+    bfloat16 = None
+
 
 class ProtocolVersion:
     """Protocol versioning for backward compatibility."""
@@ -141,8 +150,21 @@ class QuantumStateSerializer:
     
     Challenge: Complex amplitudes (α, β) → bytes
     Solution: Use float64 for real/imaginary parts
+    
+    State payloads can be sent at lower precision:
+    'c128' = 2 × big-endian float64 per amplitude (16 bytes, default)
+    'c64'  = 2 × big-endian float32 per amplitude (8 bytes)
+    'bf16' = 2 × big-endian bfloat16 per amplitude (4 bytes, needs ml_dtypes)
+    The precision is not stored in the bytes; the receiver must know it.
     """
     
+    # Wire layout of one amplitude per precision: big-endian (real, imag)
+    AMPLITUDE_DTYPES = {
+        'c128': np.dtype('>c16'),
+        'c64': np.dtype('>c8'),
+    }
+    PRECISIONS = ('c128', 'c64', 'bf16')
+    
     @staticmethod
     def serialize_amplitude(amplitude: complex) -> bytes:
         """Convert complex amplitude to 16 bytes (2 × float64)."""
@@ -157,32 +179,49 @@ class QuantumStateSerializer:
         return complex(real, imag)
     
     @staticmethod
-    def serialize_state(amplitudes: List[complex]) -> bytes:
-        """Serialize full quantum state (list of amplitudes)."""
+    def serialize_state(amplitudes, precision: str = 'c128') -> bytes:
+        """Serialize full quantum state (state vector or list of amplitudes)."""
         # Header: number of amplitudes (4 bytes)
         n = len(amplitudes)
-        result = struct.pack('!I', n)
-        
-        # Amplitudes: n × 16 bytes
-        for amp in amplitudes:
-            result += QuantumStateSerializer.serialize_amplitude(amp)
         
-        return result
+        # Amplitudes: converted straight from the array buffer
+        if precision == 'bf16':
+            _require_bfloat16()
+            pairs = np.asarray(amplitudes, dtype=np.complex64).view(np.float32)
+            body = pairs.astype(bfloat16).view(np.uint16).astype('>u2')
+        else:
+            body = np.asarray(amplitudes).astype(_amplitude_dtype(precision), copy=False)
+        return struct.pack('!I', n) + body.tobytes()
     
     @staticmethod
-    def deserialize_state(data: bytes) -> List[complex]:
+    def deserialize_state(data: bytes, precision: str = 'c128') -> List[complex]:
         """Deserialize quantum state from bytes."""
         # Read header
         n = struct.unpack('!I', data[:4])[0]
         
         # Read amplitudes
-        amplitudes = []
-        for i in range(n):
-            offset = 4 + i * 16
-            amp_bytes = data[offset:offset+16]
-            amplitudes.append(QuantumStateSerializer.deserialize_amplitude(amp_bytes))
-        
-        return amplitudes
+        if precision == 'bf16':
+            _require_bfloat16()
+            halves = np.frombuffer(data, dtype='>u2', count=2 * n, offset=4)
+            pairs = halves.astype(np.uint16).view(bfloat16).astype(np.float32)
+            return pairs.view(np.complex64).tolist()
+        amplitudes = np.frombuffer(data, dtype=_amplitude_dtype(precision), count=n, offset=4)
+        return amplitudes.tolist()
+
+
+def _amplitude_dtype(precision: str) -> np.dtype:
+    try:
+        return QuantumStateSerializer.AMPLITUDE_DTYPES[precision]
+    except KeyError:
+        raise ValueError(
+            f"Unknown state precision {precision!r} "
+            f"(expected one of {', '.join(QuantumStateSerializer.PRECISIONS)})"
+        ) from None
+
+
+def _require_bfloat16():
+    if bfloat16 is None:
+        raise ImportError("'bf16' state precision requires ml_dtypes (pip install ml-dtypes)")
 
 
 # ============================================================================
@@ -223,16 +262,18 @@ def build_entangle_message(
 
 def build_sync_state_message(
     miner_id: str,
-    state_amplitudes: List[complex]
+    state_amplitudes,
+    precision: str = 'c128'
 ) -> QuantumMessage:
     """Build SYNC_STATE message with serialized quantum state."""
-    state_bytes = QuantumStateSerializer.serialize_state(state_amplitudes)
+    state_bytes = QuantumStateSerializer.serialize_state(state_amplitudes, precision)
     
     return QuantumMessage(
         msg_type=MessageType.SYNC_STATE,
         sender_id=miner_id,
         payload={
-            'state_data': state_bytes.hex(),  # Hex string for JSON compatibility
+            'state_data': base64.b64encode(state_bytes).decode('ascii'),  # Base64 for JSON compatibility
+            'precision': precision,
             'num_qubits': (len(state_amplitudes) - 1).bit_length()
         }
     )
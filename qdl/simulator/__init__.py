@@ -16,13 +16,14 @@ __version__ = "0.1.0-alpha"
 __author__ = "Maitreya (ZION Team)"
 __status__ = "Proof of Concept"
 
-from .qubit import Qubit, QubitRegister
+from .qubit import Qubit, QubitRegister, CompactQubitRegister
 from .gates import *
 from .measurement import measure, measure_all
 
 __all__ = [
     'Qubit',
     'QubitRegister', 
+    'CompactQubitRegister',
     'measure',
     'measure_all'
 ]
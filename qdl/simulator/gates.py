@@ -15,11 +15,17 @@ Key gates:
 import numpy as np
 from typing import List
 
+# Optional: Numba-compiled in-place kernel for single-qubit gates
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # For standalone execution
 if __name__ == "__main__":
-    from qubit import QubitRegister
+    from qubit import QubitRegister, STATE_DTYPE
 else:
-    from .qubit import QubitRegister
+    from .qubit import QubitRegister, STATE_DTYPE
 
 
 # ============================================================================
@@ -32,7 +38,7 @@ else:
 HADAMARD = np.array([
     [1,  1],
     [1, -1]
-], dtype=complex) / np.sqrt(2)
+], dtype=STATE_DTYPE) / STATE_DTYPE(np.sqrt(2))
 
 # Pauli-X Gate: Bit flip (quantum NOT)
 # X|0⟩ = |1⟩
@@ -40,13 +46,13 @@ HADAMARD = np.array([
 PAULI_X = np.array([
     [0, 1],
     [1, 0]
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # Pauli-Y Gate: Bit flip + phase flip
 PAULI_Y = np.array([
     [0, -1j],
     [1j, 0]
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # Pauli-Z Gate: Phase flip
 # Z|0⟩ = |0⟩
@@ -54,25 +60,25 @@ PAULI_Y = np.array([
 PAULI_Z = np.array([
     [1,  0],
     [0, -1]
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # S Gate: Phase gate (√Z)
 S_GATE = np.array([
     [1, 0],
     [0, 1j]
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # T Gate: π/8 gate (√S)
 T_GATE = np.array([
     [1, 0],
     [0, np.exp(1j * np.pi / 4)]
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # Identity (does nothing, useful for multi-qubit operations)
 IDENTITY = np.array([
     [1, 0],
     [0, 1]
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 
 # ============================================================================
@@ -87,7 +93,7 @@ CNOT = np.array([
     [0, 1, 0, 0],  # |01⟩ → |01⟩
     [0, 0, 0, 1],  # |10⟩ → |11⟩ (control=1, flip target!)
     [0, 0, 1, 0],  # |11⟩ → |10⟩
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # SWAP: Exchange two qubits
 SWAP = np.array([
@@ -95,7 +101,7 @@ SWAP = np.array([
     [0, 0, 1, 0],  # |01⟩ → |10⟩ (swapped!)
     [0, 1, 0, 0],  # |10⟩ → |01⟩
     [0, 0, 0, 1],  # |11⟩ → |11⟩
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 # CZ (Controlled-Z): Phase flip if both qubits are |1⟩
 CZ = np.array([
@@ -103,7 +109,7 @@ CZ = np.array([
     [0, 1, 0,  0],
     [0, 0, 1,  0],
     [0, 0, 0, -1],  # |11⟩ gets phase flip
-], dtype=complex)
+], dtype=STATE_DTYPE)
 
 
 # ============================================================================
@@ -128,20 +134,126 @@ def apply_single_qubit_gate(
         >>> apply_single_qubit_gate(reg, HADAMARD, 1)  # H on qubit 1
     """
     n = register.num_qubits
+    if not 0 <= target_qubit < n:
+        raise IndexError(f"qubit {target_qubit} out of range for {n}-qubit register")
     
-    # Build full gate matrix using tensor product
-    # For qubit i: I ⊗ I ⊗ ... ⊗ GATE ⊗ ... ⊗ I
+    # Equivalent to (I ⊗ ... ⊗ GATE ⊗ ... ⊗ I) @ state, without building
+    # the 2^n × 2^n matrix: qubit i is the i-th most significant index bit,
+    # so amplitude pairs differing only in that bit are `stride` apart.
+    state = register.state_vector
+    stride = 1 << (n - 1 - target_qubit)
+    gate = np.asarray(gate, dtype=state.dtype)
     
-    full_gate = np.array([1.0], dtype=complex)  # Start with scalar 1
+    if _apply_1q_kernel is not None:
+        state = state.copy()
+        _apply_1q_kernel(state, gate, stride)
+    else:
+        pairs = state.reshape(-1, 2, stride)
+        state = np.matmul(gate, pairs).reshape(-1)
     
-    for i in range(n):
-        if i == target_qubit:
-            full_gate = np.kron(full_gate, gate)
+    register.state_vector = state
+
+
+def _apply_1q_loop(state, gate, stride):
+    """In-place single-qubit update over all (i, i + stride) amplitude pairs"""
+    g00 = gate[0, 0]
+    g01 = gate[0, 1]
+    g10 = gate[1, 0]
+    g11 = gate[1, 1]
+    for block in range(0, state.shape[0], 2 * stride):
+        for i in range(block, block + stride):
+            a = state[i]
+            b = state[i + stride]
+            state[i] = g00 * a + g01 * b
+            state[i + stride] = g10 * a + g11 * b
+
+
+_apply_1q_kernel = njit(cache=True, nogil=True)(_apply_1q_loop) if njit is not None else None
+
+
+def apply_cnot(register: QubitRegister, control_qubit: int, target_qubit: int):
+    """
+    Apply CNOT as an amplitude permutation
+    
+    Flips the target bit of every basis state whose control bit is set,
+    i.e. swaps the (target=0, target=1) amplitude pairs in the control=1
+    half of the state. Works for any two distinct qubits of the register;
+    no 2^n × 2^n (or 4×4) matrix is applied.
+    """
+    n = register.num_qubits
+    for qubit in (control_qubit, target_qubit):
+        if not 0 <= qubit < n:
+            raise IndexError(f"qubit {qubit} out of range for {n}-qubit register")
+    if control_qubit == target_qubit:
+        raise ValueError("CNOT control and target must be different qubits")
+    
+    state = register.state_vector.copy()
+    c_stride = 1 << (n - 1 - control_qubit)
+    t_stride = 1 << (n - 1 - target_qubit)
+    
+    if _apply_cnot_kernel is not None:
+        _apply_cnot_kernel(state, c_stride, t_stride)
+    else:
+        # Axis 1 is the bit with the larger stride, axis 3 the smaller one
+        hi, lo = max(c_stride, t_stride), min(c_stride, t_stride)
+        view = state.reshape(-1, 2, hi // (2 * lo), 2, lo)
+        if c_stride > t_stride:
+            controlled = view[:, 1]             # (.., mid, target, lo)
+            controlled[:, :, [0, 1]] = controlled[:, :, [1, 0]]
         else:
-            full_gate = np.kron(full_gate, IDENTITY)
+            controlled = view[:, :, :, 1]       # (.., target, mid, lo)
+            controlled[:, [0, 1]] = controlled[:, [1, 0]]
     
-    # Apply gate to state vector
-    register.state_vector = full_gate @ register.state_vector
+    register.state_vector = state
+
+
+def apply_cnot_fanout(register: QubitRegister, control_qubit: int, target_qubits: List[int]):
+    """
+    Apply CNOT(control, t) for every t in target_qubits in a single pass
+    
+    The CNOTs share a control that none of them flips, so together they
+    XOR the combined target mask into every basis state whose control bit
+    is set (a target listed twice cancels out, as two CNOTs would).
+    Used for GHZ-style cascades instead of one state pass per target.
+    """
+    n = register.num_qubits
+    for qubit in (control_qubit, *target_qubits):
+        if not 0 <= qubit < n:
+            raise IndexError(f"qubit {qubit} out of range for {n}-qubit register")
+    if control_qubit in target_qubits:
+        raise ValueError("CNOT control and target must be different qubits")
+    
+    t_mask = 0
+    for qubit in target_qubits:
+        t_mask ^= 1 << (n - 1 - qubit)
+    if not t_mask:
+        return
+    
+    state = register.state_vector.copy()
+    c_stride = 1 << (n - 1 - control_qubit)
+    
+    if _apply_cnot_kernel is not None:
+        _apply_cnot_kernel(state, c_stride, t_mask)
+    else:
+        # Indices with the control bit set (targets never touch that bit)
+        controlled = np.arange(state.shape[0]).reshape(-1, 2, c_stride)[:, 1].reshape(-1)
+        state[controlled] = state[controlled ^ t_mask]
+    
+    register.state_vector = state
+
+
+def _apply_cnot_loop(state, c_stride, t_mask):
+    """In-place CNOT(s): swap (i, i ^ t_mask) for every i with the control bit set"""
+    for i in range(state.shape[0]):
+        if i & c_stride:
+            j = i ^ t_mask
+            if i < j:
+                a = state[i]
+                state[i] = state[j]
+                state[j] = a
+
+
+_apply_cnot_kernel = njit(cache=True, nogil=True)(_apply_cnot_loop) if njit is not None else None
 
 
 def apply_two_qubit_gate(
@@ -171,7 +283,7 @@ def apply_two_qubit_gate(
     # Build full gate (simplified for adjacent qubits)
     n = register.num_qubits
     
-    full_gate = np.array([1.0], dtype=complex)
+    full_gate = np.array([1.0], dtype=STATE_DTYPE)
     
     for i in range(n - 1):
         if i == control_qubit:
@@ -183,7 +295,8 @@ def apply_two_qubit_gate(
         for i in range(n - control_qubit - 2):
             full_gate = np.kron(full_gate, IDENTITY)
     
-    register.state_vector = full_gate @ register.state_vector
+    state = register.state_vector
+    register.state_vector = (full_gate @ state).astype(state.dtype, copy=False)
 
 
 # ============================================================================
@@ -230,7 +343,7 @@ def cnot(register: QubitRegister, control: int, target: int):
     
     Critical for Bell states and quantum algorithms
     """
-    apply_two_qubit_gate(register, CNOT, control, target)
+    apply_cnot(register, control, target)
 
 
 def swap(register: QubitRegister, qubit1: int, qubit2: int):
@@ -256,7 +369,7 @@ def rx(angle: float) -> np.ndarray:
     return np.array([
         [np.cos(angle/2), -1j * np.sin(angle/2)],
         [-1j * np.sin(angle/2), np.cos(angle/2)]
-    ], dtype=complex)
+    ], dtype=STATE_DTYPE)
 
 
 def ry(angle: float) -> np.ndarray:
@@ -264,7 +377,7 @@ def ry(angle: float) -> np.ndarray:
     return np.array([
         [np.cos(angle/2), -np.sin(angle/2)],
         [np.sin(angle/2), np.cos(angle/2)]
-    ], dtype=complex)
+    ], dtype=STATE_DTYPE)
 
 
 def rz(angle: float) -> np.ndarray:
@@ -272,7 +385,7 @@ def rz(angle: float) -> np.ndarray:
     return np.array([
         [np.exp(-1j * angle/2), 0],
         [0, np.exp(1j * angle/2)]
-    ], dtype=complex)
+    ], dtype=STATE_DTYPE)
 
 
 def phase(angle: float) -> np.ndarray:
@@ -284,7 +397,7 @@ def phase(angle: float) -> np.ndarray:
     return np.array([
         [1, 0],
         [0, np.exp(1j * angle)]
-    ], dtype=complex)
+    ], dtype=STATE_DTYPE)
 
 
 def controlled_phase(register: QubitRegister, control: int, target: int, angle: float):
@@ -299,7 +412,7 @@ def controlled_phase(register: QubitRegister, control: int, target: int, angle:
         [0, 1, 0, 0],
         [0, 0, 1, 0],
         [0, 0, 0, np.exp(1j * angle)]
-    ], dtype=complex)
+    ], dtype=STATE_DTYPE)
     
     apply_two_qubit_gate(register, cp_gate, control, target)
 
@@ -12,7 +12,7 @@ This is the WEIRD part of quantum mechanics.
 
 import numpy as np
 from typing import List
-from .qubit import Qubit, QubitRegister
+from .qubit import Qubit, QubitRegister, STATE_DTYPE
 
 
 def measure(register: QubitRegister, qubit_index: int) -> int:
@@ -37,12 +37,13 @@ def measure(register: QubitRegister, qubit_index: int) -> int:
     # Random measurement based on Born rule
     outcome = np.random.choice(
         range(register.num_states),
-        p=probabilities
+        p=probabilities / probabilities.sum()  # absorb single-precision drift
     )
     
     # Collapse to measured state
-    register.state_vector = np.zeros(register.num_states, dtype=complex)
-    register.state_vector[outcome] = 1.0
+    collapsed = np.zeros(register.num_states, dtype=STATE_DTYPE)
+    collapsed[outcome] = 1.0
+    register.state_vector = collapsed
     
     # Extract qubit value from outcome
     bit_string = register.get_state_string(outcome)
@@ -64,12 +65,13 @@ def measure_all(register: QubitRegister) -> List[int]:
     # Random measurement
     outcome = np.random.choice(
         range(register.num_states),
-        p=probabilities
+        p=probabilities / probabilities.sum()  # absorb single-precision drift
     )
     
     # Collapse state
-    register.state_vector = np.zeros(register.num_states, dtype=complex)
-    register.state_vector[outcome] = 1.0
+    collapsed = np.zeros(register.num_states, dtype=STATE_DTYPE)
+    collapsed[outcome] = 1.0
+    register.state_vector = collapsed
     
     # Convert to bit list
     bit_string = register.get_state_string(outcome)
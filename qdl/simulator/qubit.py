@@ -13,6 +13,18 @@ import numpy as np
 from typing import Tuple, List
 import matplotlib.pyplot as plt
 
+# Optional: bfloat16 storage for CompactQubitRegister
+try:
+    from ml_dtypes import bfloat16
+except ImportError:
+    bfloat16 = None
+
+
+# Amplitude dtype of QubitRegister state vectors. Single precision halves
+# memory and bandwidth per gate; the fidelity loss is far below what a
+# demo-sized circuit can show.
+STATE_DTYPE = np.complex64
+
 
 class Qubit:
     """
@@ -207,8 +219,9 @@ class QubitRegister:
         
         # State vector: Complex amplitudes for ALL possible states
         # Initial state: |00...0⟩ (all qubits in |0⟩)
-        self.state_vector = np.zeros(self.num_states, dtype=complex)
-        self.state_vector[0] = 1.0  # |00...0⟩ has amplitude 1
+        state = np.zeros(self.num_states, dtype=STATE_DTYPE)
+        state[0] = 1.0  # |00...0⟩ has amplitude 1
+        self.state_vector = state
         
         # Metadata
         self.miners = []  # List of miner IDs (for distributed system)
@@ -221,7 +234,25 @@ class QubitRegister:
         Returns:
             Array of probabilities: [P(|00...0⟩), P(|00...1⟩), ...]
         """
-        return np.abs(self.state_vector) ** 2
+        # float64 so the distribution is accurate enough for np.random.choice
+        return np.square(np.abs(self.state_vector), dtype=np.float64)
+    
+    def add_qubit(self) -> int:
+        """
+        Append one qubit in |0⟩ to the register
+        
+        State grows as |ψ⟩ ⊗ |0⟩, so existing qubit indices are unchanged.
+        
+        Returns:
+            Index of the new qubit
+        """
+        index = self.num_qubits
+        self.state_vector = np.kron(
+            self.state_vector, np.array([1, 0], dtype=self.state_vector.dtype)
+        )
+        self.num_qubits += 1
+        self.num_states *= 2
+        return index
     
     def get_state_string(self, state_index: int) -> str:
         """
@@ -270,6 +301,31 @@ class QubitRegister:
         return f"QubitRegister({self.num_qubits} qubits, {self.num_states} states)"
 
 
+class CompactQubitRegister(QubitRegister):
+    """
+    Quantum register storing amplitudes as bfloat16 (real, imag) pairs
+    
+    Half the memory of complex64, so twice the qubits fit in cache.
+    state_vector decodes to complex64 on read and re-encodes on
+    assignment, so gates still do their math in single precision.
+    Requires the optional ml_dtypes package.
+    """
+    
+    def __init__(self, num_qubits: int):
+        if bfloat16 is None:
+            raise ImportError("CompactQubitRegister requires ml_dtypes (pip install ml-dtypes)")
+        super().__init__(num_qubits)
+    
+    @property
+    def state_vector(self) -> np.ndarray:
+        return self._packed.astype(np.float32).view(STATE_DTYPE).ravel()
+    
+    @state_vector.setter
+    def state_vector(self, value: np.ndarray):
+        value = np.ascontiguousarray(value, dtype=STATE_DTYPE)
+        self._packed = value.view(np.float32).reshape(-1, 2).astype(bfloat16)
+
+
 # ============================================================================
 # DEMO / TESTING
 # ============================================================================
@@ -0,0 +1,98 @@
+"""
+CNOT / GHZ regression tests against dense kron-built reference matrices
+"""
+
+from functools import reduce
+
+import numpy as np
+import pytest
+
+from simulator import gates
+from simulator.qubit import QubitRegister
+
+I2 = np.eye(2)
+X = np.array([[0, 1], [1, 0]])
+P0 = np.array([[1, 0], [0, 0]])
+P1 = np.array([[0, 0], [0, 1]])
+
+
+def kron_all(ops):
+    return reduce(np.kron, ops)
+
+
+def cnot_matrix(n, control, target):
+    """|0⟩⟨0|_c ⊗ I + |1⟩⟨1|_c ⊗ X_t, qubit 0 most significant"""
+    off = [P0 if q == control else I2 for q in range(n)]
+    on = [P1 if q == control else X if q == target else I2 for q in range(n)]
+    return kron_all(off) + kron_all(on)
+
+
+def random_register(n, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** n) + 1j * rng.normal(size=2 ** n)
+    reg = QubitRegister(n)
+    reg.state_vector = (state / np.linalg.norm(state)).astype(reg.state_vector.dtype)
+    return reg
+
+
+@pytest.fixture(params=["numpy", "kernel"])
+def cnot_path(request, monkeypatch):
+    """Run with the NumPy path and with the kernel loop (uncompiled)"""
+    kernel = gates._apply_cnot_loop if request.param == "kernel" else None
+    monkeypatch.setattr(gates, "_apply_cnot_kernel", kernel)
+    return request.param
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_cnot_matches_kron_reference(n, cnot_path):
+    for control in range(n):
+        for target in range(n):
+            if control == target:
+                continue
+            reg = random_register(n, seed=n * 100 + control * 10 + target)
+            expected = cnot_matrix(n, control, target) @ reg.state_vector
+            gates.cnot(reg, control, target)
+            np.testing.assert_allclose(reg.state_vector, expected, atol=1e-6)
+
+
+def test_cnot_rejects_bad_qubits():
+    reg = QubitRegister(3)
+    with pytest.raises(ValueError):
+        gates.cnot(reg, 1, 1)
+    with pytest.raises(IndexError):
+        gates.cnot(reg, 0, 3)
+
+
+@pytest.mark.parametrize("control, targets", [
+    (0, [1, 2, 3]),
+    (2, [0, 4]),
+    (4, [3, 1, 0]),
+    (1, [3, 3, 2]),  # repeated target cancels
+    (1, []),
+])
+def test_cnot_fanout_matches_sequential_kron(control, targets, cnot_path):
+    n = 5
+    reg = random_register(n, seed=control)
+    expected = reg.state_vector.astype(np.complex128)
+    for target in targets:
+        expected = cnot_matrix(n, control, target) @ expected
+    gates.apply_cnot_fanout(reg, control, targets)
+    np.testing.assert_allclose(reg.state_vector, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("n", [2, 3, 5])
+def test_ghz_state_matches_kron_reference(n, cnot_path):
+    reg = QubitRegister(n)
+    gates.hadamard(reg, 0)
+    gates.apply_cnot_fanout(reg, 0, list(range(1, n)))
+
+    hadamard = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+    expected = np.zeros(2 ** n)
+    expected[0] = 1.0
+    expected = kron_all([hadamard] + [I2] * (n - 1)) @ expected
+    for target in range(1, n):
+        expected = cnot_matrix(n, 0, target) @ expected
+
+    np.testing.assert_allclose(reg.state_vector, expected, atol=1e-6)
+    assert abs(reg.state_vector[0]) == pytest.approx(2 ** -0.5, abs=1e-6)
+    assert abs(reg.state_vector[-1]) == pytest.approx(2 ** -0.5, abs=1e-6)
@@ -0,0 +1,88 @@
+"""
+Lexer regression tests
+
+data/syntax_demo.tokens.json is the token stream of examples/syntax_demo.qdl
+as produced by the original character-by-character lexer (with its number
+reader stopped before "..", the one documented grammar change).
+"""
+
+import json
+import os
+
+import pytest
+
+from compiler.lexer import Lexer, TokenType, tokenize_cached
+
+HERE = os.path.dirname(__file__)
+EXAMPLES = os.path.join(HERE, '..', 'examples')
+
+
+def stream(source):
+    """(type name, value, line, column) per token, numbers as int/float"""
+    out = []
+    for tok in Lexer(source).tokenize():
+        value = tok.as_number() if tok.type == TokenType.NUMBER else tok.value
+        out.append([TokenType.NAMES[tok.type], value, tok.line, tok.column])
+    return out
+
+
+def test_syntax_demo_matches_reference_stream():
+    with open(os.path.join(EXAMPLES, 'syntax_demo.qdl'), encoding='utf-8') as f:
+        source = f.read()
+    with open(os.path.join(HERE, 'data', 'syntax_demo.tokens.json'), encoding='utf-8') as f:
+        expected = json.load(f)
+
+    assert stream(source) == expected
+
+
+def test_bell_program_tokens():
+    source = (
+        "program bell:\n"
+        "    qubit q0\n"
+        "    H q0\n"
+        "    CNOT q0, q1  # entangle\n"
+        "    measure q0 -> c0\n"
+        "    print \"|1⟩!\"\n"
+        "end\n"
+    )
+    assert stream(source) == [
+        ['PROGRAM', 'program', 1, 1], ['IDENTIFIER', 'bell', 1, 9], ['COLON', ':', 1, 13],
+        ['NEWLINE', '\n', 1, 14],
+        ['QUBIT', 'qubit', 2, 5], ['IDENTIFIER', 'q0', 2, 11], ['NEWLINE', '\n', 2, 13],
+        ['H', 'H', 3, 5], ['IDENTIFIER', 'q0', 3, 7], ['NEWLINE', '\n', 3, 9],
+        ['CNOT', 'CNOT', 4, 5], ['IDENTIFIER', 'q0', 4, 10], ['COMMA', ',', 4, 12],
+        ['IDENTIFIER', 'q1', 4, 14], ['NEWLINE', '\n', 4, 28],
+        ['MEASURE', 'measure', 5, 5], ['IDENTIFIER', 'q0', 5, 13], ['ARROW', '->', 5, 16],
+        ['IDENTIFIER', 'c0', 5, 19], ['NEWLINE', '\n', 5, 21],
+        ['PRINT', 'print', 6, 5], ['STRING', '|1⟩!', 6, 11], ['NEWLINE', '\n', 6, 17],
+        ['END', 'end', 7, 1], ['NEWLINE', '\n', 7, 4],
+        ['EOF', None, 8, 1],
+    ]
+
+
+@pytest.mark.parametrize("source, expected", [
+    # Documented grammar change: the original lexer raised on "0..3"/"1.2.3"
+    ("0..3", [['NUMBER', 0, 1, 1], ['RANGE', '..', 1, 2], ['NUMBER', 3, 1, 4], ['EOF', None, 1, 5]]),
+    ("1.2.3", [['NUMBER', 1.2, 1, 1], ['DOT', '.', 1, 4], ['NUMBER', 3, 1, 5], ['EOF', None, 1, 6]]),
+    ("7.", [['NUMBER', 7.0, 1, 1], ['EOF', None, 1, 3]]),
+    ("π*2", [['NUMBER', 3.141592653589793, 1, 1], ['MULTIPLY', '*', 1, 2], ['NUMBER', 2, 1, 3],
+             ['EOF', None, 1, 4]]),
+    ("σ é", [['IDENTIFIER', 'σ', 1, 1], ['IDENTIFIER', 'é', 1, 3], ['EOF', None, 1, 4]]),
+    ("\t|+⟩ |01", [['QUANTUM_STATE', '|+⟩', 1, 2], ['QUANTUM_STATE', '|01⟩', 1, 6], ['EOF', None, 1, 9]]),
+    ("'a\nb' v", [['STRING', 'a\nb', 1, 1], ['IDENTIFIER', 'v', 2, 4], ['EOF', None, 2, 5]]),
+    ("v\0w", [['IDENTIFIER', 'v', 1, 1], ['EOF', None, 1, 2]]),
+])
+def test_edge_cases(source, expected):
+    assert stream(source) == expected
+
+
+def test_unknown_character_warns_and_is_skipped(capsys):
+    assert stream("a {b") == [['IDENTIFIER', 'a', 1, 1], ['IDENTIFIER', 'b', 1, 4], ['EOF', None, 1, 5]]
+    assert "Unknown character '{' at L1:C3" in capsys.readouterr().out
+
+
+def test_iter_tokens_and_cache_agree_with_tokenize():
+    source = "qureg q[3]\nfor i in 0..2:\n    H q[i]\nend\n"
+    tokens = Lexer(source).tokenize()
+    assert list(Lexer(source).iter_tokens()) == tokens
+    assert tokenize_cached(source) == tuple(tokens)
@@ -0,0 +1,70 @@
+"""
+QuantumNetworkManager / MessageQueue regression tests
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from distributed.network_manager import MessageQueue, QuantumNetworkManager
+
+
+def test_message_queue_fifo_and_sizes():
+    queue = MessageQueue()
+    assert queue.empty() and queue.qsize() == 0
+    for i in range(3):
+        queue.put_nowait(i)
+    assert not queue.empty() and queue.qsize() == 3
+    assert [queue.get_nowait() for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+def test_message_queue_get_waits_for_put():
+    async def scenario():
+        queue = MessageQueue()
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_nowait("a")
+        queue.put_nowait("b")
+        assert await asyncio.wait_for(getter, 1.0) == "a"
+        # Items already queued are returned without waiting
+        assert await asyncio.wait_for(queue.get(), 1.0) == "b"
+
+        # Drained queue blocks again (the ready flag must not stay set)
+        second = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        assert not second.done()
+        queue.put_nowait("c")
+        assert await asyncio.wait_for(second, 1.0) == "c"
+
+    asyncio.run(scenario())
+
+
+def test_message_queue_wakes_every_waiter():
+    async def scenario():
+        queue = MessageQueue()
+        getters = [asyncio.ensure_future(queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        for i in range(3):
+            queue.put_nowait(i)
+        return sorted(await asyncio.wait_for(asyncio.gather(*getters), 1.0))
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+
+
+def test_create_ghz_state_across_miners():
+    manager = QuantumNetworkManager()
+    for mid, qubits in (("a", 2), ("b", 1), ("c", 2)):
+        manager.register_miner(mid, qubits, ["bell_state"])
+
+    assert manager.create_ghz_state(["a", "b", "c"])
+
+    # First qubit of each miner: global qubits 0, 2 and 3 of 5
+    state = manager.global_register.state_vector
+    expected = np.zeros(32)
+    expected[0b00000] = expected[0b10110] = 2 ** -0.5
+    np.testing.assert_allclose(state, expected, atol=1e-6)
@@ -170,6 +170,17 @@ class ZQALLexer:
             self.col += 1
         return char
     
+    def _advance_to(self, end: int):
+        """Consume characters up to (not including) index end"""
+        chunk = self.source[self.pos:end]
+        newlines = chunk.count('\n')
+        if newlines:
+            self.line += newlines
+            self.col = len(chunk) - chunk.rfind('\n')
+        else:
+            self.col += len(chunk)
+        self.pos = end
+    
     def _skip_whitespace(self):
         """Skip whitespace"""
         while self._peek().isspace():
@@ -177,20 +188,16 @@ class ZQALLexer:
     
     def _skip_line_comment(self):
         """Skip // comment"""
-        while self._peek() not in ('', '\n'):
-            self._advance()
+        end = self.source.find('\n', self.pos)
+        self._advance_to(end if end != -1 else len(self.source))
     
     def _skip_block_comment(self):
         """Skip /* */ comment"""
         self._advance()  # /
         self._advance()  # *
-        while True:
-            if self._peek() == '' or (self._peek() == '*' and self._peek(1) == '/'):
-                break
-            self._advance()
-        if self._peek():
-            self._advance()  # *
-            self._advance()  # /
+        end = self.source.find('*/', self.pos)
+        # Unterminated comment runs to the end of the source
+        self._advance_to(end + 2 if end != -1 else len(self.source))
     
     def _next_token(self) -> Optional[Token]:
         """Get next token"""
@@ -245,25 +252,30 @@ class ZQALLexer:
     def _read_string(self, line: int, col: int) -> Token:
         """Read string literal"""
         self._advance()  # opening "
-        value = ""
-        while self._peek() and self._peek() != '"':
-            value += self._advance()
+        start = self.pos
+        end = self.source.find('"', start)
+        if end == -1:
+            end = len(self.source)
+        self._advance_to(end)
+        value = self.source[start:end]
         if self._peek() == '"':
             self._advance()  # closing "
         return Token(TokenType.STRING, value, line, col)
     
     def _read_number(self, line: int, col: int) -> Token:
         """Read number (int or float)"""
-        value = ""
+        start = self.pos
         while self._peek().isdigit() or self._peek() in ('_', '.'):
-            value += self._advance()
+            self._advance()
+        value = self.source[start:self.pos]
         return Token(TokenType.NUMBER, value.replace('_', ''), line, col)
     
     def _read_ident(self, line: int, col: int) -> Token:
         """Read identifier or keyword"""
-        value = ""
+        start = self.pos
         while self._peek().isalnum() or self._peek() == '_':
-            value += self._advance()
+            self._advance()
+        value = self.source[start:self.pos]
         
         # Check if keyword
         if value in self.KEYWORDS: